@@ -11,6 +11,7 @@ from django.contrib import admin
 from markdownx.admin import MarkdownxModelAdmin  # type: ignore[import-untyped]
 
 from apps.announcements.models import Announcement
+from apps.announcements.services import save_announcement
 
 
 @admin.register(Announcement)
@@ -30,3 +31,13 @@ class AnnouncementAdmin(MarkdownxModelAdmin):  # type: ignore[misc]
     readonly_fields = ("uuid", "created_at", "updated_at")
     ordering = ("-published_at", "-created_at")
     date_hierarchy = "published_at"
+
+    def save_model(  # noqa: PLR6301
+        self,
+        request: object,
+        obj: Announcement,
+        form: object,
+        change: object,
+    ) -> None:
+        """Save the announcement together with its rendered HTML."""
+        save_announcement(obj)
@@ -19,6 +19,7 @@ class AnnouncementDetailSerializer(serializers.ModelSerializer[Announcement]):
             "title",
             "slug",
             "content",
+            "content_html",
             "product_version",
             "created_at",
             "updated_at",
@@ -14,4 +14,12 @@ class AnnouncementsListSerializer(serializers.ModelSerializer[Announcement]):
 
     class Meta:
         model = Announcement
-        fields = ("uuid", "title", "slug", "content", "product_version", "published_at")
+        fields = (
+            "uuid",
+            "title",
+            "slug",
+            "content",
+            "content_html",
+            "product_version",
+            "published_at",
+        )
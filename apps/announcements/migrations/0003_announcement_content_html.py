@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 20:38
+
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from markdownx.utils import markdownify  # type: ignore[import-untyped]
+
+
+def render_html(apps: Apps, _schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Render existing announcements the way `save_announcement` does."""
+    Announcement = apps.get_model("announcements", "Announcement")
+    objects = list(Announcement.objects.all())
+    for obj in objects:
+        obj.content_html = markdownify(obj.content)
+    Announcement.objects.bulk_update(objects, ["content_html"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("announcements", "0002_remove_announcement_is_published_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="announcement",
+            name="content_html",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="Отрисовывается из содержания при сохранении",
+                verbose_name="Содержание (HTML)",
+            ),
+        ),
+        migrations.RunPython(render_html, migrations.RunPython.noop),
+    ]
@@ -19,6 +19,7 @@ class Announcement(models.Model):
         title (str): Headline of the announcement.
         slug (str): URL-friendly identifier, unique per announcement.
         content (str): Full Markdown-formatted body text.
+        content_html (str): `content` rendered to HTML by `save_announcement`.
         product_version (str): Optional product version tag (e.g. "1.2.0").
         published_at (datetime): Timestamp when the announcement will be published.
         created_at (datetime): Timestamp when the record was created.
@@ -44,6 +45,13 @@ class Announcement(models.Model):
 
     content = MarkdownxField("Содержание")
 
+    content_html = models.TextField(
+        "Содержание (HTML)",
+        blank=True,
+        editable=False,
+        help_text="Отрисовывается из содержания при сохранении",
+    )
+
     product_version = models.CharField(
         "Версия продукта",
         max_length=50,
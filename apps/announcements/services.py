@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Services for the announcements app."""
+
+from markdownx.utils import markdownify  # type: ignore[import-untyped]
+
+from apps.announcements.models import Announcement
+
+
+def save_announcement(announcement: Announcement) -> None:
+    """Render the Markdown content to `content_html` and persist the announcement.
+
+    All Announcement mutations must go through this function, so the API
+    serves stored HTML and never parses Markdown on a request.
+    """
+    announcement.content_html = markdownify(announcement.content)
+    announcement.save()
@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for announcements services."""
+
+import pytest
+from django.contrib.admin.sites import AdminSite
+
+from apps.announcements.admin import AnnouncementAdmin
+from apps.announcements.models import Announcement
+from apps.announcements.services import save_announcement
+from apps.announcements.tests.factories import AnnouncementFactory
+
+
+@pytest.mark.django_db
+def test_save_announcement_renders_content_html() -> None:
+    announcement = AnnouncementFactory.create()
+    announcement.content = "# Новое\n\nТекст"
+
+    save_announcement(announcement)
+
+    announcement.refresh_from_db()
+    assert announcement.content_html == "<h1>Новое</h1>\n<p>Текст</p>"
+
+
+@pytest.mark.django_db
+def test_announcement_admin_save_model_renders_content_html() -> None:
+    announcement = AnnouncementFactory.build(content="*важно*")
+
+    AnnouncementAdmin(Announcement, AdminSite()).save_model(
+        request=object(), obj=announcement, form=object(), change=False
+    )
+
+    announcement.refresh_from_db()
+    assert announcement.content_html == "<p><em>важно</em></p>"
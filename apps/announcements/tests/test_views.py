@@ -33,6 +33,7 @@ def test_announcements_list_returns_published(api_client: APIClient) -> None:
     announcement = AnnouncementFactory.create(
         title="Test Announcement",
         content="Test content",
+        content_html="<p>Test content</p>",
         published_at=timezone.now() - timedelta(minutes=1),
     )
 
@@ -42,6 +43,7 @@ def test_announcements_list_returns_published(api_client: APIClient) -> None:
     assert len(response.data["results"]) == 1
     assert response.data["results"][0]["title"] == "Test Announcement"
     assert response.data["results"][0]["content"] == "Test content"
+    assert response.data["results"][0]["content_html"] == "<p>Test content</p>"
     assert response.data["results"][0]["uuid"] == str(announcement.uuid)
 
 
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Serializer for chord diagram query parameters."""
+
+from rest_framework import serializers
+
+from apps.chords.constants import (
+    DIAGRAM_MAX_SCALE,
+    DIAGRAM_MIN_SCALE,
+    DiagramOrientationChoice,
+    DiagramThemeChoice,
+)
+
+
+class ChordDiagramParamsSerializer(serializers.Serializer[None]):
+    """Deserialize and validate chord diagram query parameters."""
+
+    orientation = serializers.ChoiceField(
+        choices=DiagramOrientationChoice.choices,
+        default=DiagramOrientationChoice.VERTICAL,
+    )
+    theme = serializers.ChoiceField(
+        choices=DiagramThemeChoice.choices,
+        default=DiagramThemeChoice.DEFAULT,
+    )
+    scale = serializers.FloatField(
+        min_value=DIAGRAM_MIN_SCALE,
+        max_value=DIAGRAM_MAX_SCALE,
+        default=1,
+    )
+    v = serializers.CharField(
+        default="",
+        allow_blank=True,
+        help_text="`diagram_version` of the chord; makes the response immutable.",
+    )
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Serializers for the reverse chord lookup."""
+
+from typing import Any
+
+from rest_framework import serializers
+
+from apps.chords.constants import (
+    FINGERING_MUTED,
+    FINGERING_WILDCARD,
+    MAX_FRET,
+    MAX_STRING_NUMBER,
+)
+
+
+class ChordLookupParamsSerializer(serializers.Serializer[None]):
+    """Deserialize and validate chord lookup query parameters."""
+
+    frets = serializers.CharField(
+        help_text="Six frets from the 6th string to the 1st, as `x02210` or "
+        "`x,0,2,2,1,0` (needed for frets above 9): a number, `x` for a muted "
+        "string or `*` for any.",
+    )
+    tolerance = serializers.IntegerField(
+        min_value=0,
+        max_value=MAX_FRET,
+        default=0,
+        help_text="Also match the same grip moved up to this many frets.",
+    )
+
+    def validate_frets(self, value: str) -> list[int | None]:  # noqa: PLR6301
+        """Parse the frets into numbers, -1 for muted and None for any."""
+        tokens = value.split(",") if "," in value else list(value)
+        if len(tokens) != MAX_STRING_NUMBER:
+            raise serializers.ValidationError(
+                f"Expected {MAX_STRING_NUMBER} frets, got {len(tokens)}."
+            )
+        frets: list[int | None] = []
+        for token in (t.strip().lower() for t in tokens):
+            if token == FINGERING_WILDCARD:
+                frets.append(None)
+            elif token == FINGERING_MUTED:
+                frets.append(-1)
+            elif token.isdigit() and int(token) <= MAX_FRET:
+                frets.append(int(token))
+            else:
+                raise serializers.ValidationError(
+                    f"Invalid fret {token!r}: expected 0-{MAX_FRET}, "
+                    f"{FINGERING_MUTED!r} or {FINGERING_WILDCARD!r}."
+                )
+        return frets
+
+
+class ChordMatchSerializer(serializers.Serializer[Any]):
+    """A chord found by fingering."""
+
+    id = serializers.IntegerField(source="chord_id")
+    title = serializers.CharField()
+    musical_title = serializers.CharField()
+    frets = serializers.ListField(
+        child=serializers.IntegerField(),
+        help_text="Sounded frets from the 6th string to the 1st; -1 is muted.",
+    )
+    shift = serializers.IntegerField(
+        help_text="Frets the chord lies above the query (negative: below)."
+    )
@@ -7,6 +7,7 @@
 from rest_framework import serializers
 
 from apps.chords.models import Chord
+from apps.chords.services import chord_diagram_version
 
 from .chord_position_serializer import ChordPositionSerializer
 
@@ -15,6 +16,13 @@ class ChordsListSerializer(serializers.ModelSerializer[Chord]):
     """Serializer for chords list."""
 
     positions = ChordPositionSerializer(many=True, read_only=True)
+    diagram_version = serializers.SerializerMethodField(
+        help_text="Pass as `v` to the diagram endpoint for an immutable response."
+    )
+
+    def get_diagram_version(self, obj: Chord) -> str:  # noqa: PLR6301
+        """Return the version token of the chord's diagrams."""
+        return chord_diagram_version(obj)
 
     class Meta:
         model = Chord
@@ -25,4 +33,5 @@ class ChordsListSerializer(serializers.ModelSerializer[Chord]):
             "positions",
             "svg_horizontal",
             "svg_vertical",
+            "diagram_version",
         )
@@ -6,9 +6,22 @@
 
 from django.urls import path
 
-from .views import ChordDetailView, ChordsListView
+from .views import (
+    ChordDetailView,
+    ChordDiagramView,
+    ChordLookupView,
+    ChordsListView,
+    ChordSpriteView,
+)
 
 urlpatterns = [
     path("chords/", ChordsListView.as_view(), name="chords-list"),
+    path("chords/lookup/", ChordLookupView.as_view(), name="chord-lookup"),
+    path("chords/sprite.svg", ChordSpriteView.as_view(), name="chord-sprite"),
     path("chords/<int:pk>/", ChordDetailView.as_view(), name="chord-detail"),
+    path(
+        "chords/<int:pk>/diagram.svg",
+        ChordDiagramView.as_view(),
+        name="chord-diagram",
+    ),
 ]
@@ -5,16 +5,33 @@
 """Views for the chords app."""
 
 import logging
+from collections.abc import Callable
 
 from django.db.models import QuerySet
-from django.http import Http404
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from apps.chords.constants import SVG_MAX_AGE, SVG_RENDERER_VERSION
+from apps.chords.fingering_index import find_chords
 from apps.chords.models import Chord
 from apps.chords.selectors import get_all_chords, get_chord_by_id
+from apps.chords.services import chord_diagram_version
+from apps.chords.sprite import get_chord_sprite
+from apps.chords.svg_renderer import render_chord_diagram
+from apps.sync.utils import is_not_modified, make_etag
 
 from .serializers.chord_detail_serializer import ChordDetailSerializer
+from .serializers.chord_diagram_params_serializer import ChordDiagramParamsSerializer
+from .serializers.chord_lookup_serializer import (
+    ChordLookupParamsSerializer,
+    ChordMatchSerializer,
+)
 from .serializers.chords_list_serializer import ChordsListSerializer
 
 logger = logging.getLogger("chords")
@@ -47,3 +64,135 @@ class ChordDetailView(RetrieveAPIView[Chord]):
             raise Http404
         logger.debug("Fetched chord: id=%s, title=%s", chord_id, chord.title)
         return chord
+
+
+@extend_schema(
+    parameters=[ChordLookupParamsSerializer],
+    responses=ChordMatchSerializer(many=True),
+)
+class ChordLookupView(APIView):
+    """Identify chords by fingering.
+
+    Answers from the in-memory fingering index (see
+    `apps.chords.fingering_index`), so lookups never scan chord positions.
+    Matches are ordered by distance from the queried frets, then by title.
+    """
+
+    permission_classes = (AllowAny,)
+
+    def get(self, request: Request) -> Response:  # noqa: PLR6301
+        """Return the chords matching the queried frets."""
+        serializer = ChordLookupParamsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        matches = find_chords(params["frets"], params["tolerance"])
+        logger.debug(
+            "Chord lookup: frets=%s, matches=%s", params["frets"], len(matches)
+        )
+        return Response(ChordMatchSerializer(matches, many=True).data)
+
+
+@extend_schema(
+    parameters=[ChordDiagramParamsSerializer],
+    responses={(200, "image/svg+xml"): OpenApiTypes.STR},
+)
+class ChordDiagramView(APIView):
+    """Render one chord diagram as a standalone SVG.
+
+    Orientation, theme and scale come from the query string. Responses
+    carry a strong ETag of the chord content, the renderer version and the
+    parameters. A request whose `v` equals the chord's `diagram_version`
+    names one rendering forever, so it is marked immutable and a CDN may
+    serve it for a year; without `v` (or with a stale one) caches must
+    revalidate.
+    """
+
+    permission_classes = (AllowAny,)
+
+    def get(self, request: Request, pk: int) -> HttpResponse:  # noqa: PLR6301
+        """Return the diagram, or 304 if the client's copy is current."""
+        serializer = ChordDiagramParamsSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        chord = get_chord_by_id(pk)
+        if chord is None:
+            logger.warning("Chord not found: id=%s", pk)
+            raise Http404
+
+        etag = make_etag(
+            chord.content_hash,
+            SVG_RENDERER_VERSION,
+            params["orientation"],
+            params["theme"],
+            params["scale"],
+        )
+        return _svg_response(
+            request,
+            etag,
+            immutable=params["v"] == chord_diagram_version(chord),
+            render=lambda: render_chord_diagram(
+                chord, params["orientation"], params["theme"], params["scale"]
+            ),
+        )
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="v",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description="Sprite version from the sync payload's `chord_sprite`; "
+            "makes the response immutable.",
+            required=False,
+        )
+    ],
+    responses={(200, "image/svg+xml"): OpenApiTypes.STR},
+)
+class ChordSpriteView(APIView):
+    """All chord diagrams as one SVG sprite for offline clients.
+
+    Each chord is a `<symbol>` per orientation, named as in
+    `sprite_symbol_ids`. Sync payloads of `format_version=4` reference those
+    ids instead of embedding markup and carry the sprite version in
+    `chord_sprite`; requested with that version as `v`, the sprite is
+    immutable.
+    """
+
+    permission_classes = (AllowAny,)
+
+    def get(self, request: Request) -> HttpResponse:  # noqa: PLR6301
+        """Return the sprite, or 304 if the client's copy is current."""
+        sprite = get_chord_sprite()
+        return _svg_response(
+            request,
+            make_etag("chord-sprite", sprite.version),
+            immutable=request.query_params.get("v") == sprite.version,
+            render=lambda: sprite.svg,
+        )
+
+
+def _svg_response(
+    request: Request,
+    etag: str,
+    *,
+    immutable: bool,
+    render: Callable[[], str | bytes],
+) -> HttpResponse:
+    """Answer with the SVG from `render`, or 304 if the client holds `etag`.
+
+    Immutable responses may be cached for `SVG_MAX_AGE`, others must be
+    revalidated.
+    """
+    response: HttpResponse
+    if is_not_modified(request, etag):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(render(), content_type="image/svg+xml")
+    response["ETag"] = etag
+    response["Cache-Control"] = (
+        f"public, max-age={SVG_MAX_AGE}, immutable" if immutable else "no-cache"
+    )
+    return response
@@ -6,6 +6,8 @@
 
 from typing import Final
 
+from django.db import models
+
 MIN_STRING_NUMBER: Final[int] = 1
 """Minimum guitar string number (1-indexed)."""
 
@@ -23,3 +25,52 @@ MIN_FINGER: Final[int] = 0
 
 MAX_FINGER: Final[int] = 4
 """Maximum finger value (1-4 for fingers, 0 for open)."""
+
+SVG_RENDERER_VERSION: Final[int] = 2
+"""Bump when `svg_renderer` output changes; incremental regeneration re-renders all."""
+
+SVG_BATCH_SIZE: Final[int] = 500
+"""Chords rendered and written per `bulk_update` when regenerating SVGs."""
+
+SVG_CACHE_SIZE: Final[int] = 2048
+"""Distinct fingerings whose rendered diagrams are kept in memory per process."""
+
+DIAGRAM_MIN_SCALE: Final[float] = 0.25
+"""Smallest scale accepted by the chord diagram endpoint."""
+
+DIAGRAM_MAX_SCALE: Final[float] = 8
+"""Largest scale accepted by the chord diagram endpoint."""
+
+SVG_MAX_AGE: Final[int] = 365 * 24 * 60 * 60
+"""Cache lifetime in seconds of a chord diagram or sprite requested by version."""
+
+SPRITE_CACHE_KEY: Final[str] = "chords:sprite"
+"""Cache key of the last built chord sprite (see `apps.chords.sprite`)."""
+
+FINGERING_INDEX_TTL: Final[float] = 60
+"""Seconds a process keeps its chord fingering index before rebuilding it.
+
+Edits through `ChordService` rebuild the index of the editing process at
+once; other workers pick them up within this time.
+"""
+
+FINGERING_MUTED: Final[str] = "x"
+"""Fret token of a muted string in chord lookup queries."""
+
+FINGERING_WILDCARD: Final[str] = "*"
+"""Fret token matching any fret, open or muted, in chord lookup queries."""
+
+
+class DiagramOrientationChoice(models.TextChoices):
+    """Orientation of a chord diagram."""
+
+    VERTICAL = "vertical", "Вертикальный"
+    HORIZONTAL = "horizontal", "Горизонтальный"
+
+
+class DiagramThemeChoice(models.TextChoices):
+    """Colour scheme of a chord diagram."""
+
+    DEFAULT = "default", "Цветная"
+    DARK = "dark", "Тёмная"
+    MONO = "mono", "Монохромная"
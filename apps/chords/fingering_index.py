@@ -0,0 +1,181 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Reverse chord lookup: find chords by the frets they sound.
+
+A fingering is six frets from the 6th (low) string to the 1st, as in
+tablature: -1 for a muted string, otherwise the fret actually sounded, so
+strings under a barre count as the barre fret.
+
+The index keeps every chord in memory twice: in a map from its exact
+fingering, and in buckets keyed by its shape — the fingering moved down
+until its lowest sounded fret is 0. Chords sharing a shape are the same
+grip played higher or lower on the neck, which answers lookups with a
+transposition tolerance. Queries with wildcards use buckets of the
+fingering projected onto the given strings, built the first time a
+combination of wildcard strings is asked for.
+
+Each process builds its index lazily from `get_all_chords()`. Mutations
+through `ChordService` drop it on commit; other workers rebuild after
+`FINGERING_INDEX_TTL`.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+from .constants import FINGERING_INDEX_TTL, MAX_STRING_NUMBER
+from .models import Chord
+from .selectors import get_all_chords
+
+logger = logging.getLogger("chords")
+
+type Frets = tuple[int, ...]
+"""Six frets from the 6th string to the 1st; -1 is muted."""
+
+type Query = Sequence[int | None]
+"""Six frets of a lookup; None matches any fret."""
+
+type _Shape = tuple[int, ...]
+type _Buckets = dict[_Shape, list[tuple[int, "ChordMatch"]]]
+
+_MUTED = -1
+
+
+class ChordMatch(NamedTuple):
+    """A chord found by fingering.
+
+    Attributes:
+        chord_id: Primary key of the chord.
+        title: Title of the chord.
+        musical_title: Musical title of the chord.
+        frets: Fingering of the chord.
+        shift: Frets the chord lies above the query (negative: below).
+    """
+
+    chord_id: int
+    title: str
+    musical_title: str
+    frets: Frets
+    shift: int
+
+
+def chord_frets(chord: Chord) -> Frets:
+    """Return the sounded frets of `chord`, using its prefetched positions.
+
+    Strings without a position count as muted.
+    """
+    frets = [_MUTED] * MAX_STRING_NUMBER
+    for position in chord.positions.all():
+        fret = position.fret
+        if fret == 0 and chord.has_barre:
+            fret = chord.start_fret
+        frets[MAX_STRING_NUMBER - position.string_number] = fret
+    return tuple(frets)
+
+
+class FingeringIndex:
+    """Immutable snapshot of chords searchable by fingering."""
+
+    def __init__(self, chords: Iterable[Chord]) -> None:
+        """Index `chords`, whose positions must be prefetched."""
+        self._entries = [
+            ChordMatch(
+                chord.pk, chord.title, chord.musical_title, chord_frets(chord), 0
+            )
+            for chord in chords
+        ]
+        self._signatures: dict[Frets, list[ChordMatch]] = defaultdict(list)
+        for entry in self._entries:
+            self._signatures[entry.frets].append(entry)
+        self._buckets: dict[int, _Buckets] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of indexed chords."""
+        return len(self._entries)
+
+    def lookup(self, query: Query, tolerance: int = 0) -> list[ChordMatch]:
+        """Return chords matching `query`, moved by at most `tolerance` frets.
+
+        Muted strings only match muted strings; a None (wildcard) string
+        matches anything. Matches are ordered by distance from the query,
+        then by chord title.
+
+        Raises:
+            ValueError: If `query` does not have one fret per string.
+        """
+        if len(query) != MAX_STRING_NUMBER:
+            raise ValueError("Fingering must have exactly 6 frets")
+
+        mask = sum(1 << i for i, fret in enumerate(query) if fret is None)
+        given = tuple(fret for fret in query if fret is not None)
+        if not mask and not tolerance:
+            return list(self._signatures.get(given, ()))
+
+        shape, base = _shape(given)
+        matches = [
+            entry._replace(shift=entry_base - base)
+            for entry_base, entry in self._bucket(mask).get(shape, ())
+            if abs(entry_base - base) <= tolerance
+        ]
+        matches.sort(key=lambda match: abs(match.shift))
+        return matches
+
+    def _bucket(self, mask: int) -> _Buckets:
+        """Return the shape buckets for queries with wildcards at `mask`."""
+        buckets = self._buckets.get(mask)
+        if buckets is not None:
+            return buckets
+        with self._lock:
+            if mask not in self._buckets:
+                grouped: _Buckets = defaultdict(list)
+                for entry in self._entries:
+                    shape, base = _shape(_project(entry.frets, mask))
+                    grouped[shape].append((base, entry))
+                self._buckets[mask] = dict(grouped)
+            return self._buckets[mask]
+
+
+_lock = threading.Lock()
+_index: FingeringIndex | None = None
+_built_at = 0.0
+
+
+def get_fingering_index() -> FingeringIndex:
+    """Return this process's index, building it if dropped or expired."""
+    global _index, _built_at  # noqa: PLW0603
+    with _lock:
+        expired = time.monotonic() - _built_at > FINGERING_INDEX_TTL
+        if _index is None or expired:
+            _index = FingeringIndex(get_all_chords())
+            _built_at = time.monotonic()
+            logger.debug("Built chord fingering index: chords=%s", len(_index))
+        return _index
+
+
+def invalidate_fingering_index() -> None:
+    """Drop this process's index; the next lookup rebuilds it."""
+    global _index  # noqa: PLW0603
+    with _lock:
+        _index = None
+
+
+def find_chords(query: Query, tolerance: int = 0) -> list[ChordMatch]:
+    """Return chords matching `query` (see `FingeringIndex.lookup`)."""
+    return get_fingering_index().lookup(query, tolerance)
+
+
+def _project(frets: Frets, mask: int) -> Frets:
+    """Drop the frets of the strings set in `mask`."""
+    return tuple(fret for i, fret in enumerate(frets) if not mask & 1 << i)
+
+
+def _shape(frets: Frets) -> tuple[_Shape, int]:
+    """Return `frets` moved down to start at fret 0, and the lowest fret."""
+    base = min((fret for fret in frets if fret != _MUTED), default=0)
+    return tuple(fret if fret == _MUTED else fret - base for fret in frets), base
@@ -4,6 +4,8 @@
 
 """Management command to regenerate SVG diagrams for all chords."""
 
+from argparse import ArgumentParser
+
 from django.core.management.base import BaseCommand
 
 from apps.chords.services import ChordService
@@ -14,7 +16,24 @@ class Command(BaseCommand):
 
     help = "Regenerate svg_horizontal and svg_vertical for every Chord in the database."
 
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: PLR6301
+        """Add --incremental and --workers."""
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only render chords whose positions or renderer version changed.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help="Render in this many processes (default: 0, in this process).",
+        )
+
     def handle(self, *args: object, **options: object) -> None:
         """Iterate all chords and regenerate their SVG fields."""
-        updated = ChordService.bulk_regenerate_svgs()
+        updated = ChordService.bulk_regenerate_svgs(
+            incremental=bool(options["incremental"]),
+            workers=int(options["workers"]),  # type: ignore[call-overload]
+        )
         self.stdout.write(self.style.SUCCESS(f"Updated {updated} chord(s)."))
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 20:02
+
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+from apps.shared.hashing import content_hash
+
+
+def fill_hashes(apps: Apps, _schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Hash existing chords the way `chord_content_hash` does."""
+    Chord = apps.get_model("chords", "Chord")
+    chords = list(Chord.objects.all())
+    for chord in chords:
+        chord.content_hash = content_hash(
+            chord.title,
+            chord.musical_title,
+            chord.order_in_note,
+            chord.start_fret,
+            chord.has_barre,
+            chord.svg_horizontal,
+            chord.svg_vertical,
+        )
+    Chord.objects.bulk_update(chords, ["content_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chords", "0003_svg_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chord",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Меняется вместе с данными аккорда, которые получает клиент",
+                max_length=16,
+                verbose_name="Хеш содержимого",
+            ),
+        ),
+        migrations.RunPython(fill_hashes, migrations.RunPython.noop),
+    ]
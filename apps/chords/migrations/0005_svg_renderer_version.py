@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 20:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chords", "0004_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chord",
+            name="svg_input_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Меняется вместе с данными, из которых рисуются SVG",
+                max_length=16,
+                verbose_name="Хеш данных для SVG",
+            ),
+        ),
+        migrations.AddField(
+            model_name="chord",
+            name="svg_renderer_version",
+            field=models.PositiveSmallIntegerField(
+                default=0, editable=False, verbose_name="Версия отрисовщика SVG"
+            ),
+        ),
+    ]
@@ -17,6 +17,7 @@ from apps.chords.constants import (
     MIN_FRET,
     MIN_STRING_NUMBER,
 )
+from apps.shared.hashing import CONTENT_HASH_LENGTH
 
 
 class Chord(models.Model):
@@ -28,6 +29,10 @@ class Chord(models.Model):
         order_in_note (int): Order of display for variations of the same chord.
         start_fret (int): The fret number where the chord diagram starts.
         has_barre (bool): Indicates if the chord requires a barre technique.
+        content_hash (str): Hash of the synced fields, see `chord_content_hash`.
+        svg_renderer_version (int): `SVG_RENDERER_VERSION` the SVGs were made by.
+        svg_input_hash (str): Hash of the renderer input, see
+            `chord_svg_input_hash`.
     """
 
     title = models.CharField("Название", max_length=50)
@@ -37,6 +42,25 @@ class Chord(models.Model):
     has_barre = models.BooleanField("Есть барре?", default=False)
     svg_horizontal = models.TextField("SVG горизонтальный", blank=True, default="")
     svg_vertical = models.TextField("SVG вертикальный", blank=True, default="")
+    content_hash = models.CharField(
+        "Хеш содержимого",
+        max_length=CONTENT_HASH_LENGTH,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Меняется вместе с данными аккорда, которые получает клиент",
+    )
+    svg_renderer_version = models.PositiveSmallIntegerField(
+        "Версия отрисовщика SVG", default=0, editable=False
+    )
+    svg_input_hash = models.CharField(
+        "Хеш данных для SVG",
+        max_length=CONTENT_HASH_LENGTH,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Меняется вместе с данными, из которых рисуются SVG",
+    )
 
     def __str__(self) -> str:
         return self.title if not self.has_barre else f"{self.title} bare"
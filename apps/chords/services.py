@@ -4,15 +4,68 @@
 
 """Services for the chords app."""
 
+import multiprocessing
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import batched
 from typing import Any, TypedDict
 
 from django.db import transaction
 
-from .constants import MAX_STRING_NUMBER
+from apps.shared.hashing import content_hash
+from apps.sync.services import bump_content_clock
+
+from .constants import MAX_STRING_NUMBER, SVG_BATCH_SIZE, SVG_RENDERER_VERSION
+from .fingering_index import invalidate_fingering_index
 from .models import Chord, ChordPosition
 from .selectors import get_all_chords
 from .svg_renderer import render_chord_svg
 
+_RENDERED_FIELDS = [
+    "svg_horizontal",
+    "svg_vertical",
+    "content_hash",
+    "svg_renderer_version",
+    "svg_input_hash",
+]
+
+
+def chord_content_hash(chord: Chord) -> str:
+    """Return the hash of everything the sync payload carries for `chord`.
+
+    The SVGs are derived from the positions, so they stand in for them.
+    """
+    return content_hash(
+        chord.title,
+        chord.musical_title,
+        chord.order_in_note,
+        chord.start_fret,
+        chord.has_barre,
+        chord.svg_horizontal,
+        chord.svg_vertical,
+    )
+
+
+def chord_diagram_version(chord: Chord) -> str:
+    """Return the `v` token of the current diagrams of `chord`.
+
+    Covers the chord content and `SVG_RENDERER_VERSION`, so a renderer
+    change gives diagram URLs a new token instead of new bytes at old URLs.
+    """
+    return content_hash(chord.content_hash, SVG_RENDERER_VERSION)
+
+
+def chord_svg_input_hash(chord: Chord) -> str:
+    """Return the hash of everything `render_chord_svg` reads from `chord`.
+
+    Uses the prefetched positions when present.
+    """
+    positions = sorted(
+        (p.string_number, p.fret, p.finger) for p in chord.positions.all()
+    )
+    return content_hash(chord.title, chord.start_fret, chord.has_barre, positions)
+
 
 class ChordPositionCreateDict(TypedDict):
     """Describe fields for a chord positions when creating."""
@@ -67,8 +120,9 @@ class ChordService:
 
         chord = Chord.objects.create(**chord_fields)
         ChordService._replace_positions(chord, positions)
-        chord.svg_horizontal, chord.svg_vertical = render_chord_svg(chord)
-        chord.save(update_fields=["svg_horizontal", "svg_vertical"])
+        ChordService._render(chord)
+        chord.save(update_fields=_RENDERED_FIELDS)
+        transaction.on_commit(invalidate_fingering_index)
         return chord
 
     @staticmethod
@@ -98,24 +152,57 @@ class ChordService:
         if positions_data is not None:
             ChordService._replace_positions(chord, positions_data)
 
-        chord.svg_horizontal, chord.svg_vertical = render_chord_svg(chord)
-        chord.save(update_fields=["svg_horizontal", "svg_vertical"])
+        ChordService._render(chord)
+        chord.save(update_fields=_RENDERED_FIELDS)
+        transaction.on_commit(invalidate_fingering_index)
         return chord
 
     @staticmethod
     def regenerate_svg(*, chord: Chord) -> None:
-        """Regenerate SVG fields for an existing chord."""
-        chord.svg_horizontal, chord.svg_vertical = render_chord_svg(chord)
-        chord.save(update_fields=["svg_horizontal", "svg_vertical"])
+        """Regenerate SVG fields and the content hash for an existing chord.
+
+        The admin calls this after saving positions, so it also drops the
+        fingering index.
+        """
+        ChordService._render(chord)
+        chord.save(update_fields=_RENDERED_FIELDS)
+        transaction.on_commit(invalidate_fingering_index)
 
     @staticmethod
-    def bulk_regenerate_svgs() -> int:
-        """Regenerate SVG fields for all chords. Returns count of updated chords."""
-        chords = list(get_all_chords())
-        for chord in chords:
-            chord.svg_horizontal, chord.svg_vertical = render_chord_svg(chord)
-        Chord.objects.bulk_update(chords, ["svg_horizontal", "svg_vertical"])
-        return len(chords)
+    def bulk_regenerate_svgs(*, incremental: bool = False, workers: int = 0) -> int:
+        """Regenerate SVG fields of chords in batches of `SVG_BATCH_SIZE`.
+
+        Args:
+            incremental: Only render chords whose renderer input or
+                `SVG_RENDERER_VERSION` changed since they were last rendered.
+            workers: Render in a pool of this many processes; 0 renders in
+                this process.
+
+        Returns:
+            int: Number of updated chords.
+        """
+        updated = 0
+        with _render_pool(workers) as render:
+            chords = get_all_chords().iterator(chunk_size=SVG_BATCH_SIZE)
+            for batch in batched(chords, SVG_BATCH_SIZE, strict=False):
+                stale = [
+                    (chord, chord_svg_input_hash(chord))
+                    for chord in batch
+                    if not incremental or ChordService._is_stale(chord)
+                ]
+                svgs = render(render_chord_svg, [chord for chord, _ in stale])
+                for (chord, input_hash), (horizontal, vertical) in zip(
+                    stale, svgs, strict=True
+                ):
+                    chord.svg_horizontal, chord.svg_vertical = horizontal, vertical
+                    chord.content_hash = chord_content_hash(chord)
+                    chord.svg_renderer_version = SVG_RENDERER_VERSION
+                    chord.svg_input_hash = input_hash
+                Chord.objects.bulk_update([c for c, _ in stale], _RENDERED_FIELDS)
+                updated += len(stale)
+        if updated:
+            bump_content_clock()
+        return updated
 
     @staticmethod
     def delete_chord(*, chord: Chord) -> None:
@@ -126,6 +213,23 @@ class ChordService:
         """
         if chord.pk is not None:
             chord.delete()
+            transaction.on_commit(invalidate_fingering_index)
+
+    @staticmethod
+    def _render(chord: Chord) -> None:
+        """Render the chord SVGs and refresh the content hash (without saving)."""
+        chord.svg_horizontal, chord.svg_vertical = render_chord_svg(chord)
+        chord.content_hash = chord_content_hash(chord)
+        chord.svg_renderer_version = SVG_RENDERER_VERSION
+        chord.svg_input_hash = chord_svg_input_hash(chord)
+
+    @staticmethod
+    def _is_stale(chord: Chord) -> bool:
+        """Return whether the stored SVGs of `chord` are out of date."""
+        return (
+            chord.svg_renderer_version != SVG_RENDERER_VERSION
+            or chord.svg_input_hash != chord_svg_input_hash(chord)
+        )
 
     @staticmethod
     def _replace_positions(
@@ -141,3 +245,24 @@ class ChordService:
         chord.positions.all().delete()
         positions = [ChordPosition(chord=chord, **pos) for pos in positions_data]
         ChordPosition.objects.bulk_create(positions)
+
+
+type _Render = Callable[
+    [Callable[[Chord], tuple[str, str]], list[Chord]], list[tuple[str, str]]
+]
+
+
+@contextmanager
+def _render_pool(workers: int) -> Iterator[_Render]:
+    """Yield a `map` that renders chords in `workers` processes, or inline.
+
+    Chords are pickled with their prefetched positions, so the children
+    never touch the database.
+    """
+    if workers <= 0:
+        yield lambda render, chords: [render(chord) for chord in chords]
+        return
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork")
+    ) as pool:
+        yield lambda render, chords: list(pool.map(render, chords, chunksize=32))
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Chord sprite: every chord diagram packed into one SVG document.
+
+Each chord contributes a `<symbol>` per orientation (see
+`sprite_symbol_ids`), so offline clients fetch all diagrams once and draw
+them with `<use href="sprite.svg#chord-12-v"/>` instead of receiving the
+markup inside the sync JSON. Finger markers, which every diagram defines
+identically, are hoisted into a single `<defs>`.
+
+Symbols are rendered from the chords' positions rather than copied from
+the stored SVGs, so every chord is in the sprite whatever renderer its
+stored diagrams came from. The sprite version is a hash of the renderer
+version and the chords' ids and content hashes, so any chord edit or
+renderer change yields a new version. The built sprite is cached per
+version.
+"""
+
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from django.core.cache import cache
+
+from apps.shared.hashing import content_hash
+
+from .constants import SPRITE_CACHE_KEY, SVG_RENDERER_VERSION
+from .models import Chord
+from .svg_renderer import render_chord_symbols
+
+
+class ChordSprite(NamedTuple):
+    """A built sprite and the version it was built for."""
+
+    version: str
+    svg: bytes
+
+
+def sprite_symbol_ids(chord_id: int) -> tuple[str, str]:
+    """Return the ids of the horizontal and vertical symbols of a chord."""
+    return f"chord-{chord_id}-h", f"chord-{chord_id}-v"
+
+
+def get_chord_sprite_version() -> str:
+    """Return the version of the sprite of the current chords."""
+    return _version(Chord.objects.order_by("pk").values_list("pk", "content_hash"))
+
+
+def get_chord_sprite() -> ChordSprite:
+    """Return the sprite of the current chords, building it on a version change."""
+    version = get_chord_sprite_version()
+    sprite: ChordSprite | None = cache.get(SPRITE_CACHE_KEY)
+    if sprite is None or sprite.version != version:
+        sprite = build_chord_sprite()
+        cache.set(SPRITE_CACHE_KEY, sprite, timeout=None)
+    return sprite
+
+
+def build_chord_sprite() -> ChordSprite:
+    """Render the diagrams of all chords into one sprite."""
+    chords = list(Chord.objects.order_by("pk").prefetch_related("positions"))
+    definitions: dict[str, str] = {}
+    symbols: list[str] = []
+    for chord in chords:
+        rendered = render_chord_symbols(chord, sprite_symbol_ids(chord.pk))
+        definitions.update(rendered.defs)
+        symbols.extend(rendered.symbols)
+
+    svg = "\n".join([
+        '<svg xmlns="http://www.w3.org/2000/svg">',
+        f"<defs>{''.join(definitions.values())}</defs>",
+        *symbols,
+        "</svg>",
+    ])
+    version = _version((chord.pk, chord.content_hash) for chord in chords)
+    return ChordSprite(version, svg.encode())
+
+
+def _version(rows: Iterable[tuple[int, str]]) -> str:
+    """Hash the renderer version and `(pk, content_hash)` rows into a version."""
+    return content_hash(SVG_RENDERER_VERSION, [list(row) for row in rows])
@@ -2,20 +2,41 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-"""SVG renderer for chord diagrams."""
+"""SVG renderer for chord diagrams.
 
-import html
+The output is kept compact: the string and fret grid is merged into one
+path per stroke width, labels inherit shared attributes from a group, and
+all coordinates are integers. Finger markers are emitted once in `<defs>`
+and placed with `<use>`. Their ids depend only on the marker, so diagrams
+inlined side by side into one page may share them.
+
+Many chords share a fingering and differ only in title. Rendered diagrams
+are therefore kept per `Fingering` in a bounded LRU with a slot in place of
+the title, which is the only part spliced in per chord. The cached parts
+also build the `<symbol>`s of the chord sprite (`render_chord_symbols`).
+"""
 
-from apps.chords.models import Chord, ChordPosition
+import html
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from apps.chords.constants import (
+    SVG_CACHE_SIZE,
+    DiagramOrientationChoice,
+    DiagramThemeChoice,
+)
+from apps.chords.models import Chord
+from apps.metrics.metrics import chord_svg_cache_requests_total
 
 _STRINGS = 6
 _FRETS = 4
 
-_FINGER_FILL = {1: "#ffb3c1", 2: "#fff0a0", 3: "#b3f0b3", 4: "#b3d9ff"}
-_FINGER_STROKE = {1: "#cc0033", 2: "#cc6600", 3: "#006600", 4: "#0033cc"}
 
 _ROMAN = ("", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X", "XI", "XII")
 _BARRE_THICKNESS = 6  # thin radius of the barre ellipse in both orientations
+_CIRCLE_R = 5  # radius of a finger marker
 _FINGER = {
     1: "указательным пальцем",
     2: "средним пальцем",
@@ -24,6 +45,167 @@ _FINGER = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class _Theme:
+    """Colours of a diagram.
+
+    `fill` and `stroke` are indexed by finger; index 0 is used for fingers
+    without a colour of their own. Definition ids start with `prefix`, so
+    diagrams of different themes inlined into one page never clash.
+    """
+
+    prefix: str
+    ink: str
+    fill: tuple[str, ...]
+    stroke: tuple[str, ...]
+
+    def finger_fill(self, finger: int) -> str:
+        return self.fill[finger] if 0 < finger < len(self.fill) else self.fill[0]
+
+    def finger_stroke(self, finger: int) -> str:
+        return self.stroke[finger] if 0 < finger < len(self.stroke) else self.stroke[0]
+
+
+_THEMES: dict[str, _Theme] = {
+    DiagramThemeChoice.DEFAULT: _Theme(
+        prefix="chord",
+        ink="currentColor",
+        fill=("#cccccc", "#ffb3c1", "#fff0a0", "#b3f0b3", "#b3d9ff"),
+        stroke=("#666666", "#cc0033", "#cc6600", "#006600", "#0033cc"),
+    ),
+    DiagramThemeChoice.DARK: _Theme(
+        prefix="chord-dark",
+        ink="#e6e6e6",
+        fill=("#4d4d4d", "#7a1f33", "#7a5c1f", "#1f6b2e", "#1f4a7a"),
+        stroke=("#b3b3b3", "#ff8fa6", "#ffd27a", "#8fe6a0", "#8fc4ff"),
+    ),
+    DiagramThemeChoice.MONO: _Theme(
+        prefix="chord-mono",
+        ink="currentColor",
+        fill=("#ffffff",),
+        stroke=("currentColor",),
+    ),
+}
+
+_TITLE_SLOT = "\x00"  # stands in for the title; never part of the geometry
+
+type _Template = tuple[str, str]  # the text before and after the title slot
+
+
+class _Position(NamedTuple):
+    string_number: int
+    fret: int
+    finger: int
+
+
+@dataclass(frozen=True, slots=True)
+class Fingering:
+    """Everything a chord diagram depends on apart from the chord title.
+
+    Attributes:
+        start_fret: First fret shown on the diagram.
+        has_barre: Whether the chord is played with a barre.
+        tonic_string: String marked as the tonic.
+        positions: Positions of the chord, sorted by string number.
+    """
+
+    start_fret: int
+    has_barre: bool
+    tonic_string: int
+    positions: tuple[_Position, ...]
+
+
+class CacheInfo(NamedTuple):
+    """Counters of the diagram cache of this process."""
+
+    hits: int
+    misses: int
+    size: int
+
+
+class _Diagram(NamedTuple):
+    """A diagram rendered with `_TITLE_SLOT`, whole and in parts.
+
+    Attributes:
+        document: The standalone SVG document.
+        width: Natural width of the diagram.
+        height: Natural height of the diagram.
+        label: The `aria-label`.
+        defs: Shared definitions by id; must not be modified.
+        body: The elements drawn after the definitions.
+    """
+
+    document: _Template
+    width: int
+    height: int
+    label: _Template
+    defs: dict[str, str]
+    body: str
+
+
+class SpriteSymbols(NamedTuple):
+    """Both diagrams of a chord as sprite symbols.
+
+    Attributes:
+        defs: Definitions the symbols refer to, by id.
+        symbols: The horizontal and vertical `<symbol>` elements.
+    """
+
+    defs: dict[str, str]
+    symbols: tuple[str, str]
+
+
+class _DiagramCache:
+    """Thread-safe LRU of rendered diagrams keyed by fingering and theme."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[
+            tuple[Fingering, _Theme], tuple[_Diagram, _Diagram]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, fingering: Fingering, theme: _Theme) -> tuple[_Diagram, _Diagram]:
+        """Return the diagrams of `fingering`, rendering them on a miss."""
+        key = (fingering, theme)
+        with self._lock:
+            diagrams = self._entries.get(key)
+            if diagrams is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if diagrams is not None:
+            chord_svg_cache_requests_total.labels(result="hit").inc()
+            return diagrams
+
+        chord_svg_cache_requests_total.labels(result="miss").inc()
+        diagrams = (
+            _render_horizontal(fingering, theme),
+            _render_vertical(fingering, theme),
+        )
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = diagrams
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return diagrams
+
+    def info(self) -> CacheInfo:
+        """Return the hit and miss counters and the number of entries."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, len(self._entries))
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+
+_cache = _DiagramCache(SVG_CACHE_SIZE)
+
+
 def render_chord_svg(chord: Chord) -> tuple[str, str]:
     """Render horizontal and vertical SVG diagrams for a chord.
 
@@ -33,8 +215,98 @@ def render_chord_svg(chord: Chord) -> tuple[str, str]:
     Returns:
         Tuple of (svg_horizontal, svg_vertical) as SVG strings.
     """
-    positions: list[ChordPosition] = list(chord.positions.all())
-    return _render_horizontal(chord, positions), _render_vertical(chord, positions)
+    horizontal, vertical = _cache.get(
+        chord_fingering(chord), _THEMES[DiagramThemeChoice.DEFAULT]
+    )
+    title = html.escape(chord.title)
+    return title.join(horizontal.document), title.join(vertical.document)
+
+
+def render_chord_diagram(
+    chord: Chord,
+    orientation: str = DiagramOrientationChoice.VERTICAL,
+    theme: str = DiagramThemeChoice.DEFAULT,
+    scale: float = 1,
+) -> str:
+    """Render one standalone diagram of a chord.
+
+    Args:
+        chord: Chord instance with related positions prefetched or accessible.
+        orientation: A `DiagramOrientationChoice`.
+        theme: A `DiagramThemeChoice`.
+        scale: Factor applied to the natural size, set as width and height.
+
+    Returns:
+        str: The SVG document.
+    """
+    horizontal, vertical = _cache.get(chord_fingering(chord), _THEMES[theme])
+    diagram = (
+        horizontal if orientation == DiagramOrientationChoice.HORIZONTAL else vertical
+    )
+    head, tail = diagram.document
+    head = head.replace(
+        "<svg ",
+        f'<svg width="{diagram.width * scale:g}" height="{diagram.height * scale:g}" ',
+        1,
+    )
+    return html.escape(chord.title).join((head, tail))
+
+
+def render_chord_symbols(chord: Chord, symbol_ids: tuple[str, str]) -> SpriteSymbols:
+    """Render both diagrams of a chord as `<symbol>`s for a sprite.
+
+    The symbols draw the same default-theme diagrams as `render_chord_svg`
+    but leave the finger markers to a `<defs>` shared by the whole sprite.
+
+    Args:
+        chord: Chord instance with related positions prefetched or accessible.
+        symbol_ids: Ids of the horizontal and vertical symbols.
+
+    Returns:
+        SpriteSymbols: The symbols and the definitions they refer to.
+    """
+    diagrams = _cache.get(chord_fingering(chord), _THEMES[DiagramThemeChoice.DEFAULT])
+    title = html.escape(chord.title)
+    defs: dict[str, str] = {}
+    symbols: list[str] = []
+    for symbol_id, diagram in zip(symbol_ids, diagrams, strict=True):
+        defs.update(diagram.defs)
+        symbols.append(
+            f'<symbol id="{symbol_id}" viewBox="0 0 {diagram.width} {diagram.height}" '
+            f'aria-label="{title.join(diagram.label)}">{diagram.body}</symbol>'
+        )
+    return SpriteSymbols(defs, (symbols[0], symbols[1]))
+
+
+def chord_fingering(chord: Chord) -> Fingering:
+    """Return the fingering of `chord`, using its prefetched positions."""
+    return Fingering(
+        start_fret=chord.start_fret,
+        has_barre=chord.has_barre,
+        tonic_string=_tonic_string(chord.title),
+        positions=tuple(
+            sorted(
+                _Position(p.string_number, p.fret, p.finger)
+                for p in chord.positions.all()
+            )
+        ),
+    )
+
+
+def svg_cache_info() -> CacheInfo:
+    """Return the counters of this process's diagram cache."""
+    return _cache.info()
+
+
+def clear_svg_cache() -> None:
+    """Empty this process's diagram cache."""
+    _cache.clear()
+
+
+def _template(text: str) -> _Template:
+    """Split text rendered with `_TITLE_SLOT` around the slot."""
+    head, _, tail = text.partition(_TITLE_SLOT)
+    return head, tail
 
 
 def _roman(n: int) -> str:
@@ -51,11 +323,11 @@ def _tonic_string(title: str) -> int:
     return 5
 
 
-def _aria_label(chord: Chord, positions: list[ChordPosition]) -> str:
-    parts = [html.escape(chord.title)]
-    if chord.has_barre:
-        parts.append(f"баре на {chord.start_fret} ладу")
-    for pos in sorted(positions, key=lambda p: p.string_number):
+def _aria_label(fingering: Fingering) -> str:
+    parts = [_TITLE_SLOT]
+    if fingering.has_barre:
+        parts.append(f"баре на {fingering.start_fret} ладу")
+    for pos in fingering.positions:
         if pos.fret == -1:
             parts.append(f"струна {pos.string_number} заглушена")
         elif pos.fret == 0:
@@ -73,14 +345,95 @@ def _string_sw(s_idx: int) -> float:
     return round(max(0.5, 1.1 - s_idx * 0.2), 1)
 
 
+def _num(value: float) -> str:
+    """Format a number in as few characters as SVG allows (0.5 -> .5)."""
+    text = f"{value:g}"
+    return text.removeprefix("0") if text.startswith("0.") else text
+
+
+def _finger_marker(
+    finger: int, x: int, y: int, theme: _Theme, defs: dict[str, str]
+) -> str:
+    """Return a `<use>` of the marker of `finger`, adding it to `defs`.
+
+    The marker is a circle centred on the origin with the finger number.
+    """
+    marker_id = f"{theme.prefix}-finger-{finger}"
+    if marker_id not in defs:
+        fill = theme.finger_fill(finger)
+        stroke = theme.finger_stroke(finger)
+        number = (
+            f'<text y="3" text-anchor="middle" font-size="9">{finger}</text>'
+            if finger > 0
+            else ""
+        )
+        defs[marker_id] = (
+            f'<g id="{marker_id}" fill="{stroke}"><circle r="{_CIRCLE_R}" '
+            f'fill="{fill}" stroke="{stroke}" stroke-width=".5"/>{number}</g>'
+        )
+    return f'<use href="#{marker_id}" x="{x}" y="{y}"/>'
+
+
+def _grid(theme: _Theme, strings: list[str], frets: list[str], nut: str) -> str:
+    """Merge the string and fret lines into one path per stroke width.
+
+    `strings` are path segments from the thickest string on; `nut` is the
+    segment of the nut, or empty above the first fret. Fret lines get square
+    caps so that they close the corners with the outer strings.
+    """
+    by_width: dict[float, str] = {}
+    for index, segment in enumerate(strings):
+        width = _string_sw(index)
+        by_width[width] = by_width.get(width, "") + segment
+    paths = [
+        f'<path stroke-width="{_num(width)}" d="{d}"/>' for width, d in by_width.items()
+    ]
+    paths.append(f'<path stroke-linecap="square" d="{"".join(frets)}"/>')
+    if nut:
+        paths.append(f'<path stroke-width="4" d="{nut}"/>')
+    return f'<g fill="none" stroke="{theme.ink}">{"".join(paths)}</g>'
+
+
+def _barre(theme: _Theme, cx: int, cy: int, rx: int, ry: int) -> str:
+    """Return the barre ellipse."""
+    return (
+        f'<ellipse cx="{cx}" cy="{cy}" rx="{rx}" ry="{ry}" '
+        f'fill="{theme.finger_fill(1)}" stroke="{theme.finger_stroke(1)}" '
+        f'stroke-width=".5"/>'
+    )
+
+
+def _texts(theme: _Theme, texts: list[str]) -> str:
+    """Group the labels; they default to 9px, centred, in the ink colour."""
+    return (
+        f'<g fill="{theme.ink}" font-size="9" text-anchor="middle">{"".join(texts)}</g>'
+    )
+
+
+def _text(x: int, y: int, content: str, attrs: str = "") -> str:
+    return f'<text x="{x}" y="{y}"{attrs}>{content}</text>'
+
+
+def _svg(
+    width: int, height: int, label: str, defs: dict[str, str], elements: list[str]
+) -> _Diagram:
+    """Assemble a diagram from its shared definitions and elements."""
+    body = "\n".join(elements)
+    document = (
+        f'<svg viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg" '
+        f'aria-label="{label}">\n<defs>{"".join(defs.values())}</defs>\n'
+        f"{body}\n</svg>"
+    )
+    return _Diagram(_template(document), width, height, _template(label), defs, body)
+
+
 # ── Horizontal (nut on the RIGHT, frets increase going LEFT) ─────────────────
 # Strings are horizontal lines; frets are vertical lines.
 
 
-def _render_horizontal(chord: Chord, positions: list[ChordPosition]) -> str:  # noqa: PLR0914
+def _render_horizontal(fingering: Fingering, theme: _Theme) -> _Diagram:  # noqa: PLR0914
     fret_w = 45  # px per fret column
     string_h = 12  # px between string lines
-    circle_r = 5
 
     ml = 15  # left margin — T marker
     mt = 22  # top margin  — roman numeral labels
@@ -95,56 +448,43 @@ def _render_horizontal(chord: Chord, positions: list[ChordPosition]) -> str:  #
     width = ml + gw + mr
     height = mt + gh + mb
 
-    overhang = 0 if chord.start_fret == 1 else 3
-    elements: list[str] = []
+    overhang = 0 if fingering.start_fret == 1 else 3
+    defs: dict[str, str] = {}
+    texts: list[str] = []
+    markers: list[str] = []
 
     # String lines: string 6 (thickest) at top, string 1 at bottom
-    for i in range(_STRINGS):
-        sy = mt + i * string_h
-        elements.append(
-            f'<line x1="{ml}" y1="{sy}" x2="{gr + overhang}" y2="{sy}" '
-            f'stroke="currentColor" stroke-width="{_string_sw(i)}"/>'
-        )
+    strings = [f"M{ml} {mt + i * string_h}H{gr + overhang}" for i in range(_STRINGS)]
 
     # Fret lines: nut on right, thick when start_fret == 1
-    for fi in range(_FRETS + 1):
-        fx = ml + fi * fret_w
-        nut_sw = 4 if (fi == _FRETS and chord.start_fret == 1) else 1
-        elements.append(
-            f'<line x1="{fx}" y1="{mt - 7}" x2="{fx}" y2="{gb + 0.3}" '
-            f'stroke="currentColor" stroke-width="{nut_sw}"/>'
-        )
+    frets = [f"M{ml + fi * fret_w} {mt - 7}V{gb}" for fi in range(_FRETS + 1)]
+    nut = frets.pop() if fingering.start_fret == 1 else ""
 
     # Roman numeral labels between fret lines, above the grid
     for f in range(1, _FRETS + 1):
         cx = ml + (_FRETS - f) * fret_w + fret_w // 2
-        rn = _roman(chord.start_fret + f - 1)
-        elements.append(
-            f'<text x="{cx}" y="{mt - 9}" text-anchor="middle" '
-            f'font-size="9" fill="currentColor">{rn}</text>'
-        )
+        texts.append(_text(cx, mt - 9, _roman(fingering.start_fret + f - 1)))
 
     # Tonic marker on the LEFT (away from open/muted markers on the right)
-    tonic_sy = mt + (_STRINGS - _tonic_string(chord.title)) * string_h
-    elements.append(
-        f'<text x="{ml - 5}" y="{tonic_sy + 3}" text-anchor="end" '
-        f'font-size="7" font-weight="bold" fill="currentColor">T</text>'
+    tonic_sy = mt + (_STRINGS - fingering.tonic_string) * string_h
+    texts.append(
+        _text(
+            ml - 5,
+            tonic_sy + 3,
+            "T",
+            ' text-anchor="end" font-size="7" font-weight="bold"',
+        )
     )
 
-    if chord.has_barre:
+    barre = ""
+    if fingering.has_barre:
         bx = ml + (_FRETS - 1) * fret_w + fret_w // 2
         by = mt + gh // 2
-        elements.append(
-            f'<ellipse cx="{bx}" cy="{by}" rx="{_BARRE_THICKNESS}" '
-            f'ry="{gh // 2 + circle_r}" fill="{_FINGER_FILL[1]}"'
-            f' stroke="{_FINGER_STROKE[1]}" stroke-width="0.5"/>'
-        )
-        elements.append(
-            f'<text x="{bx}" y="{by + 4}" text-anchor="middle" '
-            f'font-size="9" fill="{_FINGER_STROKE[1]}">1</text>'
-        )
+        barre = _barre(theme, bx, by, _BARRE_THICKNESS, gh // 2 + _CIRCLE_R)
+        texts.append(_text(bx, by + 4, "1", f' fill="{theme.finger_stroke(1)}"'))
 
-    pos_map: dict[int, ChordPosition] = {p.string_number: p for p in positions}
+    pos_map = {p.string_number: p for p in fingering.positions}
+    open_muted: list[str] = []
 
     for s in range(1, _STRINGS + 1):
         sy = mt + (_STRINGS - s) * string_h
@@ -152,36 +492,25 @@ def _render_horizontal(chord: Chord, positions: list[ChordPosition]) -> str:  #
         if pos is None:
             continue
         if pos.fret == -1:
-            elements.append(
-                f'<text x="{gr + 5}" y="{sy + 3}" text-anchor="start" '
-                f'font-size="11" fill="currentColor">×</text>'
-            )
-        elif pos.fret == 0 and not chord.has_barre:
-            elements.append(
-                f'<text x="{gr + 5}" y="{sy + 3}" text-anchor="start" '
-                f'font-size="11" fill="currentColor">○</text>'
-            )
+            open_muted.append(_text(gr + 5, sy + 3, "×"))
+        elif pos.fret == 0 and not fingering.has_barre:
+            open_muted.append(_text(gr + 5, sy + 3, "○"))
         else:
-            fi = pos.fret - chord.start_fret + 1
+            fi = pos.fret - fingering.start_fret + 1
             if 1 <= fi <= _FRETS:
                 cx = ml + (_FRETS - fi) * fret_w + fret_w // 2
-                fill = _FINGER_FILL.get(pos.finger, "#cccccc")
-                stroke = _FINGER_STROKE.get(pos.finger, "#666666")
-                elements.append(
-                    f'<circle cx="{cx}" cy="{sy}" r="{circle_r}" '
-                    f'fill="{fill}" stroke="{stroke}" stroke-width="0.5"/>'
-                )
-                if pos.finger > 0:
-                    elements.append(
-                        f'<text x="{cx}" y="{sy + 3}" text-anchor="middle" '
-                        f'font-size="9" fill="{stroke}">{pos.finger}</text>'
-                    )
-
-    label = _aria_label(chord, positions)
-    body = "\n  ".join(elements)
-    return (
-        f'<svg viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg" '
-        f'aria-label="{label}">\n  {body}\n</svg>'
+                markers.append(_finger_marker(pos.finger, cx, sy, theme, defs))
+
+    if open_muted:
+        texts.append(f'<g font-size="11" text-anchor="start">{"".join(open_muted)}</g>')
+
+    elements = [_grid(theme, strings, frets, nut), barre, _texts(theme, texts)]
+    return _svg(
+        width,
+        height,
+        _aria_label(fingering),
+        defs,
+        [element for element in elements if element] + markers,
     )
 
 
@@ -189,10 +518,9 @@ def _render_horizontal(chord: Chord, positions: list[ChordPosition]) -> str:  #
 # Strings are vertical lines; frets are horizontal lines.
 
 
-def _render_vertical(chord: Chord, positions: list[ChordPosition]) -> str:  # noqa: PLR0914, PLR0915
+def _render_vertical(fingering: Fingering, theme: _Theme) -> _Diagram:  # noqa: PLR0914
     string_w = 12  # px between string lines (mirrors horizontal string_h)
     fret_h = 45  # px per fret row (mirrors horizontal fret_w)
-    circle_r = 5
 
     ml = 25  # left margin — roman numeral labels (mirrors horizontal mt)
     mt = 19  # top margin — open/muted markers (mirrors horizontal mr)
@@ -212,50 +540,41 @@ def _render_vertical(chord: Chord, positions: list[ChordPosition]) -> str:  # no
     width = ml + gw + mr
     height = mt + gh + mb
 
-    overhang = 0 if chord.start_fret == 1 else 3
-    elements: list[str] = []
+    overhang = 0 if fingering.start_fret == 1 else 3
+    defs: dict[str, str] = {}
+    texts: list[str] = []
+    markers: list[str] = []
 
     # String lines: string 6 at left, string 1 at right
-    for i in range(_STRINGS):
-        sx = str_start + i * string_w
-        elements.append(
-            f'<line x1="{sx}" y1="{mt - overhang}" x2="{sx}" y2="{gb}" '
-            f'stroke="currentColor" stroke-width="{_string_sw(i)}"/>'
-        )
+    strings = [
+        f"M{str_start + i * string_w} {mt - overhang}V{gb}" for i in range(_STRINGS)
+    ]
 
     # Fret lines: nut at top, thick when start_fret == 1
-    for fi in range(_FRETS + 1):
-        fy = mt + fi * fret_h
-        nut_sw = 4 if (fi == 0 and chord.start_fret == 1) else 1
-        elements.append(
-            f'<line x1="{fl_x1}" y1="{fy}" x2="{fl_x2 + 0.3}" y2="{fy}" '
-            f'stroke="currentColor" stroke-width="{nut_sw}"/>'
-        )
+    frets = [f"M{fl_x1} {mt + fi * fret_h}H{fl_x2}" for fi in range(_FRETS + 1)]
+    nut = frets.pop(0) if fingering.start_fret == 1 else ""
 
     # Roman numeral labels to the left, centred in each fret row
-    for f in range(1, _FRETS + 1):
-        ry = mt + (f - 1) * fret_h + fret_h // 2 + 3
-        rn = _roman(chord.start_fret + f - 1)
-        elements.append(
-            f'<text x="{fl_x1 - 2}" y="{ry}" text-anchor="end" '
-            f'font-size="9" fill="currentColor">{rn}</text>'
+    romans = [
+        _text(
+            fl_x1 - 2,
+            mt + (f - 1) * fret_h + fret_h // 2 + 3,
+            _roman(fingering.start_fret + f - 1),
         )
+        for f in range(1, _FRETS + 1)
+    ]
+    texts.append(f'<g text-anchor="end">{"".join(romans)}</g>')
 
-    if chord.has_barre:
+    barre = ""
+    if fingering.has_barre:
         barre_cy = mt + fret_h // 2
         bx = str_start + gw // 2
-        elements.append(
-            f'<ellipse cx="{bx}" cy="{barre_cy}" rx="{gw // 2 + circle_r}" '
-            f'ry="{_BARRE_THICKNESS}" fill="{_FINGER_FILL[1]}"'
-            f' stroke="{_FINGER_STROKE[1]}" stroke-width="0.5"/>'
-        )
-        elements.append(
-            f'<text x="{bx}" y="{barre_cy + 4}" text-anchor="middle" '
-            f'font-size="9" fill="{_FINGER_STROKE[1]}">1</text>'
-        )
+        barre = _barre(theme, bx, barre_cy, gw // 2 + _CIRCLE_R, _BARRE_THICKNESS)
+        texts.append(_text(bx, barre_cy + 4, "1", f' fill="{theme.finger_stroke(1)}"'))
 
     # Open/muted markers above the nut
-    pos_map: dict[int, ChordPosition] = {p.string_number: p for p in positions}
+    pos_map = {p.string_number: p for p in fingering.positions}
+    open_muted: list[str] = []
 
     for s in range(1, _STRINGS + 1):
         sx = str_start + (_STRINGS - s) * string_w
@@ -263,41 +582,27 @@ def _render_vertical(chord: Chord, positions: list[ChordPosition]) -> str:  # no
         if pos is None:
             continue
         if pos.fret == -1:
-            elements.append(
-                f'<text x="{sx}" y="{mt - 5}" text-anchor="middle" '
-                f'font-size="11" fill="currentColor">×</text>'
-            )
-        elif pos.fret == 0 and not chord.has_barre:
-            elements.append(
-                f'<text x="{sx}" y="{mt - 5}" text-anchor="middle" '
-                f'font-size="11" fill="currentColor">○</text>'
-            )
+            open_muted.append(_text(sx, mt - 5, "×"))
+        elif pos.fret == 0 and not fingering.has_barre:
+            open_muted.append(_text(sx, mt - 5, "○"))
         else:
-            fi = pos.fret - chord.start_fret + 1
+            fi = pos.fret - fingering.start_fret + 1
             if 1 <= fi <= _FRETS:
                 cy = mt + (fi - 1) * fret_h + fret_h // 2
-                fill = _FINGER_FILL.get(pos.finger, "#cccccc")
-                stroke = _FINGER_STROKE.get(pos.finger, "#666666")
-                elements.append(
-                    f'<circle cx="{sx}" cy="{cy}" r="{circle_r}" '
-                    f'fill="{fill}" stroke="{stroke}" stroke-width="0.5"/>'
-                )
-                if pos.finger > 0:
-                    elements.append(
-                        f'<text x="{sx}" y="{cy + 3}" text-anchor="middle" '
-                        f'font-size="9" fill="{stroke}">{pos.finger}</text>'
-                    )
+                markers.append(_finger_marker(pos.finger, sx, cy, theme, defs))
 
-    # Tonic marker below the grid
-    tonic_sx = str_start + (_STRINGS - _tonic_string(chord.title)) * string_w
-    elements.append(
-        f'<text x="{tonic_sx}" y="{gb + 11}" text-anchor="middle" '
-        f'font-size="7" font-weight="bold" fill="currentColor">T</text>'
-    )
+    if open_muted:
+        texts.append(f'<g font-size="11">{"".join(open_muted)}</g>')
 
-    label = _aria_label(chord, positions)
-    body = "\n  ".join(elements)
-    return (
-        f'<svg viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg" '
-        f'aria-label="{label}">\n  {body}\n</svg>'
+    # Tonic marker below the grid
+    tonic_sx = str_start + (_STRINGS - fingering.tonic_string) * string_w
+    texts.append(_text(tonic_sx, gb + 11, "T", ' font-size="7" font-weight="bold"'))
+
+    elements = [_grid(theme, strings, frets, nut), barre, _texts(theme, texts)]
+    return _svg(
+        width,
+        height,
+        _aria_label(fingering),
+        defs,
+        [element for element in elements if element] + markers,
     )
@@ -6,6 +6,7 @@
 
 import pytest
 
+from apps.chords.fingering_index import invalidate_fingering_index
 from apps.chords.models import Chord, ChordPosition
 from apps.chords.tests.factories import (
     ChordFactory,
@@ -14,6 +15,12 @@ from apps.chords.tests.factories import (
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_fingering_index() -> None:
+    """Drop the fingering index so lookups see this test's chords."""
+    invalidate_fingering_index()
+
+
 @pytest.fixture
 def chord_factory() -> type[FullChordFactory]:
     """Fixture providing the FullChord Factory for creating chords in tests."""
@@ -0,0 +1,200 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for the reverse chord lookup index."""
+
+import pytest
+from pytest_django import DjangoAssertNumQueries, DjangoCaptureOnCommitCallbacks
+
+from apps.chords.fingering_index import (
+    FingeringIndex,
+    Frets,
+    chord_frets,
+    find_chords,
+    get_fingering_index,
+)
+from apps.chords.models import Chord
+from apps.chords.selectors import get_all_chords, get_chord_by_id
+from apps.chords.services import ChordCreateDict, ChordPositionCreateDict, ChordService
+
+
+def _make_chord(
+    title: str, frets: Frets, start_fret: int = 1, has_barre: bool = False
+) -> Chord:
+    """Create a chord from frets listed from the 6th string to the 1st."""
+    positions: list[ChordPositionCreateDict] = [
+        {"string_number": 6 - i, "fret": fret, "finger": 0}
+        for i, fret in enumerate(frets)
+    ]
+    fields: ChordCreateDict = {
+        "title": title,
+        "musical_title": title,
+        "order_in_note": 1,
+        "start_fret": start_fret,
+        "has_barre": has_barre,
+    }
+    return ChordService.create_chord(positions=positions, chord_fields=fields)
+
+
+def _titles(frets: list[int | None], tolerance: int = 0) -> list[str]:
+    return [match.title for match in find_chords(frets, tolerance)]
+
+
+# =============================================================================
+# chord_frets
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_chord_frets_lists_strings_from_sixth_to_first() -> None:
+    chord = _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+    fetched = get_chord_by_id(chord.pk)
+    assert fetched is not None
+
+    assert chord_frets(fetched) == (-1, 0, 2, 2, 1, 0)
+
+
+@pytest.mark.django_db
+def test_chord_frets_puts_open_strings_of_barre_chords_on_barre_fret() -> None:
+    chord = _make_chord("Bm", (-1, 0, 4, 4, 3, 0), start_fret=2, has_barre=True)
+    fetched = get_chord_by_id(chord.pk)
+    assert fetched is not None
+
+    assert chord_frets(fetched) == (-1, 2, 4, 4, 3, 2)
+
+
+# =============================================================================
+# find_chords
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_find_chords_matches_exact_fingering() -> None:
+    _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+    _make_chord("C", (-1, 3, 2, 0, 1, 0))
+
+    [match] = find_chords([-1, 0, 2, 2, 1, 0])
+
+    assert match.title == "Am"
+    assert match.shift == 0
+
+
+@pytest.mark.django_db
+def test_find_chords_muted_string_does_not_match_open_string() -> None:
+    _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+
+    assert _titles([0, 0, 2, 2, 1, 0]) == []
+
+
+@pytest.mark.django_db
+def test_find_chords_wildcard_matches_any_fret() -> None:
+    _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+    _make_chord("Am7", (-1, 0, 2, 0, 1, 0))
+    _make_chord("C", (-1, 3, 2, 0, 1, 0))
+
+    assert _titles([None, 0, 2, None, 1, 0]) == ["Am", "Am7"]
+
+
+@pytest.mark.django_db
+def test_find_chords_transposes_within_tolerance() -> None:
+    _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+    _make_chord("Bm", (-1, 0, 4, 4, 3, 0), start_fret=2, has_barre=True)
+    _make_chord("Dm", (-1, 0, 7, 7, 6, 0), start_fret=5, has_barre=True)
+
+    matches = find_chords([-1, 0, 2, 2, 1, 0], tolerance=2)
+
+    assert [(m.title, m.shift) for m in matches] == [("Am", 0), ("Bm", 2)]
+
+
+@pytest.mark.django_db
+def test_find_chords_reports_negative_shift() -> None:
+    _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+
+    [match] = find_chords([-1, 1, 3, 3, 2, 1], tolerance=1)
+
+    assert match.shift == -1
+
+
+@pytest.mark.django_db
+def test_find_chords_combines_wildcards_and_tolerance() -> None:
+    _make_chord("Bm", (-1, 0, 4, 4, 3, 0), start_fret=2, has_barre=True)
+
+    assert _titles([None, None, 2, 2, 1, None], tolerance=2) == ["Bm"]
+
+
+def test_find_chords_rejects_wrong_number_of_frets() -> None:
+    with pytest.raises(ValueError, match="6 frets"):
+        FingeringIndex([]).lookup([0, 0, 0])
+
+
+# =============================================================================
+# get_fingering_index — rebuilds
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_fingering_index_reused_between_lookups() -> None:
+    _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+
+    assert get_fingering_index() is get_fingering_index()
+
+
+@pytest.mark.django_db
+def test_fingering_index_rebuilt_after_chord_created(
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    assert _titles([-1, 0, 2, 2, 1, 0]) == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+
+    assert _titles([-1, 0, 2, 2, 1, 0]) == ["Am"]
+
+
+@pytest.mark.django_db
+def test_fingering_index_rebuilt_after_chord_updated(
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    chord = _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+    assert _titles([-1, 0, 2, 2, 1, 0]) == ["Am"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ChordService.update_chord(chord=chord, data={"title": "A-"})
+
+    assert _titles([-1, 0, 2, 2, 1, 0]) == ["A-"]
+
+
+@pytest.mark.django_db
+def test_fingering_index_rebuilt_after_chord_deleted(
+    django_capture_on_commit_callbacks: DjangoCaptureOnCommitCallbacks,
+) -> None:
+    chord = _make_chord("Am", (-1, 0, 2, 2, 1, 0))
+    assert _titles([-1, 0, 2, 2, 1, 0]) == ["Am"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ChordService.delete_chord(chord=chord)
+
+    assert _titles([-1, 0, 2, 2, 1, 0]) == []
+
+
+@pytest.mark.django_db
+def test_fingering_index_rebuilt_after_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    index = get_fingering_index()
+
+    monkeypatch.setattr("apps.chords.fingering_index.FINGERING_INDEX_TTL", -1)
+
+    assert get_fingering_index() is not index
+
+
+@pytest.mark.django_db
+def test_fingering_index_lookup_does_not_query(
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    for title, frets in [("Am", (-1, 0, 2, 2, 1, 0)), ("E", (0, 2, 2, 1, 0, 0))]:
+        _make_chord(title, frets)
+    index = get_fingering_index()
+    assert len(index) == get_all_chords().count()
+
+    with django_assert_num_queries(0):
+        index.lookup([None, 2, 2, None, 0, 0], tolerance=3)
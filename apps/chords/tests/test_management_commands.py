@@ -4,6 +4,8 @@
 
 """Tests for chords management commands."""
 
+from io import StringIO
+
 import pytest
 from django.core.management import call_command
 
@@ -29,3 +31,16 @@ def test_generate_chord_svgs_populates_svg_fields(
     chord.refresh_from_db()
     assert chord.svg_horizontal
     assert chord.svg_vertical
+
+
+@pytest.mark.django_db
+def test_generate_chord_svgs_incremental_reports_skipped_chords(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord_factory.create()
+    call_command("generate_chord_svgs")
+    out = StringIO()
+
+    call_command("generate_chord_svgs", "--incremental", stdout=out)
+
+    assert "Updated 0 chord(s)." in out.getvalue()
@@ -4,8 +4,15 @@
 
 import pytest
 
+from apps.chords import services
+from apps.chords.constants import SVG_RENDERER_VERSION
 from apps.chords.models import Chord, ChordPosition
-from apps.chords.services import ChordCreateDict, ChordPositionCreateDict, ChordService
+from apps.chords.services import (
+    ChordCreateDict,
+    ChordPositionCreateDict,
+    ChordService,
+    chord_content_hash,
+)
 from apps.chords.tests.factories import FullChordFactory
 
 
@@ -296,3 +303,130 @@ def test_replace_positions_empty_list(chord: Chord) -> None:
     ChordService._replace_positions(chord, [])
 
     assert chord.positions.count() == 0
+
+
+@pytest.mark.django_db
+def test_create_chord_sets_content_hash() -> None:
+    chord_fields: ChordCreateDict = {
+        "title": "G",
+        "musical_title": "G major",
+        "order_in_note": 1,
+        "start_fret": 1,
+        "has_barre": False,
+    }
+    positions: list[ChordPositionCreateDict] = [
+        {"string_number": n, "fret": 0, "finger": 0} for n in range(1, 7)
+    ]
+
+    chord = ChordService.create_chord(positions=positions, chord_fields=chord_fields)
+
+    chord.refresh_from_db()
+    assert chord.content_hash == chord_content_hash(chord)
+
+
+@pytest.mark.django_db
+def test_update_chord_positions_change_content_hash(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord = chord_factory.create()
+    ChordService.regenerate_svg(chord=chord)
+    old_hash = chord.content_hash
+    new_positions = [{"string_number": n, "fret": 2, "finger": 1} for n in range(1, 7)]
+
+    ChordService.update_chord(chord=chord, data={"positions": new_positions})
+
+    chord.refresh_from_db()
+    assert chord.content_hash != old_hash
+    assert chord.content_hash == chord_content_hash(chord)
+
+
+@pytest.mark.django_db
+def test_update_chord_title_changes_content_hash(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord = chord_factory.create(title="Am")
+    ChordService.regenerate_svg(chord=chord)
+    old_hash = chord.content_hash
+
+    ChordService.update_chord(chord=chord, data={"title": "A-"})
+
+    assert chord.content_hash != old_hash
+
+
+@pytest.mark.django_db
+def test_regenerate_svg_keeps_content_hash_when_nothing_changed(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord = chord_factory.create()
+    ChordService.regenerate_svg(chord=chord)
+    old_hash = chord.content_hash
+
+    ChordService.regenerate_svg(chord=chord)
+
+    assert chord.content_hash == old_hash
+
+
+@pytest.mark.django_db
+def test_bulk_regenerate_svgs_sets_content_hashes(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord_factory.create_batch(2)
+
+    ChordService.bulk_regenerate_svgs()
+
+    for chord in Chord.objects.all():
+        assert chord.content_hash == chord_content_hash(chord)
+
+
+@pytest.mark.django_db
+def test_bulk_regenerate_svgs_incremental_skips_unchanged_chords(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord_factory.create_batch(2)
+    ChordService.bulk_regenerate_svgs()
+
+    assert ChordService.bulk_regenerate_svgs(incremental=True) == 0
+
+
+@pytest.mark.django_db
+def test_bulk_regenerate_svgs_incremental_renders_changed_positions(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord, _ = chord_factory.create_batch(2)
+    ChordService.bulk_regenerate_svgs()
+    old_svg = Chord.objects.get(pk=chord.pk).svg_vertical
+    position = chord.positions.get(string_number=1)
+    ChordPosition.objects.filter(pk=position.pk).update(fret=position.fret + 1)
+
+    updated = ChordService.bulk_regenerate_svgs(incremental=True)
+
+    assert updated == 1
+    assert Chord.objects.get(pk=chord.pk).svg_vertical != old_svg
+
+
+@pytest.mark.django_db
+def test_bulk_regenerate_svgs_incremental_renders_all_after_version_bump(
+    chord_factory: type[FullChordFactory], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    chord_factory.create_batch(2)
+    ChordService.bulk_regenerate_svgs()
+    bumped = SVG_RENDERER_VERSION + 1
+    monkeypatch.setattr(services, "SVG_RENDERER_VERSION", bumped)
+
+    assert ChordService.bulk_regenerate_svgs(incremental=True) == 2
+    versions = Chord.objects.values_list("svg_renderer_version", flat=True)
+    assert set(versions) == {bumped}
+
+
+@pytest.mark.django_db
+def test_bulk_regenerate_svgs_in_processes_matches_inline(
+    chord_factory: type[FullChordFactory],
+) -> None:
+    chord_factory.create_batch(3)
+    ChordService.bulk_regenerate_svgs()
+    inline = list(Chord.objects.values_list("svg_horizontal", "svg_vertical"))
+    Chord.objects.update(svg_horizontal="", svg_vertical="")
+
+    ChordService.bulk_regenerate_svgs(workers=2)
+
+    assert list(Chord.objects.values_list("svg_horizontal", "svg_vertical")) == inline
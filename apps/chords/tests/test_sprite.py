@@ -0,0 +1,152 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for the chord sprite."""
+
+import re
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+
+from apps.chords import sprite
+from apps.chords.constants import SVG_RENDERER_VERSION
+from apps.chords.models import Chord
+from apps.chords.services import ChordCreateDict, ChordPositionCreateDict, ChordService
+from apps.chords.sprite import (
+    build_chord_sprite,
+    get_chord_sprite,
+    get_chord_sprite_version,
+    sprite_symbol_ids,
+)
+from apps.chords.tests.factories import ChordFactory
+
+_POSITIONS: list[ChordPositionCreateDict] = [
+    {"string_number": 1, "fret": 1, "finger": 1},
+    {"string_number": 2, "fret": 2, "finger": 2},
+    {"string_number": 3, "fret": 2, "finger": 3},
+    {"string_number": 4, "fret": 0, "finger": 0},
+    {"string_number": 5, "fret": -1, "finger": 0},
+    {"string_number": 6, "fret": -1, "finger": 0},
+]
+
+
+def _make_chord(title: str = "Am") -> Chord:
+    fields: ChordCreateDict = {
+        "title": title,
+        "musical_title": title,
+        "order_in_note": 1,
+        "start_fret": 1,
+        "has_barre": False,
+    }
+    return ChordService.create_chord(positions=_POSITIONS, chord_fields=fields)
+
+
+# =============================================================================
+# build_chord_sprite
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_build_chord_sprite_has_symbol_per_chord_and_orientation() -> None:
+    chords = [_make_chord("Am"), _make_chord("Dm")]
+
+    svg = build_chord_sprite().svg.decode()
+
+    for chord in chords:
+        for symbol_id in sprite_symbol_ids(chord.pk):
+            assert f'<symbol id="{symbol_id}" viewBox=' in svg
+    assert svg.count("aria-label=") == 4
+
+
+@pytest.mark.django_db
+def test_build_chord_sprite_defines_markers_once() -> None:
+    _make_chord("Am")
+    _make_chord("Dm")
+
+    svg = build_chord_sprite().svg.decode()
+
+    ids = re.findall(r'<g id="([^"]+)"', svg)
+    hrefs = set(re.findall(r'href="#([^"]+)"', svg))
+    assert len(ids) == len(set(ids))
+    assert hrefs
+    assert hrefs <= set(ids)
+
+
+@pytest.mark.django_db
+def test_build_chord_sprite_includes_chords_without_svgs() -> None:
+    chord = ChordFactory.create(svg_horizontal="", svg_vertical="")
+
+    svg = build_chord_sprite().svg.decode()
+
+    for symbol_id in sprite_symbol_ids(chord.pk):
+        assert f'<symbol id="{symbol_id}" viewBox=' in svg
+
+
+@pytest.mark.django_db
+def test_build_chord_sprite_renders_from_positions_not_stored_svgs() -> None:
+    chord = _make_chord()
+    Chord.objects.filter(pk=chord.pk).update(
+        svg_horizontal='<svg viewBox="0 0 1 1"><circle/></svg>',
+        svg_vertical='<svg viewBox="0 0 1 1"><circle/></svg>',
+    )
+
+    svg = build_chord_sprite().svg.decode()
+
+    assert "<circle/>" not in svg
+    for symbol_id in sprite_symbol_ids(chord.pk):
+        assert f'<symbol id="{symbol_id}" viewBox=' in svg
+    assert '<use href="#chord-finger-1"' in svg
+
+
+@pytest.mark.django_db
+def test_build_chord_sprite_version_matches_current_version() -> None:
+    _make_chord()
+
+    assert build_chord_sprite().version == get_chord_sprite_version()
+
+
+# =============================================================================
+# get_chord_sprite_version / get_chord_sprite
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_get_chord_sprite_version_changes_after_chord_edit() -> None:
+    chord = _make_chord()
+    before = get_chord_sprite_version()
+
+    ChordService.update_chord(chord=chord, data={"start_fret": 2})
+
+    assert get_chord_sprite_version() != before
+
+
+@pytest.mark.django_db
+def test_get_chord_sprite_version_changes_with_renderer_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _make_chord()
+    before = get_chord_sprite_version()
+
+    monkeypatch.setattr(sprite, "SVG_RENDERER_VERSION", SVG_RENDERER_VERSION + 1)
+
+    assert get_chord_sprite_version() != before
+
+
+@pytest.mark.django_db
+def test_get_chord_sprite_builds_once_per_version(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache.clear()
+    chord = _make_chord()
+    build = Mock(wraps=build_chord_sprite)
+    monkeypatch.setattr(sprite, "build_chord_sprite", build)
+
+    get_chord_sprite()
+    get_chord_sprite()
+    ChordService.update_chord(chord=chord, data={"start_fret": 2})
+    rebuilt = get_chord_sprite()
+
+    assert build.call_count == 2
+    assert rebuilt.version == get_chord_sprite_version()
@@ -4,11 +4,19 @@
 
 """Tests for the chord SVG renderer."""
 
+import re
+
 import pytest
 
+from apps.chords import svg_renderer
 from apps.chords.models import Chord
 from apps.chords.services import ChordCreateDict, ChordPositionCreateDict, ChordService
-from apps.chords.svg_renderer import render_chord_svg
+from apps.chords.svg_renderer import (
+    clear_svg_cache,
+    render_chord_diagram,
+    render_chord_svg,
+    svg_cache_info,
+)
 
 _DEFAULT_POSITIONS: list[ChordPositionCreateDict] = [
     {"string_number": 1, "fret": 1, "finger": 1},
@@ -316,3 +324,181 @@ def test_aria_label_uses_roman_numeral_for_pressed_fret() -> None:
     horizontal, _ = render_chord_svg(chord)
 
     assert "зажата на 3 ладу" in horizontal
+
+
+@pytest.mark.django_db
+def test_grid_lines_are_merged_into_one_path_per_stroke_width() -> None:
+    chord = _make_chord()
+    horizontal, vertical = render_chord_svg(chord)
+    for svg in (horizontal, vertical):
+        assert "<line" not in svg
+        # 4 string widths, the frets and the nut
+        assert svg.count("<path ") == 6
+
+
+@pytest.mark.django_db
+def test_nut_is_drawn_thick_only_from_first_fret() -> None:
+    _, open_position = render_chord_svg(_make_chord(start_fret=1))
+    _, high_position = render_chord_svg(_make_chord(start_fret=5))
+    assert 'stroke-width="4"' in open_position
+    assert 'stroke-width="4"' not in high_position
+
+
+@pytest.mark.django_db
+def test_finger_marker_is_defined_once_per_finger() -> None:
+    chord = _make_chord(
+        positions=[
+            {"string_number": 1, "fret": 2, "finger": 2},
+            {"string_number": 2, "fret": 2, "finger": 2},
+            {"string_number": 3, "fret": 1, "finger": 1},
+            {"string_number": 4, "fret": 0, "finger": 0},
+            {"string_number": 5, "fret": 0, "finger": 0},
+            {"string_number": 6, "fret": -1, "finger": 0},
+        ]
+    )
+    horizontal, _ = render_chord_svg(chord)
+    assert horizontal.count('<g id="chord-finger-2"') == 1
+    assert horizontal.count('<use href="#chord-finger-2"') == 2
+
+
+@pytest.mark.django_db
+def test_shared_definitions_are_identical_across_chords() -> None:
+    first, _ = render_chord_svg(_make_chord(title="Am"))
+    second, _ = render_chord_svg(_make_chord(title="Dm", has_barre=True))
+
+    def definition(svg: str) -> str:
+        match = re.search(r'<g id="chord-finger-1".*?</g>', svg)
+        assert match is not None
+        return match.group()
+
+    assert definition(first) == definition(second)
+
+
+# =============================================================================
+# Diagram cache
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_chords_with_same_fingering_share_cached_geometry() -> None:
+    am, a7 = _make_chord(title="Am"), _make_chord(title="A7")
+    clear_svg_cache()
+
+    first, _ = render_chord_svg(am)
+    second, _ = render_chord_svg(a7)
+
+    assert svg_cache_info()[:2] == (1, 1)
+    assert first.replace('aria-label="Am', 'aria-label="A7') == second
+
+
+@pytest.mark.django_db
+def test_cached_render_escapes_title() -> None:
+    render_chord_svg(_make_chord(title="Am"))
+
+    horizontal, vertical = render_chord_svg(_make_chord(title='A<m>"'))
+
+    for svg in (horizontal, vertical):
+        assert 'aria-label="A&lt;m&gt;&quot;, ' in svg
+
+
+@pytest.mark.django_db
+def test_different_fingerings_miss_the_cache() -> None:
+    chords = [_make_chord(start_fret=1), _make_chord(start_fret=2)]
+    clear_svg_cache()
+
+    for chord in chords:
+        render_chord_svg(chord)
+
+    assert svg_cache_info()[:2] == (0, 2)
+
+
+@pytest.mark.django_db
+def test_diagram_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first, second, third = (_make_chord(start_fret=n) for n in (1, 2, 3))
+    monkeypatch.setattr(svg_renderer, "_cache", svg_renderer._DiagramCache(2))
+    render_chord_svg(first)
+    render_chord_svg(second)
+    render_chord_svg(first)
+
+    render_chord_svg(third)
+    render_chord_svg(first)
+
+    assert svg_cache_info() == (2, 3, 2)
+
+
+# =============================================================================
+# render_chord_diagram
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_render_chord_diagram_default_matches_stored_svg() -> None:
+    chord = _make_chord()
+
+    svg = render_chord_diagram(chord, "horizontal")
+
+    assert svg == chord.svg_horizontal.replace(
+        "<svg ", '<svg width="217" height="88" ', 1
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("theme", ["dark", "mono"])
+def test_render_chord_diagram_themes_use_own_definition_ids(theme: str) -> None:
+    chord = _make_chord(has_barre=True)
+
+    svg = render_chord_diagram(chord, theme=theme)
+
+    assert f'href="#chord-{theme}-finger-2"' in svg
+    assert "#ffb3c1" not in svg
+
+
+@pytest.mark.django_db
+def test_render_chord_diagram_scales_size() -> None:
+    svg = render_chord_diagram(_make_chord(), scale=0.5)
+
+    assert svg.startswith('<svg width="45.5" height="107" viewBox="0 0 91 214"')
+
+
+# =============================================================================
+# Output size
+# =============================================================================
+
+
+_F_BARRE_POSITIONS: list[ChordPositionCreateDict] = [
+    {"string_number": 1, "fret": 1, "finger": 1},
+    {"string_number": 2, "fret": 1, "finger": 1},
+    {"string_number": 3, "fret": 2, "finger": 2},
+    {"string_number": 4, "fret": 3, "finger": 4},
+    {"string_number": 5, "fret": 3, "finger": 3},
+    {"string_number": 6, "fret": 1, "finger": 1},
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("title", "has_barre", "positions", "budget"),
+    [
+        # Budgets are the measured sizes (1433, 1539, 1736 bytes) plus ~5%.
+        ("Am", False, None, 1500),
+        ("Am", True, None, 1620),
+        ("F", True, _F_BARRE_POSITIONS, 1820),
+    ],
+    ids=["open", "barre", "full-barre"],
+)
+def test_svg_markup_stays_compact(
+    title: str,
+    has_barre: bool,
+    positions: list[ChordPositionCreateDict] | None,
+    budget: int,
+) -> None:
+    """Guard against regressions in size; the label is plain accessible text."""
+    chord = _make_chord(title=title, has_barre=has_barre, positions=positions)
+    horizontal, vertical = render_chord_svg(chord)
+
+    for svg in (horizontal, vertical):
+        markup = re.sub(r'aria-label="[^"]*"', "", svg)
+        assert len(markup.encode()) <= budget
+        assert "0." not in markup.replace('"0 0 ', "")
@@ -8,7 +8,16 @@ import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from apps.chords.services import ChordCreateDict, ChordPositionCreateDict, ChordService
+from apps.chords import services
+from apps.chords.constants import SVG_RENDERER_VERSION
+from apps.chords.models import Chord
+from apps.chords.services import (
+    ChordCreateDict,
+    ChordPositionCreateDict,
+    ChordService,
+    chord_diagram_version,
+)
+from apps.chords.sprite import get_chord_sprite_version
 from apps.chords.tests.factories import FullChordFactory
 
 
@@ -113,3 +122,203 @@ def test_chord_detail_returns_200(
     response = api_client.get(f"/api/v1/chords/{chord.pk}/")
 
     assert response.status_code == status.HTTP_200_OK
+
+
+# =============================================================================
+# ChordLookupView
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_chord_lookup_returns_matching_chords(api_client: APIClient) -> None:
+    chord = _create_dm()
+
+    response = api_client.get("/api/v1/chords/lookup/", {"frets": "x,x,0,2,2,1"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {
+            "id": chord.pk,
+            "title": "Dm",
+            "musical_title": "D minor",
+            "frets": [-1, -1, 0, 2, 2, 1],
+            "shift": 0,
+        }
+    ]
+
+
+@pytest.mark.django_db
+def test_chord_lookup_accepts_compact_frets_with_wildcards(
+    api_client: APIClient,
+) -> None:
+    _create_dm()
+
+    response = api_client.get(
+        "/api/v1/chords/lookup/", {"frets": "**1332", "tolerance": "1"}
+    )
+
+    assert [m["shift"] for m in response.json()] == [-1]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("frets", ["x0221", "x,0,2,2,1,13", "x0221?"])
+def test_chord_lookup_rejects_invalid_frets(api_client: APIClient, frets: str) -> None:
+    response = api_client.get("/api/v1/chords/lookup/", {"frets": frets})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "frets" in response.json()
+
+
+# =============================================================================
+# ChordDiagramView
+# =============================================================================
+
+
+def _create_dm() -> Chord:
+    fields: ChordCreateDict = {
+        "title": "Dm",
+        "musical_title": "D minor",
+        "order_in_note": 1,
+        "start_fret": 1,
+        "has_barre": False,
+    }
+    return ChordService.create_chord(positions=_full_positions(), chord_fields=fields)
+
+
+@pytest.mark.django_db
+def test_chord_diagram_returns_svg(api_client: APIClient) -> None:
+    chord = _create_dm()
+
+    response = api_client.get(f"/api/v1/chords/{chord.pk}/diagram.svg")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "image/svg+xml"
+    assert response.content.decode() == chord.svg_vertical.replace(
+        "<svg ", '<svg width="91" height="214" ', 1
+    )
+
+
+@pytest.mark.django_db
+def test_chord_diagram_applies_parameters(api_client: APIClient) -> None:
+    chord = _create_dm()
+
+    response = api_client.get(
+        f"/api/v1/chords/{chord.pk}/diagram.svg",
+        {"orientation": "horizontal", "theme": "dark", "scale": "2"},
+    )
+
+    svg = response.content.decode()
+    assert 'width="434" height="176" viewBox="0 0 217 88"' in svg
+    assert 'href="#chord-dark-finger-1"' in svg
+    assert "currentColor" not in svg
+
+
+@pytest.mark.django_db
+def test_chord_diagram_rejects_invalid_parameters(api_client: APIClient) -> None:
+    chord = _create_dm()
+
+    response = api_client.get(
+        f"/api/v1/chords/{chord.pk}/diagram.svg", {"theme": "neon", "scale": "100"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert set(response.json()) == {"theme", "scale"}
+
+
+@pytest.mark.django_db
+def test_chord_diagram_returns_404_for_missing_chord(api_client: APIClient) -> None:
+    response = api_client.get("/api/v1/chords/999999/diagram.svg")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_chord_diagram_is_immutable_with_current_diagram_version(
+    api_client: APIClient,
+) -> None:
+    chord = _create_dm()
+    url = f"/api/v1/chords/{chord.pk}/diagram.svg"
+    version = api_client.get(f"/api/v1/chords/{chord.pk}/").json()["diagram_version"]
+
+    current = api_client.get(url, {"v": version})
+    stale = api_client.get(url, {"v": chord.content_hash})
+
+    assert "immutable" in current["Cache-Control"]
+    assert stale["Cache-Control"] == "no-cache"
+
+
+@pytest.mark.django_db
+def test_chord_diagram_version_changes_with_renderer_version(
+    api_client: APIClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    chord = _create_dm()
+    url = f"/api/v1/chords/{chord.pk}/diagram.svg"
+    version = chord_diagram_version(chord)
+
+    monkeypatch.setattr(services, "SVG_RENDERER_VERSION", SVG_RENDERER_VERSION + 1)
+
+    assert chord_diagram_version(chord) != version
+    assert api_client.get(url, {"v": version})["Cache-Control"] == "no-cache"
+
+
+@pytest.mark.django_db
+def test_chord_diagram_returns_304_for_matching_etag(api_client: APIClient) -> None:
+    chord = _create_dm()
+    url = f"/api/v1/chords/{chord.pk}/diagram.svg"
+    etag = api_client.get(url)["ETag"]
+
+    response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_chord_diagram_etag_changes_with_chord(api_client: APIClient) -> None:
+    chord = _create_dm()
+    url = f"/api/v1/chords/{chord.pk}/diagram.svg"
+    before = api_client.get(url)["ETag"]
+
+    ChordService.update_chord(chord=chord, data={"start_fret": 2})
+
+    assert api_client.get(url)["ETag"] != before
+
+
+# =============================================================================
+# ChordSpriteView
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_chord_sprite_returns_svg(api_client: APIClient) -> None:
+    chord = _create_dm()
+
+    response = api_client.get("/api/v1/chords/sprite.svg")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "image/svg+xml"
+    assert f'id="chord-{chord.pk}-v"'.encode() in response.content
+
+
+@pytest.mark.django_db
+def test_chord_sprite_is_immutable_only_for_current_version(
+    api_client: APIClient,
+) -> None:
+    _create_dm()
+
+    current = api_client.get(
+        "/api/v1/chords/sprite.svg", {"v": get_chord_sprite_version()}
+    )
+    stale = api_client.get("/api/v1/chords/sprite.svg", {"v": "0" * 16})
+
+    assert "immutable" in current["Cache-Control"]
+    assert stale["Cache-Control"] == "no-cache"
+
+
+@pytest.mark.django_db
+def test_chord_sprite_returns_304_for_matching_etag(api_client: APIClient) -> None:
+    _create_dm()
+    etag = api_client.get("/api/v1/chords/sprite.svg")["ETag"]
+
+    response = api_client.get("/api/v1/chords/sprite.svg", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
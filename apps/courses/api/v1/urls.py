@@ -6,9 +6,14 @@
 
 from django.urls import path
 
-from .views import CourseDetailView, CoursesListView
+from .views import CourseDetailView, CoursesListView, CourseSongbookView
 
 urlpatterns = [
     path("courses/", CoursesListView.as_view(), name="courses-list"),
     path("courses/<uuid:uuid>/", CourseDetailView.as_view(), name="course-detail"),
+    path(
+        "courses/<uuid:uuid>/songbook/",
+        CourseSongbookView.as_view(),
+        name="course-songbook",
+    ),
 ]
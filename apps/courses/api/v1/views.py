@@ -5,6 +5,7 @@
 """Views for the courses app."""
 
 import logging
+import uuid as uuid_module
 
 from django.db.models import QuerySet
 from django.http import Http404
@@ -12,7 +13,13 @@ from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.permissions import AllowAny
 
 from apps.courses.models import Course
-from apps.courses.selectors import get_course_by_uuid, get_published_courses
+from apps.courses.selectors import (
+    get_course_by_uuid,
+    get_course_for_songbook,
+    get_published_courses,
+)
+from apps.songs.api.v1.views import SongbookPrintView
+from apps.songs.pdf_renderer import Songbook, SongbookSection
 
 from .serializers.course_detail_serializer import CourseDetailSerializer
 from .serializers.courses_list_serializer import CoursesListSerializer
@@ -47,3 +54,24 @@ class CourseDetailView(RetrieveAPIView[Course]):
             raise Http404
         logger.debug("Fetched course: uuid=%s, title=%s", uuid, course.title)
         return course
+
+
+class CourseSongbookView(SongbookPrintView):
+    """Print all songs of a published course as one PDF, lesson by lesson."""
+
+    def get_songbook(self, uuid: uuid_module.UUID) -> Songbook | None:  # noqa: PLR6301
+        """Return one section per lesson with songs, in course order."""
+        course = get_course_for_songbook(uuid)
+        if course is None:
+            return None
+        sections = [
+            SongbookSection(
+                title=course_lesson.lesson.title,
+                songs=list(course_lesson.lesson.songs.all()),
+            )
+            for course_lesson in course.course_lessons.all()
+        ]
+        return Songbook(
+            title=course.title,
+            sections=[section for section in sections if section["songs"]],
+        )
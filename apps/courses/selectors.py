@@ -4,9 +4,12 @@
 
 """Selectors for the courses app."""
 
+import uuid as uuid_module
+
 from django.db.models import Count, Prefetch, Q, QuerySet
 
 from apps.courses.models import Course, CourseLesson
+from apps.songs.models import Song
 
 
 def get_published_courses() -> QuerySet[Course]:
@@ -49,3 +52,29 @@ def get_course_by_uuid(uuid: str) -> Course | None:
         )
         .first()
     )
+
+
+def get_course_for_songbook(uuid: uuid_module.UUID) -> Course | None:
+    """Get a published Course with its published lessons in order and their songs.
+
+    Songs come with chords and schemes prefetched, ready for printing.
+
+    Returns:
+        Course or None if not found.
+    """
+    songs = Song.objects.order_by("id").prefetch_related("chords", "schemes")
+    return (
+        Course.objects
+        .filter(uuid=uuid, is_published=True)
+        .prefetch_related(
+            Prefetch(
+                "course_lessons",
+                queryset=CourseLesson.objects
+                .select_related("lesson")
+                .filter(lesson__is_published=True)
+                .order_by("order")
+                .prefetch_related(Prefetch("lesson__songs", queryset=songs)),
+            ),
+        )
+        .first()
+    )
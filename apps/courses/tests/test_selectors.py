@@ -5,10 +5,17 @@
 """Tests for courses selectors."""
 
 import pytest
-
-from apps.courses.selectors import get_course_by_uuid, get_published_courses
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.courses.selectors import (
+    get_course_by_uuid,
+    get_course_for_songbook,
+    get_published_courses,
+)
 from apps.courses.tests.factories import CourseFactory, CourseLessonFactory
 from apps.lessons.tests.factories import LessonFactory
+from apps.songs.tests.factories import SongFactory
 
 
 @pytest.mark.django_db
@@ -56,3 +63,31 @@ def test_get_course_by_uuid_filters_unpublished_lessons() -> None:
     assert result is not None
     lesson_titles = [cl.lesson.title for cl in result.course_lessons.all()]
     assert lesson_titles == ["Published"]
+
+
+@pytest.mark.django_db
+def test_get_course_for_songbook_orders_lessons_and_prefetches_songs() -> None:
+    course = CourseFactory.create()
+    for order, title in ((2, "Second"), (1, "First")):
+        lesson = LessonFactory.create(title=title)
+        lesson.songs.add(SongFactory.create(chords=1, schemes=1))
+        CourseLessonFactory.create(course=course, lesson=lesson, order=order)
+
+    result = get_course_for_songbook(course.uuid)
+
+    assert result is not None
+    with CaptureQueriesContext(connection) as queries:
+        titles = [cl.lesson.title for cl in result.course_lessons.all()]
+        for cl in result.course_lessons.all():
+            for song in cl.lesson.songs.all():
+                list(song.chords.all())
+                list(song.schemes.all())
+    assert titles == ["First", "Second"]
+    assert len(queries) == 0
+
+
+@pytest.mark.django_db
+def test_get_course_for_songbook_returns_none_for_unpublished() -> None:
+    course = CourseFactory.create(is_published=False)
+
+    assert get_course_for_songbook(course.uuid) is None
@@ -11,7 +11,10 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from apps.courses.tests.factories import CourseFactory
+from apps.courses.tests.factories import CourseFactory, CourseLessonFactory
+from apps.lessons.tests.factories import LessonFactory
+from apps.songs.models import PrintJob
+from apps.songs.tests.factories import SongFactory
 
 
 @pytest.fixture
@@ -101,3 +104,53 @@ def test_course_detail_returns_404_for_unpublished(api_client: APIClient) -> Non
     response = api_client.get(reverse("course-detail", kwargs={"uuid": course.uuid}))
 
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# =============================================================================
+# CourseSongbookView tests
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_course_songbook_has_a_section_per_lesson_in_course_order(
+    api_client: APIClient,
+) -> None:
+    """POST /courses/{uuid}/songbook/ queues lessons with songs in order."""
+    course = CourseFactory.create(title="Курс")
+    shared = SongFactory.create()
+    for order, title, songs in (
+        (3, "Third", [shared]),
+        (1, "First", [shared, SongFactory.create()]),
+        (2, "Empty", []),
+    ):
+        lesson = LessonFactory.create(title=title)
+        lesson.songs.add(*songs)
+        CourseLessonFactory.create(course=course, lesson=lesson, order=order)
+    CourseLessonFactory.create(
+        course=course,
+        lesson=LessonFactory.create(title="Hidden", is_published=False),
+        order=4,
+    )
+
+    response = api_client.post(
+        reverse("course-songbook", kwargs={"uuid": course.uuid}), data={}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data["title"] == "Курс"
+    songbook = PrintJob.objects.get(uuid=response.data["uuid"]).songbook
+    assert songbook is not None
+    assert [s["title"] for s in songbook["sections"]] == ["First", "Third"]
+    assert songbook["sections"][1]["songs"] == [str(shared.uuid)]
+
+
+@pytest.mark.django_db
+def test_course_songbook_returns_404_for_unpublished(api_client: APIClient) -> None:
+    """POST /courses/{uuid}/songbook/ returns 404 for unpublished course."""
+    course = CourseFactory.create(is_published=False)
+
+    response = api_client.post(
+        reverse("course-songbook", kwargs={"uuid": course.uuid}), data={}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
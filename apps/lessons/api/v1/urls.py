@@ -6,9 +6,14 @@
 
 from django.urls import path
 
-from .views import LessonDetailView, LessonsListView
+from .views import LessonDetailView, LessonsListView, LessonSongbookView
 
 urlpatterns = [
     path("lessons/", LessonsListView.as_view(), name="lessons-list"),
     path("lessons/<uuid:uuid>/", LessonDetailView.as_view(), name="lesson-detail"),
+    path(
+        "lessons/<uuid:uuid>/songbook/",
+        LessonSongbookView.as_view(),
+        name="lesson-songbook",
+    ),
 ]
@@ -5,6 +5,7 @@
 """Views for the lessons app."""
 
 import logging
+import uuid as uuid_module
 
 from django.db.models import QuerySet
 from django.http import Http404
@@ -18,8 +19,11 @@ from apps.lessons.models import Lesson
 from apps.lessons.selectors import (
     get_course_for_lesson,
     get_lesson_by_uuid,
+    get_lesson_for_songbook,
     get_published_lessons,
 )
+from apps.songs.api.v1.views import SongbookPrintView
+from apps.songs.pdf_renderer import Songbook, SongbookSection
 
 from .serializers.lesson_detail_serializer import LessonDetailSerializer
 from .serializers.lessons_list_serializer import LessonsListSerializer
@@ -75,3 +79,17 @@ class LessonDetailView(RetrieveAPIView[Lesson]):
         context = {**self.get_serializer_context(), "course": course}
         serializer = self.get_serializer(lesson, context=context)
         return Response(serializer.data)
+
+
+class LessonSongbookView(SongbookPrintView):
+    """Print all songs of a published lesson as one PDF."""
+
+    def get_songbook(self, uuid: uuid_module.UUID) -> Songbook | None:  # noqa: PLR6301
+        """Return the lesson's songs as a single untitled section."""
+        lesson = get_lesson_for_songbook(uuid)
+        if lesson is None:
+            return None
+        return Songbook(
+            title=lesson.title,
+            sections=[SongbookSection(title="", songs=list(lesson.songs.all()))],
+        )
@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 19:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lessons", "0002_add_updated_at"),
+        ("songs", "0003_add_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="lesson",
+            index=models.Index(
+                fields=["updated_at", "id"], name="lesson_updated_at_id_idx"
+            ),
+        ),
+    ]
@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import uuid
+from typing import ClassVar
 
 from django.db import models
 
@@ -74,6 +75,10 @@ class Lesson(models.Model):
     class Meta:
         verbose_name = "Урок"
         verbose_name_plural = "Уроки"
+        indexes: ClassVar[list[models.Index]] = [
+            # Keyset order of the streaming sync endpoint.
+            models.Index(fields=("updated_at", "id"), name="lesson_updated_at_id_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Lesson: '{self.title}'"
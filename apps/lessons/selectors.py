@@ -10,6 +10,7 @@ from django.db.models import Prefetch, QuerySet
 
 from apps.courses.models import Course
 from apps.lessons.models import Lesson
+from apps.songs.models import Song
 
 
 def get_published_lessons() -> QuerySet[Lesson]:
@@ -46,3 +47,20 @@ def get_lesson_by_uuid(uuid: str) -> Lesson | None:
         )
         .first()
     )
+
+
+def get_lesson_for_songbook(uuid: uuid_module.UUID) -> Lesson | None:
+    """Return a published Lesson with songs, chords and schemes, or None."""
+    return (
+        Lesson.objects
+        .filter(uuid=uuid, is_published=True)
+        .prefetch_related(
+            Prefetch(
+                "songs",
+                queryset=Song.objects.order_by("id").prefetch_related(
+                    "chords", "schemes"
+                ),
+            ),
+        )
+        .first()
+    )
@@ -10,9 +10,11 @@ from apps.courses.tests.factories import CourseFactory
 from apps.lessons.selectors import (
     get_course_for_lesson,
     get_lesson_by_uuid,
+    get_lesson_for_songbook,
     get_published_lessons,
 )
 from apps.lessons.tests.factories import LessonFactory
+from apps.songs.tests.factories import SongFactory
 
 
 @pytest.mark.django_db
@@ -97,3 +99,22 @@ def test_get_lesson_by_uuid_filters_unpublished_addition_lessons() -> None:
     assert result is not None
     addition_titles = [lesson.title for lesson in result.addition_lessons.all()]
     assert addition_titles == ["Published"]
+
+
+@pytest.mark.django_db
+def test_get_lesson_for_songbook_orders_songs_by_id() -> None:
+    lesson = LessonFactory.create()
+    songs = [SongFactory.create() for _ in range(3)]
+    lesson.songs.add(*reversed(songs))
+
+    result = get_lesson_for_songbook(lesson.uuid)
+
+    assert result is not None
+    assert list(result.songs.all()) == songs
+
+
+@pytest.mark.django_db
+def test_get_lesson_for_songbook_returns_none_for_unpublished() -> None:
+    lesson = LessonFactory.create(is_published=False)
+
+    assert get_lesson_for_songbook(lesson.uuid) is None
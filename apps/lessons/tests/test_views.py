@@ -13,6 +13,9 @@ from rest_framework.test import APIClient
 
 from apps.courses.tests.factories import CourseFactory
 from apps.lessons.tests.factories import LessonFactory
+from apps.songs.constants import PRINT_JOB_QUEUE_LIMIT
+from apps.songs.models import PrintJob
+from apps.songs.tests.factories import PrintJobFactory, SongFactory
 
 
 @pytest.fixture
@@ -164,3 +167,58 @@ def test_lesson_detail_course_contains_uuid_and_title_when_valid_course_param(
 
     expected = {"uuid": str(course.uuid), "title": "Джаз для гитаристов"}
     assert response.data["course"] == expected
+
+
+# =============================================================================
+# LessonSongbookView tests
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_lesson_songbook_queues_print_job_of_lesson_songs(
+    api_client: APIClient,
+) -> None:
+    lesson = LessonFactory.create(title="Звёздочка")
+    songs = [SongFactory.create() for _ in range(2)]
+    lesson.songs.add(*songs)
+
+    response = api_client.post(
+        reverse("lesson-songbook", kwargs={"uuid": lesson.uuid}),
+        data={"show_chords": False},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job = PrintJob.objects.get(uuid=response.data["uuid"])
+    assert response["Location"].endswith(f"/print-jobs/{job.uuid}/")
+    assert response.data["song"] is None
+    assert response.data["title"] == "Звёздочка"
+    assert job.songbook is not None
+    assert job.songbook["sections"][0]["songs"] == [str(s.uuid) for s in songs]
+    assert job.settings["show_chords"] is False
+
+
+@pytest.mark.django_db
+def test_lesson_songbook_returns_404_for_unpublished(api_client: APIClient) -> None:
+    lesson = LessonFactory.create(is_published=False)
+
+    response = api_client.post(
+        reverse("lesson-songbook", kwargs={"uuid": lesson.uuid}), data={}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_lesson_songbook_returns_429_when_queue_is_full(
+    api_client: APIClient,
+) -> None:
+    PrintJobFactory.create_batch(PRINT_JOB_QUEUE_LIMIT)
+    lesson = LessonFactory.create()
+
+    response = api_client.post(
+        reverse("lesson-songbook", kwargs={"uuid": lesson.uuid}), data={}, format="json"
+    )
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert PrintJob.objects.count() == PRINT_JOB_QUEUE_LIMIT
@@ -56,6 +56,61 @@ http_response_size_bytes = Histogram(
     registry=get_registry(),
 )
 
+# Sync metrics
+
+sync_response_size_bytes = Histogram(
+    name=f"{METRIC_PREFIX}sync_response_size_bytes",
+    documentation="Size of full-sync response bodies in bytes by content encoding.",
+    labelnames=["encoding"],
+    buckets=SIZE_BUCKETS_BYTES,
+    registry=get_registry(),
+)
+
+# Print metrics
+
+print_cache_requests_total = Counter(
+    name=f"{METRIC_PREFIX}print_cache_requests_total",
+    documentation="Song PDF cache lookups by result (hit or miss).",
+    labelnames=["result"],
+    registry=get_registry(),
+)
+
+print_queue_wait_seconds = Histogram(
+    name=f"{METRIC_PREFIX}print_queue_wait_seconds",
+    documentation="Time print requests waited for a render slot in seconds.",
+    buckets=DURATION_BUCKETS,
+    registry=get_registry(),
+)
+
+print_render_duration_seconds = Histogram(
+    name=f"{METRIC_PREFIX}print_render_duration_seconds",
+    documentation="PDF layout time in the print pool in seconds.",
+    buckets=DURATION_BUCKETS,
+    registry=get_registry(),
+)
+
+print_rejected_total = Counter(
+    name=f"{METRIC_PREFIX}print_rejected_total",
+    documentation="Print requests rejected by the print pool by reason.",
+    labelnames=["reason"],
+    registry=get_registry(),
+)
+
+print_warmup_duration_seconds = Gauge(
+    name=f"{METRIC_PREFIX}print_warmup_duration_seconds",
+    documentation="Time the WeasyPrint warm-up took at process start in seconds.",
+    registry=get_registry(),
+)
+
+# Chord metrics
+
+chord_svg_cache_requests_total = Counter(
+    name=f"{METRIC_PREFIX}chord_svg_cache_requests_total",
+    documentation="Chord diagram geometry cache lookups by result (hit or miss).",
+    labelnames=["result"],
+    registry=get_registry(),
+)
+
 # Application info metrics
 
 app_info = Gauge(
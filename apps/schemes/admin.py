@@ -8,6 +8,7 @@
 from django.contrib import admin
 
 from apps.schemes.models import ImageScheme
+from apps.schemes.services import ImageSchemeService
 
 
 @admin.register(ImageScheme)
@@ -16,3 +17,13 @@ class ImageSchemeAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
 
     list_display = ("code", "inscription", "image")
     search_fields = ("code", "inscription")
+
+    def save_model(  # noqa: PLR6301
+        self,
+        request: object,
+        obj: ImageScheme,
+        form: object,
+        change: object,
+    ) -> None:
+        """Save the scheme through the service so its content hash is refreshed."""
+        ImageSchemeService.save_scheme(obj)
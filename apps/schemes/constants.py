@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Constants for the schemes app."""
+
+from typing import Final
+
+SCHEME_PRINT_WIDTH: Final[int] = 780
+"""Pixel width of the print variant: the largest print size (260px) at 3x."""
+
+SCHEME_THUMBNAIL_WIDTHS: Final[tuple[int, ...]] = (240, 480)
+"""Pixel widths of the WebP thumbnails served to mobile clients."""
+
+DIMENSIONS_BATCH_SIZE: Final[int] = 500
+"""Schemes read and written per batch when recalculating image dimensions."""
+
+DIMENSIONS_WORKERS: Final[int] = 8
+"""Threads reading image headers in parallel; the work is I/O bound."""
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Downscaled variants of rhythm scheme images.
+
+Prints embed a PNG sized for the largest print width instead of the
+original upload, and mobile clients download WebP thumbnails at fixed
+widths. Images narrower than a variant are re-encoded, never upscaled.
+"""
+
+from io import BytesIO
+
+from django.core.files.storage import Storage
+from PIL import Image as PilImage
+
+
+def render_variant(image: PilImage.Image, width: int, image_format: str) -> bytes:
+    """Return `image` scaled down to at most `width` pixels and encoded.
+
+    Args:
+        image: Source image, already loaded.
+        width: Maximum width of the variant in pixels.
+        image_format: Pillow format name, e.g. "PNG" or "WEBP".
+    """
+    if image.mode not in {"RGB", "RGBA"}:
+        image = image.convert("RGBA")
+    if image.width > width:
+        height = max(1, round(image.height * width / image.width))
+        image = image.resize((width, height), PilImage.Resampling.LANCZOS)
+    buffer = BytesIO()
+    image.save(buffer, format=image_format, optimize=True)
+    return buffer.getvalue()
+
+
+def thumbnail_urls(thumbnails: dict[str, str], storage: Storage) -> dict[str, str]:
+    """Return the storage URLs of thumbnail file names, narrowest first."""
+    return {
+        width: storage.url(thumbnails[width]) for width in sorted(thumbnails, key=int)
+    }
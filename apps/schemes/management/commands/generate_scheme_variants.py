@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Management command to generate print and thumbnail variants of scheme images."""
+
+from argparse import ArgumentParser
+
+from django.core.management.base import BaseCommand
+
+from apps.schemes.services import ImageSchemeService
+
+
+class Command(BaseCommand):
+    """Generate the print PNG and WebP thumbnails of image schemes."""
+
+    help = (
+        "Generate the print PNG and WebP thumbnails of image schemes that have "
+        "none yet (or of every scheme with --all)."
+    )
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: PLR6301
+        """Add the --all flag."""
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate variants of every scheme, not only missing ones.",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Render the variants and store them with the refreshed content hashes."""
+        updated = ImageSchemeService.bulk_generate_variants(
+            only_missing=not options["all"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} image scheme(s)."))
@@ -4,6 +4,8 @@
 
 """Management command to recalculate image dimensions for all image schemes."""
 
+from argparse import ArgumentParser
+
 from django.core.management.base import BaseCommand
 
 from apps.schemes.services import ImageSchemeService
@@ -14,7 +16,21 @@ class Command(BaseCommand):
 
     help = "Recalculate width and height for every ImageScheme from the actual file."
 
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: PLR6301
+        """Add the --force flag."""
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Read every file, even those unchanged since the last run.",
+        )
+
     def handle(self, *args: object, **options: object) -> None:
         """Read each image file and update the width/height fields in the database."""
-        updated = ImageSchemeService.bulk_recalculate_dimensions()
+        updated = ImageSchemeService.bulk_recalculate_dimensions(
+            force=bool(options["force"]), progress=self._progress
+        )
         self.stdout.write(self.style.SUCCESS(f"Updated {updated} image scheme(s)."))
+
+    def _progress(self, checked: int, total: int) -> None:
+        """Report how many schemes have been checked so far."""
+        self.stdout.write(f"Checked {checked}/{total} image scheme(s).")
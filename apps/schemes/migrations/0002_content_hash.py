@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 20:02
+
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+
+from apps.shared.hashing import content_hash
+
+
+def fill_hashes(apps: Apps, _schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Hash existing schemes the way `scheme_content_hash` does."""
+    ImageScheme = apps.get_model("schemes", "ImageScheme")
+    schemes = list(ImageScheme.objects.all())
+    for scheme in schemes:
+        scheme.content_hash = content_hash(
+            scheme.image.name, scheme.inscription, scheme.height, scheme.width
+        )
+    ImageScheme.objects.bulk_update(schemes, ["content_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schemes", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="imagescheme",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Меняется вместе с данными рисунка, которые получает клиент",
+                max_length=16,
+                verbose_name="Хеш содержимого",
+            ),
+        ),
+        migrations.RunPython(fill_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 20:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schemes", "0002_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="imagescheme",
+            name="print_image",
+            field=models.ImageField(
+                blank=True,
+                editable=False,
+                help_text="Создаётся из изображения при сохранении",
+                max_length=255,
+                upload_to="lesson_schemes/print/",
+                verbose_name="Изображение для печати",
+            ),
+        ),
+        migrations.AddField(
+            model_name="imagescheme",
+            name="thumbnails",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                help_text="Файлы WebP по ширине в пикселях, создаются при сохранении",
+                verbose_name="Миниатюры",
+            ),
+        ),
+    ]
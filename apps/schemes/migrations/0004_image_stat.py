@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 20:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("schemes", "0003_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="imagescheme",
+            name="image_stat",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Размер и время изменения файла при последнем чтении размеров",
+                max_length=64,
+                verbose_name="Отпечаток файла",
+            ),
+        ),
+    ]
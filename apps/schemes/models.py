@@ -7,6 +7,8 @@
 
 from django.db import models
 
+from apps.shared.hashing import CONTENT_HASH_LENGTH
+
 
 class ImageScheme(models.Model):
     """Main model for rhythm scheme image.
@@ -17,6 +19,11 @@ class ImageScheme(models.Model):
         height (int): original image height
         width (int): original image width
         image (image): image file path
+        print_image (image): downscaled PNG embedded into prints
+        thumbnails (dict): WebP thumbnail file paths by width in pixels
+        image_stat (str): size and mtime of the image file when its
+            dimensions were last read, see `bulk_recalculate_dimensions`
+        content_hash (str): hash of the synced fields, see `scheme_content_hash`
     """
 
     code = models.CharField(
@@ -35,6 +42,37 @@ class ImageScheme(models.Model):
         width_field="width",
         max_length=255,
     )
+    print_image = models.ImageField(
+        "Изображение для печати",
+        upload_to="lesson_schemes/print/",
+        max_length=255,
+        blank=True,
+        editable=False,
+        help_text="Создаётся из изображения при сохранении",
+    )
+    thumbnails = models.JSONField(
+        "Миниатюры",
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Файлы WebP по ширине в пикселях, создаются при сохранении",
+    )
+    image_stat = models.CharField(
+        "Отпечаток файла",
+        max_length=64,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Размер и время изменения файла при последнем чтении размеров",
+    )
+    content_hash = models.CharField(
+        "Хеш содержимого",
+        max_length=CONTENT_HASH_LENGTH,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Меняется вместе с данными рисунка, которые получает клиент",
+    )
 
     class Meta:
         verbose_name = "Бой или схема (рисунок)"
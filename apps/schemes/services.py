@@ -4,25 +4,203 @@
 
 """Services for the schemes app."""
 
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import batched
+from pathlib import Path
+from typing import Any
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
 from PIL import Image as PilImage
 
+from apps.shared.hashing import content_hash
+from apps.sync.services import bump_content_clock
+
+from .constants import (
+    DIMENSIONS_BATCH_SIZE,
+    DIMENSIONS_WORKERS,
+    SCHEME_PRINT_WIDTH,
+    SCHEME_THUMBNAIL_WIDTHS,
+)
+from .image_variants import render_variant
 from .models import ImageScheme
 from .selectors import get_all_image_schemes
 
+logger = logging.getLogger("schemes")
+
+_VARIANT_FIELDS = ["print_image", "thumbnails", "content_hash"]
+_DIMENSION_FIELDS = ["width", "height", "image_stat", "content_hash"]
+# Everything `scheme_content_hash` needs, read without model instances: a
+# loaded ImageScheme with empty dimensions opens its file in __init__.
+_DIMENSION_ROWS = (
+    "pk",
+    "image",
+    "inscription",
+    "height",
+    "width",
+    "print_image",
+    "thumbnails",
+    "image_stat",
+    "content_hash",
+)
+
+
+def scheme_content_hash(scheme: ImageScheme) -> str:
+    """Return the hash of everything the sync payload carries for `scheme`."""
+    return content_hash(
+        scheme.image.name,
+        scheme.inscription,
+        scheme.height,
+        scheme.width,
+        scheme.print_image.name,
+        scheme.thumbnails,
+    )
+
 
 class ImageSchemeService:
     """Business logic for the ImageScheme entity."""
 
     @staticmethod
-    def bulk_recalculate_dimensions() -> int:
-        """Read every image file from disk and update width/height in the DB.
+    def save_scheme(scheme: ImageScheme) -> None:
+        """Persist a scheme, its image variants and its content hash.
+
+        Variants are generated when the image was replaced or has none yet.
+        Both are done after saving because storage may rename an uploaded
+        file; they are written with a second, narrow save only when needed.
+        """
+        previous_image = (
+            ImageScheme.objects
+            .filter(pk=scheme.pk)
+            .values_list("image", flat=True)
+            .first()
+        )
+        scheme.save()
+        update_fields = []
+        if scheme.image and (
+            scheme.image.name != previous_image or not scheme.print_image
+        ):
+            ImageSchemeService.generate_variants(scheme)
+            update_fields += ["print_image", "thumbnails"]
+        new_hash = scheme_content_hash(scheme)
+        if new_hash != scheme.content_hash:
+            scheme.content_hash = new_hash
+            update_fields.append("content_hash")
+        if update_fields:
+            scheme.save(update_fields=update_fields)
+
+    @staticmethod
+    def generate_variants(scheme: ImageScheme) -> None:
+        """Render the print PNG and WebP thumbnails of the scheme image.
+
+        Files of the previous variants are deleted. The instance is updated
+        but not saved.
+        """
+        storage = scheme.image.storage
+        for name in [scheme.print_image.name, *scheme.thumbnails.values()]:
+            if name:
+                storage.delete(name)
+
+        stem = Path(str(scheme.image.name)).stem
+        with scheme.image.open("rb") as file, PilImage.open(file) as image:
+            image.load()
+            scheme.print_image.save(
+                f"{stem}.png",
+                ContentFile(render_variant(image, SCHEME_PRINT_WIDTH, "PNG")),
+                save=False,
+            )
+            scheme.thumbnails = {
+                str(width): storage.save(
+                    f"lesson_schemes/thumbnails/{stem}-{width}.webp",
+                    ContentFile(render_variant(image, width, "WEBP")),
+                )
+                for width in SCHEME_THUMBNAIL_WIDTHS
+            }
+
+    @staticmethod
+    def bulk_generate_variants(*, only_missing: bool = True) -> int:
+        """Generate image variants of schemes and refresh their hashes.
+
+        Args:
+            only_missing: Skip schemes that already have a print variant.
 
         Returns:
             int: Number of updated records.
         """
-        schemes = list(get_all_image_schemes())
-        for scheme in schemes:
-            with PilImage.open(scheme.image.path) as img:
-                scheme.width, scheme.height = img.size
-        ImageScheme.objects.bulk_update(schemes, ["width", "height"])
-        return len(schemes)
+        schemes = get_all_image_schemes().exclude(image="")
+        if only_missing:
+            schemes = schemes.filter(print_image="")
+        updated = list(schemes)
+        for scheme in updated:
+            ImageSchemeService.generate_variants(scheme)
+            scheme.content_hash = scheme_content_hash(scheme)
+        ImageScheme.objects.bulk_update(updated, _VARIANT_FIELDS)
+        bump_content_clock()
+        return len(updated)
+
+    @staticmethod
+    def bulk_recalculate_dimensions(
+        *,
+        force: bool = False,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> int:
+        """Read image sizes from the files and update width/height in the DB.
+
+        Schemes are streamed in batches of `DIMENSIONS_BATCH_SIZE`: image
+        headers of a batch are read by a thread pool, then the changed rows
+        are written with one `bulk_update`. Files whose size and mtime match
+        `image_stat` from the previous run are skipped unless `force`.
+        Unreadable files are logged and skipped.
+
+        Args:
+            force: Read every file, even unchanged ones.
+            progress: Called with (checked, total) after every batch.
+
+        Returns:
+            int: Number of updated records.
+        """
+        schemes = get_all_image_schemes().exclude(image="")
+        total = schemes.count()
+        storage = ImageScheme._meta.get_field("image").storage
+        checked = updated = 0
+        with ThreadPoolExecutor(max_workers=DIMENSIONS_WORKERS) as pool:
+            rows = schemes.values(*_DIMENSION_ROWS).iterator(DIMENSIONS_BATCH_SIZE)
+            for batch in batched(rows, DIMENSIONS_BATCH_SIZE, strict=False):
+                probes = pool.map(lambda row: _probe(storage, row, force=force), batch)
+                changed = [scheme for scheme in probes if scheme is not None]
+                ImageScheme.objects.bulk_update(changed, _DIMENSION_FIELDS)
+                checked += len(batch)
+                updated += len(changed)
+                if progress is not None:
+                    progress(checked, total)
+        if updated:
+            bump_content_clock()
+        return updated
+
+
+def _probe(storage: Storage, row: dict[str, Any], *, force: bool) -> ImageScheme | None:
+    """Read the image size of a scheme row from the file header.
+
+    Returns:
+        ImageScheme | None: Unsaved instance with refreshed dimensions,
+            stat and hash, or None if nothing changed or the file is
+            unreadable.
+    """
+    name = row["image"]
+    try:
+        stat = f"{storage.size(name)}:{storage.get_modified_time(name).timestamp()}"
+        if stat == row["image_stat"] and not force:
+            return None
+        with storage.open(name) as file, PilImage.open(file) as image:
+            width, height = image.size
+    except OSError:  # also raised by Pillow for unrecognized images
+        logger.warning("Could not read scheme image: %s", name, exc_info=True)
+        return None
+    if (width, height, stat) == (row["width"], row["height"], row["image_stat"]):
+        return None
+    scheme = ImageScheme(
+        **(row | {"width": width, "height": height, "image_stat": stat})
+    )
+    scheme.content_hash = scheme_content_hash(scheme)
+    return scheme
@@ -7,6 +7,7 @@ from django.contrib.admin import AdminSite
 
 from apps.schemes.admin import ImageSchemeAdmin
 from apps.schemes.models import ImageScheme
+from apps.schemes.tests.factories import ImageSchemeFactory
 
 
 @pytest.mark.django_db
@@ -14,3 +15,14 @@ def test_chord_position_inline_configuration(admin_site: AdminSite) -> None:
     image_scheme_admin = ImageSchemeAdmin(ImageScheme, admin_site)
     assert image_scheme_admin.list_display == ("code", "inscription", "image")
     assert image_scheme_admin.search_fields == ("code", "inscription")
+
+
+@pytest.mark.django_db
+def test_save_model_sets_content_hash(admin_site: AdminSite) -> None:
+    image_scheme_admin = ImageSchemeAdmin(ImageScheme, admin_site)
+    scheme = ImageSchemeFactory.build()
+
+    image_scheme_admin.save_model(None, scheme, None, change=False)
+
+    scheme.refresh_from_db()
+    assert scheme.content_hash
@@ -4,6 +4,8 @@
 
 """Tests for schemes management commands."""
 
+from io import StringIO
+
 import pytest
 from django.core.management import call_command
 
@@ -41,3 +43,29 @@ def test_recalculate_image_dimensions_updates_all_schemes() -> None:
     call_command("recalculate_image_dimensions")
 
     assert ImageScheme.objects.filter(width__gt=0, height__gt=0).count() == 3
+
+
+@pytest.mark.django_db
+def test_recalculate_image_dimensions_force_rereads_unchanged_files(
+    image_scheme: ImageScheme,
+) -> None:
+    call_command("recalculate_image_dimensions")
+    ImageScheme.objects.filter(pk=image_scheme.pk).update(width=0)
+    out = StringIO()
+
+    call_command("recalculate_image_dimensions", "--force", stdout=out)
+
+    image_scheme.refresh_from_db()
+    assert image_scheme.width == 800
+    assert "Checked 1/1 image scheme(s)." in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_generate_scheme_variants_fills_missing_variants(
+    image_scheme: ImageScheme,
+) -> None:
+    call_command("generate_scheme_variants")
+
+    image_scheme.refresh_from_db()
+    assert image_scheme.print_image
+    assert set(image_scheme.thumbnails) == {"240", "480"}
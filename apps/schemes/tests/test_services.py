@@ -0,0 +1,209 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for the schemes services."""
+
+from pathlib import Path
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image as PilImage
+
+from apps.schemes import services
+from apps.schemes.models import ImageScheme
+from apps.schemes.services import ImageSchemeService, scheme_content_hash
+from apps.schemes.tests.factories import ImageSchemeFactory
+
+
+@pytest.mark.django_db
+def test_save_scheme_sets_content_hash() -> None:
+    scheme = ImageSchemeFactory.build()
+
+    ImageSchemeService.save_scheme(scheme)
+
+    scheme.refresh_from_db()
+    assert scheme.content_hash == scheme_content_hash(scheme)
+
+
+@pytest.mark.django_db
+def test_save_scheme_hashes_the_stored_file_name(image_scheme: ImageScheme) -> None:
+    taken_name = Path(str(image_scheme.image.name)).name
+    duplicate = ImageSchemeFactory.build(image__filename=taken_name)
+
+    ImageSchemeService.save_scheme(duplicate)
+
+    duplicate.refresh_from_db()
+    assert duplicate.image.name != image_scheme.image.name
+    assert duplicate.content_hash == scheme_content_hash(duplicate)
+
+
+@pytest.mark.django_db
+def test_save_scheme_changes_content_hash_with_inscription(
+    image_scheme: ImageScheme,
+) -> None:
+    ImageSchemeService.save_scheme(image_scheme)
+    old_hash = image_scheme.content_hash
+
+    image_scheme.inscription = "Бой шестёрка"
+    ImageSchemeService.save_scheme(image_scheme)
+
+    assert image_scheme.content_hash != old_hash
+
+
+@pytest.mark.django_db
+def test_bulk_recalculate_dimensions_refreshes_content_hash(
+    image_scheme: ImageScheme,
+) -> None:
+    ImageScheme.objects.filter(pk=image_scheme.pk).update(width=0, content_hash="")
+
+    ImageSchemeService.bulk_recalculate_dimensions()
+
+    image_scheme.refresh_from_db()
+    assert image_scheme.content_hash == scheme_content_hash(image_scheme)
+
+
+@pytest.mark.django_db
+def test_bulk_recalculate_dimensions_skips_unchanged_files(
+    image_scheme: ImageScheme,
+) -> None:
+    assert ImageSchemeService.bulk_recalculate_dimensions() == 1
+    ImageScheme.objects.filter(pk=image_scheme.pk).update(width=1)
+
+    assert ImageSchemeService.bulk_recalculate_dimensions() == 0
+    assert ImageSchemeService.bulk_recalculate_dimensions(force=True) == 1
+
+    image_scheme.refresh_from_db()
+    assert image_scheme.width == 800
+
+
+@pytest.mark.django_db
+def test_bulk_recalculate_dimensions_rereads_replaced_files(
+    image_scheme: ImageScheme,
+) -> None:
+    ImageSchemeService.bulk_recalculate_dimensions()
+    with default_storage.open(str(image_scheme.image.name), "wb") as file:
+        PilImage.new("RGB", (20, 10)).save(file, format="PNG")
+
+    assert ImageSchemeService.bulk_recalculate_dimensions() == 1
+
+    image_scheme.refresh_from_db()
+    assert (image_scheme.width, image_scheme.height) == (20, 10)
+
+
+@pytest.mark.django_db
+def test_bulk_recalculate_dimensions_skips_missing_files(
+    image_scheme: ImageScheme,
+) -> None:
+    missing = ImageSchemeFactory.create()
+    default_storage.delete(str(missing.image.name))
+    ImageScheme.objects.update(width=0)
+
+    assert ImageSchemeService.bulk_recalculate_dimensions() == 1
+
+    stat = ImageScheme.objects.values_list("image_stat", flat=True).get(pk=missing.pk)
+    assert not stat
+
+
+@pytest.mark.django_db
+def test_bulk_recalculate_dimensions_reports_progress_per_batch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(services, "DIMENSIONS_BATCH_SIZE", 2)
+    ImageSchemeFactory.create_batch(3)
+    calls: list[tuple[int, int]] = []
+
+    ImageSchemeService.bulk_recalculate_dimensions(
+        progress=lambda checked, total: calls.append((checked, total))
+    )
+
+    assert calls == [(2, 3), (3, 3)]
+
+
+def _width(name: str) -> int:
+    with default_storage.open(name) as file, PilImage.open(file) as image:
+        return image.width
+
+
+@pytest.mark.django_db
+def test_save_scheme_generates_image_variants() -> None:
+    scheme = ImageSchemeFactory.build()
+
+    ImageSchemeService.save_scheme(scheme)
+
+    scheme.refresh_from_db()
+    assert str(scheme.print_image.name).endswith(".png")
+    assert scheme.print_image.width == 780
+    assert list(scheme.thumbnails) == ["240", "480"]
+    assert [_width(name) for name in scheme.thumbnails.values()] == [240, 480]
+    assert scheme.content_hash == scheme_content_hash(scheme)
+
+
+@pytest.mark.django_db
+def test_save_scheme_keeps_variants_when_image_is_unchanged() -> None:
+    scheme = ImageSchemeFactory.build()
+    ImageSchemeService.save_scheme(scheme)
+    print_image = scheme.print_image.name
+
+    scheme.inscription = "Бой восьмёрка"
+    ImageSchemeService.save_scheme(scheme)
+
+    assert scheme.print_image.name == print_image
+
+
+@pytest.mark.django_db
+def test_save_scheme_replaces_variants_of_a_new_image() -> None:
+    scheme = ImageSchemeFactory.build()
+    ImageSchemeService.save_scheme(scheme)
+    old_files = [scheme.print_image.name, *scheme.thumbnails.values()]
+
+    scheme.image = ImageSchemeFactory.build(image__filename="new.png").image
+    ImageSchemeService.save_scheme(scheme)
+
+    storage = scheme.image.storage
+    assert not any(storage.exists(name) for name in old_files)
+    assert str(scheme.print_image.name).startswith("lesson_schemes/print/new")
+
+
+@pytest.mark.django_db
+def test_generate_variants_does_not_upscale_small_images() -> None:
+    scheme = ImageSchemeFactory.build(image__width=100, image__height=50)
+    ImageSchemeService.save_scheme(scheme)
+
+    assert scheme.print_image.width == 100
+    assert [_width(name) for name in scheme.thumbnails.values()] == [100, 100]
+
+
+@pytest.mark.django_db
+def test_generate_variants_converts_palette_images() -> None:
+    scheme = ImageSchemeFactory.build(image__filename="palette.gif")
+    buffer = ContentFile(b"", name="palette.gif")
+    PilImage.new("P", (300, 100)).save(buffer, format="GIF")
+    scheme.image = buffer
+
+    ImageSchemeService.save_scheme(scheme)
+
+    assert scheme.print_image.width == 300
+
+
+@pytest.mark.django_db
+def test_bulk_generate_variants_skips_schemes_with_variants() -> None:
+    done = ImageSchemeFactory.build()
+    ImageSchemeService.save_scheme(done)
+    missing = ImageSchemeFactory.create()
+
+    updated = ImageSchemeService.bulk_generate_variants()
+
+    missing.refresh_from_db()
+    assert updated == 1
+    assert missing.print_image
+    assert missing.content_hash == scheme_content_hash(missing)
+
+
+@pytest.mark.django_db
+def test_bulk_generate_variants_regenerates_all_when_asked() -> None:
+    ImageSchemeService.save_scheme(ImageSchemeFactory.build())
+    ImageSchemeFactory.create()
+
+    assert ImageSchemeService.bulk_generate_variants(only_missing=False) == 2
@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Content hashes for synced entities."""
+
+import hashlib
+import json
+from typing import Final
+
+CONTENT_HASH_LENGTH: Final[int] = 16
+"""Hex digits kept from the SHA-256 digest (64 bits — plenty per entity type)."""
+
+
+def content_hash(*values: object) -> str:
+    """Return a short, stable hash of the values a client stores for an entity.
+
+    Values are JSON-encoded (non-serializable ones via `str`), so `1` and
+    `"1"` or `None` and `""` hash differently.
+    """
+    raw = json.dumps(values, ensure_ascii=False, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()[:CONTENT_HASH_LENGTH]
@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for content hashes."""
+
+from apps.shared.hashing import CONTENT_HASH_LENGTH, content_hash
+
+
+def test_content_hash_is_stable() -> None:
+    assert content_hash("Am", 1, True) == content_hash("Am", 1, True)
+
+
+def test_content_hash_has_fixed_length() -> None:
+    assert len(content_hash("Am", "<svg/>" * 1000)) == CONTENT_HASH_LENGTH
+
+
+def test_content_hash_depends_on_every_value() -> None:
+    assert content_hash("Am", 1) != content_hash("Am", 2)
+
+
+def test_content_hash_distinguishes_types() -> None:
+    assert content_hash(1) != content_hash("1")
+    assert content_hash(None) != content_hash("")
+
+
+def test_content_hash_depends_on_value_boundaries() -> None:
+    assert content_hash("ab", "c") != content_hash("a", "bc")
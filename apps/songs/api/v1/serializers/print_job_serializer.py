@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Serializer for asynchronous print jobs."""
+
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from apps.songs.constants import PrintJobStatusChoice
+from apps.songs.models import PrintJob
+
+
+class PrintJobSerializer(serializers.ModelSerializer[PrintJob]):
+    """Status of a song or songbook print job.
+
+    `download_url` is set once the PDF is ready.
+    """
+
+    song = serializers.UUIDField(
+        source="song.uuid",
+        read_only=True,
+        allow_null=True,
+        help_text="Printed song; null for a songbook job.",
+    )
+    title = serializers.CharField(read_only=True)
+    queue_position = serializers.SerializerMethodField()
+    download_url = serializers.SerializerMethodField()
+
+    @extend_schema_field({"type": "integer", "nullable": True})
+    def get_queue_position(self, _obj: PrintJob) -> int | None:
+        """Return the number of queued jobs ahead, passed in by the view."""
+        position: int | None = self.context.get("queue_position")
+        return position
+
+    @extend_schema_field({"type": "string", "format": "uri", "nullable": True})
+    def get_download_url(self, obj: PrintJob) -> str | None:
+        """Return the PDF download URL of a finished job, or None."""
+        if obj.status != PrintJobStatusChoice.DONE:
+            return None
+        return reverse(
+            "print-job-pdf",
+            kwargs={"uuid": obj.uuid},
+            request=self.context.get("request"),
+        )
+
+    class Meta:
+        model = PrintJob
+        fields = (
+            "uuid",
+            "song",
+            "title",
+            "status",
+            "queue_position",
+            "created_at",
+            "finished_at",
+            "download_url",
+        )
@@ -6,8 +6,26 @@
 
 from django.urls import path
 
-from .views import SongPrintView
+from .views import (
+    PrintJobDetailView,
+    PrintJobDownloadView,
+    SongPrintJobCreateView,
+    SongPrintView,
+)
 
 urlpatterns = [
     path("songs/<uuid:uuid>/print/", SongPrintView.as_view(), name="song-print"),
+    path(
+        "songs/<uuid:uuid>/print-jobs/",
+        SongPrintJobCreateView.as_view(),
+        name="song-print-job-create",
+    ),
+    path(
+        "print-jobs/<uuid:uuid>/", PrintJobDetailView.as_view(), name="print-job-detail"
+    ),
+    path(
+        "print-jobs/<uuid:uuid>/pdf/",
+        PrintJobDownloadView.as_view(),
+        name="print-job-pdf",
+    ),
 ]
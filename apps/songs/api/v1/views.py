@@ -6,21 +6,98 @@
 
 import logging
 import uuid as uuid_module
+from abc import ABC, abstractmethod
 
-from django.http import Http404, HttpResponse
+from django.http import FileResponse, Http404, HttpResponse
+from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 
-from apps.songs.pdf_renderer import PrintSettings, render_song_pdf
-from apps.songs.selectors import get_song_by_uuid
+from apps.songs.constants import PRINT_JOB_QUEUE_LIMIT, PrintJobStatusChoice
+from apps.songs.models import PrintJob
+from apps.songs.pdf_cache import get_song_pdf
+from apps.songs.pdf_renderer import PrintSettings, Songbook
+from apps.songs.print_pool import (
+    PrintBusyError,
+    PrintOverloadedError,
+    PrintQueueFullError,
+)
+from apps.songs.selectors import (
+    count_queued_print_jobs,
+    get_print_job_by_uuid,
+    get_print_job_queue_position,
+    get_song_by_uuid,
+)
+from apps.songs.services import enqueue_print_job, enqueue_songbook_print_job
 from apps.songs.utils import transliterate_for_filename
 
+from .serializers.print_job_serializer import PrintJobSerializer
 from .serializers.song_print_settings_serializer import SongPrintSettingsSerializer
 
 logger = logging.getLogger("songs")
 
 
+def _print_rejected(
+    uuid: uuid_module.UUID, exc: PrintOverloadedError, status_code: int
+) -> Response:
+    """Answer a print the print pool rejected, with a Retry-After header."""
+    logger.warning("Print rejected: uuid=%s status=%s", uuid, status_code)
+    return Response(
+        {"detail": "Print service is overloaded, try again later."},
+        status=status_code,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+def _print_settings(request: Request) -> PrintSettings:
+    """Validate the print settings in the request body."""
+    serializer = SongPrintSettingsSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    data = serializer.validated_data
+    return PrintSettings(
+        show_chords=data["show_chords"],
+        show_schemes=data["show_schemes"],
+        show_text=data["show_text"],
+        chord_orientation=data["chord_orientation"],
+        chord_size=data["chord_size"],
+        scheme_size=data["scheme_size"],
+        text_size=data["text_size"],
+        columns_count=data["columns_count"],
+    )
+
+
+def _pdf_response(pdf: bytes, title: str) -> HttpResponse:
+    """Return `pdf` inline, named after `title`."""
+    filename = f"{transliterate_for_filename(title)}.pdf"
+    response = HttpResponse(pdf, content_type="application/pdf")
+    response["Content-Disposition"] = f'inline; filename="{filename}"'
+    return response
+
+
+def _print_job_response(
+    request: Request, job: PrintJob, status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Serialize a print job together with its queue position."""
+    context = {
+        "request": request,
+        "queue_position": get_print_job_queue_position(job),
+    }
+    return Response(PrintJobSerializer(job, context=context).data, status=status_code)
+
+
+def _print_job_accepted(request: Request, job: PrintJob) -> Response:
+    """Answer a queued print job with 202 and its status URL."""
+    response = _print_job_response(request, job, status.HTTP_202_ACCEPTED)
+    response["Location"] = reverse(
+        "print-job-detail", kwargs={"uuid": job.uuid}, request=request
+    )
+    return response
+
+
 class SongPrintView(APIView):
     """Generate and return a printable PDF for a song."""
 
@@ -33,23 +110,112 @@ class SongPrintView(APIView):
             logger.warning("Song not found for print: uuid=%s", uuid)
             raise Http404
 
-        serializer = SongPrintSettingsSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        data = serializer.validated_data
-        settings = PrintSettings(
-            show_chords=data["show_chords"],
-            show_schemes=data["show_schemes"],
-            show_text=data["show_text"],
-            chord_orientation=data["chord_orientation"],
-            chord_size=data["chord_size"],
-            scheme_size=data["scheme_size"],
-            text_size=data["text_size"],
-            columns_count=data["columns_count"],
-        )
-        pdf_bytes = render_song_pdf(song, settings)
+        settings = _print_settings(request)
+        try:
+            pdf_bytes = get_song_pdf(song, settings)
+        except PrintQueueFullError as exc:
+            return _print_rejected(uuid, exc, status.HTTP_429_TOO_MANY_REQUESTS)
+        except PrintBusyError as exc:
+            return _print_rejected(uuid, exc, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        return _pdf_response(pdf_bytes, song.title)
+
+
+class SongbookPrintView(APIView, ABC):
+    """Base view queueing a print of the songs of a lesson or course.
+
+    A songbook can take far longer to lay out than a request may last, so it
+    is always rendered by the `print_worker` command: the response is the
+    queued job (202), polled like a song print job. Subclasses implement
+    `get_songbook`.
+    """
+
+    permission_classes = (AllowAny,)
+
+    @abstractmethod
+    def get_songbook(self, uuid: uuid_module.UUID) -> Songbook | None:
+        """Return the songbook identified by `uuid`, or None."""
+
+    def post(self, request: Request, uuid: uuid_module.UUID) -> Response:
+        """Accept print settings and return the queued job (202)."""
+        songbook = self.get_songbook(uuid)
+        if songbook is None:
+            logger.warning(
+                "Songbook not found for print: view=%s uuid=%s",
+                type(self).__name__,
+                uuid,
+            )
+            raise Http404
+
+        settings = _print_settings(request)
+        if count_queued_print_jobs() >= PRINT_JOB_QUEUE_LIMIT:
+            return _print_rejected(
+                uuid, PrintQueueFullError(), status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
+        job = enqueue_songbook_print_job(songbook, settings)
+        logger.info("Songbook print job queued: uuid=%s source=%s", job.uuid, uuid)
+        return _print_job_accepted(request, job)
 
-        filename = f"{transliterate_for_filename(song.title)}.pdf"
-        response = HttpResponse(pdf_bytes, content_type="application/pdf")
-        response["Content-Disposition"] = f'inline; filename="{filename}"'
-        return response
+
+class SongPrintJobCreateView(APIView):
+    """Queue a song PDF render for the `print_worker` command."""
+
+    permission_classes = (AllowAny,)
+
+    def post(self, request: Request, uuid: uuid_module.UUID) -> Response:  # noqa: PLR6301
+        """Accept print settings and return the queued job (202)."""
+        song = get_song_by_uuid(uuid)
+        if song is None:
+            logger.warning("Song not found for print job: uuid=%s", uuid)
+            raise Http404
+
+        settings = _print_settings(request)
+        if count_queued_print_jobs() >= PRINT_JOB_QUEUE_LIMIT:
+            return _print_rejected(
+                uuid, PrintQueueFullError(), status.HTTP_429_TOO_MANY_REQUESTS
+            )
+
+        job = enqueue_print_job(song, settings)
+        logger.info("Print job queued: uuid=%s song=%s", job.uuid, uuid)
+        return _print_job_accepted(request, job)
+
+
+class PrintJobDetailView(APIView):
+    """Report the status of a print job."""
+
+    permission_classes = (AllowAny,)
+
+    def get(self, request: Request, uuid: uuid_module.UUID) -> Response:  # noqa: PLR6301
+        """Return the job status, queue position and, when done, download URL."""
+        job = get_print_job_by_uuid(uuid)
+        if job is None:
+            raise Http404
+        return _print_job_response(request, job)
+
+
+class PrintJobDownloadView(APIView):
+    """Serve the PDF of a finished print job."""
+
+    permission_classes = (AllowAny,)
+
+    def get(  # noqa: PLR6301
+        self, request: Request, uuid: uuid_module.UUID
+    ) -> Response | FileResponse:
+        """Return the PDF, or 409 while the job is not done."""
+        job = get_print_job_by_uuid(uuid)
+        if job is None:
+            raise Http404
+        if job.status != PrintJobStatusChoice.DONE or not job.pdf:
+            return Response(
+                {"detail": "Print job is not done.", "status": job.status},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        filename = f"{transliterate_for_filename(job.title)}.pdf"
+        return FileResponse(
+            job.pdf.open("rb"),
+            content_type="application/pdf",
+            as_attachment=False,
+            filename=filename,
+        )
@@ -4,8 +4,26 @@
 
 """Constants for the songs app."""
 
+from datetime import timedelta
+from typing import Final
+
 from django.db import models
 
+PRINT_CACHE_REVISION: Final[int] = 2
+"""Bump when the print template or renderer changes to invalidate cached PDFs."""
+
+PRINT_RETRY_AFTER_SECONDS: Final[int] = 5
+"""Retry-After sent with print requests rejected by the print pool."""
+
+PRINT_JOB_QUEUE_LIMIT: Final[int] = 100
+"""Queued print jobs above which new jobs are rejected with 429."""
+
+PRINT_JOB_STALE_AFTER: Final[timedelta] = timedelta(minutes=10)
+"""Running print jobs older than this are assumed lost and queued again."""
+
+PRINT_JOB_RETENTION: Final[timedelta] = timedelta(days=1)
+"""Finished print jobs and their PDFs are deleted after this time."""
+
 
 class SizeChoice(models.IntegerChoices):
     """Five-step size scale: 1 = smallest, 3 = default, 5 = largest."""
@@ -22,3 +40,12 @@ class ChordOrientationChoice(models.TextChoices):
 
     HORIZONTAL = "horizontal", "Горизонтальный"
     VERTICAL = "vertical", "Вертикальный"
+
+
+class PrintJobStatusChoice(models.TextChoices):
+    """Lifecycle of an asynchronous print job."""
+
+    QUEUED = "queued", "В очереди"
+    RUNNING = "running", "Выполняется"
+    DONE = "done", "Готово"
+    FAILED = "failed", "Ошибка"
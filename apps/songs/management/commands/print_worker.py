@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Management command that drains the print job queue."""
+
+import signal
+import time
+from argparse import ArgumentParser
+from types import FrameType
+
+from django.core.management.base import BaseCommand
+
+from apps.songs.print_pool import PrintOverloadedError
+from apps.songs.services import (
+    claim_next_print_job,
+    purge_finished_print_jobs,
+    requeue_stale_print_jobs,
+    run_print_job,
+)
+
+
+class Command(BaseCommand):
+    """Render queued PrintJobs one by one, polling the database for new ones.
+
+    No broker is needed: the queue is the PrintJob table. Run one or more
+    workers next to gunicorn; SIGTERM stops a worker after the current job.
+    """
+
+    help = "Render queued print jobs. Runs until stopped unless --once is given."
+
+    def add_arguments(self, parser: ArgumentParser) -> None:  # noqa: PLR6301
+        """Add --once and --poll-interval."""
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when the queue is empty instead of polling.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when the queue is empty (default: 1).",
+        )
+
+    def handle(self, *args: object, **options: object) -> None:
+        """Claim and render jobs until stopped or, with --once, drained."""
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+
+        requeued = requeue_stale_print_jobs()
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} stale print job(s).")
+
+        processed = 0
+        while not self._stopping:
+            job = claim_next_print_job()
+            if job is None:
+                if options["once"]:
+                    break
+                purge_finished_print_jobs()
+                time.sleep(float(options["poll_interval"]))  # type: ignore[arg-type]
+                continue
+            try:
+                run_print_job(job)
+            except PrintOverloadedError as exc:
+                time.sleep(exc.retry_after)
+                continue
+            processed += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} print job(s)."))
+
+    def _stop(self, signum: int, frame: FrameType | None) -> None:
+        """Finish the current job, then leave the loop."""
+        self._stopping = True
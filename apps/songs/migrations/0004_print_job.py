@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 20:19
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("songs", "0003_add_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PrintJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                ("settings", models.JSONField(verbose_name="Настройки печати")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "В очереди"),
+                            ("running", "Выполняется"),
+                            ("done", "Готово"),
+                            ("failed", "Ошибка"),
+                        ],
+                        default="queued",
+                        max_length=16,
+                        verbose_name="Статус",
+                    ),
+                ),
+                (
+                    "pdf",
+                    models.FileField(
+                        blank=True, upload_to="print_jobs/", verbose_name="PDF"
+                    ),
+                ),
+                ("error", models.TextField(blank=True, verbose_name="Ошибка")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Создано"),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="Начато"),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Завершено"
+                    ),
+                ),
+                (
+                    "song",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="print_jobs",
+                        to="songs.song",
+                        verbose_name="Песня",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Задание печати",
+                "verbose_name_plural": "Задания печати",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "created_at"],
+                        name="printjob_status_created_idx",
+                    )
+                ],
+            },
+        ),
+    ]
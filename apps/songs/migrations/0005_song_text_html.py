@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 20:38
+
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from markdownx.utils import markdownify  # type: ignore[import-untyped]
+
+
+def render_html(apps: Apps, _schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Render existing song texts the way `save_song` does."""
+    Song = apps.get_model("songs", "Song")
+    objects = list(Song.objects.all())
+    for obj in objects:
+        obj.text_html = markdownify(obj.text)
+    Song.objects.bulk_update(objects, ["text_html"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("songs", "0004_print_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="song",
+            name="text_html",
+            field=models.TextField(
+                blank=True,
+                editable=False,
+                help_text="Отрисовывается из текста при сохранении",
+                verbose_name="Текст песни (HTML)",
+            ),
+        ),
+        migrations.RunPython(render_html, migrations.RunPython.noop),
+    ]
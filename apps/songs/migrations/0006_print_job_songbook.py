@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 21:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("songs", "0005_song_text_html"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="printjob",
+            name="songbook",
+            field=models.JSONField(blank=True, null=True, verbose_name="Сборник"),
+        ),
+        migrations.AlterField(
+            model_name="printjob",
+            name="song",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="print_jobs",
+                to="songs.song",
+                verbose_name="Песня",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="printjob",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    models.Q(("song__isnull", False), ("songbook__isnull", True)),
+                    models.Q(("song__isnull", True), ("songbook__isnull", False)),
+                    _connector="OR",
+                ),
+                name="printjob_song_xor_songbook",
+            ),
+        ),
+    ]
@@ -5,12 +5,14 @@
 """Models for the songs app."""
 
 import uuid
+from typing import ClassVar
 
 from django.db import models
 from markdownx.models import MarkdownxField  # type: ignore[import-untyped]
 
 from apps.chords.models import Chord
 from apps.schemes.models import ImageScheme
+from apps.songs.constants import PrintJobStatusChoice
 
 
 class Song(models.Model):
@@ -23,6 +25,12 @@ class Song(models.Model):
         ImageScheme, verbose_name="Ритмические рисунки (изображения)", blank=True
     )
     text = MarkdownxField("Текст песни", help_text="С аккордами и переносами строк")
+    text_html = models.TextField(
+        "Текст песни (HTML)",
+        blank=True,
+        editable=False,
+        help_text="Отрисовывается из текста при сохранении",
+    )
     metronome = models.IntegerField("Метроном", default=0)
     updated_at = models.DateTimeField("Обновлено", auto_now=True)
 
@@ -32,3 +40,62 @@ class Song(models.Model):
 
     def __str__(self) -> str:
         return self.title
+
+
+class PrintJob(models.Model):
+    """Song or songbook PDF rendered in the background by `print_worker`.
+
+    A job prints either one `song` or a `songbook` of a lesson or course,
+    stored as the songbook title and section titles with song UUIDs as they
+    were when the job was queued.
+    """
+
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    song = models.ForeignKey(
+        Song,
+        verbose_name="Песня",
+        on_delete=models.CASCADE,
+        related_name="print_jobs",
+        null=True,
+        blank=True,
+    )
+    songbook = models.JSONField("Сборник", null=True, blank=True)
+    settings = models.JSONField("Настройки печати")
+    status = models.CharField(
+        "Статус",
+        max_length=16,
+        choices=PrintJobStatusChoice.choices,
+        default=PrintJobStatusChoice.QUEUED,
+    )
+    pdf = models.FileField("PDF", upload_to="print_jobs/", blank=True)
+    error = models.TextField("Ошибка", blank=True)
+    created_at = models.DateTimeField("Создано", auto_now_add=True)
+    started_at = models.DateTimeField("Начато", null=True, blank=True)
+    finished_at = models.DateTimeField("Завершено", null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Задание печати"
+        verbose_name_plural = "Задания печати"
+        indexes: ClassVar[list[models.Index]] = [
+            # Queue order of the print worker.
+            models.Index(
+                fields=("status", "created_at"), name="printjob_status_created_idx"
+            ),
+        ]
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.CheckConstraint(
+                condition=models.Q(song__isnull=False, songbook__isnull=True)
+                | models.Q(song__isnull=True, songbook__isnull=False),
+                name="printjob_song_xor_songbook",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.title} ({self.get_status_display()})"
+
+    @property
+    def title(self) -> str:
+        """Return the title of the printed song or songbook."""
+        if self.song is not None:
+            return self.song.title
+        return str(self.songbook["title"]) if self.songbook else ""
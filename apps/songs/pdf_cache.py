@@ -0,0 +1,203 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Content-addressed disk cache for rendered song and songbook PDFs.
+
+A PDF is stored under a hash of everything that affects its bytes: the
+songs (UUID and updated_at), the content hashes of their chords and schemes,
+the print settings that matter for them, and `PRINT_CACHE_REVISION`. Edits
+therefore never need explicit invalidation — they simply produce a new key
+and the stale file ages out.
+
+Files live in `settings.PRINT_CACHE_DIR`, shared by all workers on the host.
+Reads refresh a file's mtime, and writes evict the least recently used files
+once the directory exceeds `settings.PRINT_CACHE_MAX_BYTES`.
+"""
+
+import contextlib
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+
+from apps.metrics.metrics import print_cache_requests_total
+from apps.shared.hashing import content_hash
+
+from .constants import PRINT_CACHE_REVISION
+from .models import Song
+from .pdf_renderer import (
+    PrintSettings,
+    Songbook,
+    render_song_pdf,
+    render_songbook_pdf,
+)
+
+logger = logging.getLogger("songs")
+
+_SUFFIX = ".pdf"
+
+
+def get_song_pdf(song: Song, print_settings: PrintSettings) -> bytes:
+    """Return the song PDF from the cache, rendering and storing it on a miss."""
+    return _get_or_render(
+        print_cache_key(song, print_settings),
+        lambda: render_song_pdf(song, print_settings),
+    )
+
+
+def get_songbook_pdf(songbook: Songbook, print_settings: PrintSettings) -> bytes:
+    """Return the songbook PDF from the cache, rendering it on a miss."""
+    return _get_or_render(
+        songbook_cache_key(songbook, print_settings),
+        lambda: render_songbook_pdf(songbook, print_settings),
+    )
+
+
+def print_cache_key(song: Song, print_settings: PrintSettings) -> str:
+    """Return the cache key of a song rendered with `print_settings`.
+
+    Settings that have no effect (e.g. chord size with chords hidden) are
+    normalized away, so equivalent requests share one entry. Uses the
+    prefetched `chords` and `schemes` of `song`.
+    """
+    normalized = normalize_print_settings(print_settings)
+    return content_hash(
+        PRINT_CACHE_REVISION,
+        _song_version(song, normalized),
+        sorted(normalized.items()),
+    )
+
+
+def songbook_cache_key(songbook: Songbook, print_settings: PrintSettings) -> str:
+    """Return the cache key of a songbook rendered with `print_settings`."""
+    normalized = normalize_print_settings(print_settings)
+    sections = [
+        [
+            section["title"],
+            [_song_version(song, normalized) for song in section["songs"]],
+        ]
+        for section in songbook["sections"]
+    ]
+    return content_hash(
+        PRINT_CACHE_REVISION,
+        "songbook",
+        songbook["title"],
+        sections,
+        sorted(normalized.items()),
+    )
+
+
+def normalize_print_settings(print_settings: PrintSettings) -> PrintSettings:
+    """Reset settings of hidden sections to fixed values."""
+    normalized = print_settings.copy()
+    if not normalized["show_chords"]:
+        normalized["chord_orientation"] = "vertical"
+        normalized["chord_size"] = 3
+    if not normalized["show_schemes"]:
+        normalized["scheme_size"] = 3
+    if not normalized["show_text"]:
+        normalized["text_size"] = 3
+    return normalized
+
+
+def read_cached_pdf(key: str) -> bytes | None:
+    """Return the cached PDF for `key` and mark it recently used, or None."""
+    if not _enabled():
+        return None
+    path = _path(key)
+    try:
+        pdf = path.read_bytes()
+        os.utime(path)
+    except FileNotFoundError:  # missing, or evicted between read and touch
+        return None
+    except OSError:
+        logger.exception("Could not read PDF from the print cache: key=%s", key)
+        return None
+    return pdf
+
+
+def store_cached_pdf(key: str, pdf: bytes) -> None:
+    """Store `pdf` under `key`, then evict LRU files beyond the size limit.
+
+    The file is written under a temporary name and renamed into place, so
+    concurrent readers never see a partial PDF. I/O errors are logged and
+    swallowed: the cache must never fail a print.
+    """
+    if not _enabled():
+        return
+    directory = Path(settings.PRINT_CACHE_DIR)
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(pdf)
+        Path(tmp).replace(_path(key))
+        evict_lru(directory, settings.PRINT_CACHE_MAX_BYTES)
+    except OSError:
+        logger.exception("Could not store PDF in the print cache: key=%s", key)
+
+
+def evict_lru(directory: Path, max_bytes: int) -> int:
+    """Delete least recently used PDFs until `directory` fits in `max_bytes`.
+
+    Returns:
+        int: Number of deleted files.
+    """
+    entries: list[tuple[float, int, Path]] = []
+    for path in directory.glob(f"*{_SUFFIX}"):
+        with contextlib.suppress(FileNotFoundError):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    deleted = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        with contextlib.suppress(FileNotFoundError):
+            path.unlink()
+            deleted += 1
+        total -= size
+    return deleted
+
+
+def _get_or_render(key: str, render: Callable[[], bytes]) -> bytes:
+    """Return the cached PDF for `key`, or render and store it."""
+    pdf = read_cached_pdf(key)
+    if pdf is not None:
+        print_cache_requests_total.labels(result="hit").inc()
+        return pdf
+
+    print_cache_requests_total.labels(result="miss").inc()
+    pdf = render()
+    store_cached_pdf(key, pdf)
+    return pdf
+
+
+def _song_version(song: Song, normalized: PrintSettings) -> list[Any]:
+    """Return what identifies the printed content of a song.
+
+    Chords and schemes only count when their section is printed.
+    """
+    chords = sorted((c.pk, c.content_hash) for c in song.chords.all())
+    schemes = sorted((s.pk, s.content_hash) for s in song.schemes.all())
+    return [
+        str(song.uuid),
+        song.updated_at.isoformat(),
+        chords if normalized["show_chords"] else None,
+        schemes if normalized["show_schemes"] else None,
+    ]
+
+
+def _enabled() -> bool:
+    """Return whether the print cache is on (a zero size limit disables it)."""
+    return bool(settings.PRINT_CACHE_MAX_BYTES > 0)
+
+
+def _path(key: str) -> Path:
+    """Return the file path of a cache key."""
+    return Path(settings.PRINT_CACHE_DIR) / f"{key}{_SUFFIX}"
@@ -2,15 +2,25 @@
 #
 # SPDX-License-Identifier: AGPL-3.0-or-later
 
-"""PDF renderer for song print view."""
+"""PDF renderer for song and songbook prints."""
 
-from typing import Literal, TypedDict
+import base64
+import functools
+import logging
+import time
+from typing import Any, Literal, TypedDict
 
+from django.conf import settings as django_settings
 from django.template.loader import render_to_string
 from markdownx.utils import markdownify  # type: ignore[import-untyped]
-from weasyprint import HTML  # type: ignore[import-untyped]
+from weasyprint import CSS, HTML  # type: ignore[import-untyped]
+from weasyprint.text.fonts import FontConfiguration  # type: ignore[import-untyped]
 
+from apps.metrics.metrics import print_warmup_duration_seconds
 from apps.songs.models import Song
+from apps.songs.print_pool import render_in_pool
+
+logger = logging.getLogger("songs")
 
 type Size = Literal[1, 2, 3, 4, 5]
 type Orientation = Literal["vertical", "horizontal"]
@@ -29,6 +39,20 @@ class PrintSettings(TypedDict):
     columns_count: int
 
 
+class SongbookSection(TypedDict):
+    """Titled group of songs in a songbook; an empty title is not shown."""
+
+    title: str
+    songs: list[Song]
+
+
+class Songbook(TypedDict):
+    """Songs of a lesson or course to be printed as one document."""
+
+    title: str
+    sections: list[SongbookSection]
+
+
 _CHORD_WIDTHS: dict[Orientation, dict[Size, str]] = {
     "vertical": {
         1: "7rem",
@@ -62,45 +86,192 @@ _FONT_SIZES: dict[Size, str] = {
     5: "15pt",
 }
 
+# Chords and schemes need a saved song; text alone exercises fonts and Pango.
+_WARMUP_SETTINGS = PrintSettings(
+    show_chords=False,
+    show_schemes=False,
+    show_text=True,
+    chord_orientation="vertical",
+    chord_size=3,
+    scheme_size=3,
+    text_size=3,
+    columns_count=1,
+)
+
 
 def render_song_pdf(song: Song, settings: PrintSettings) -> bytes:
-    """Render a Song to PDF bytes applying the given print settings."""
+    """Render a Song to PDF bytes applying the given print settings.
+
+    The layout runs in the print pool.
+
+    Raises:
+        PrintOverloadedError: If the print pool rejects the render.
+    """
+    return render_in_pool(html_to_pdf, build_song_html(song, settings))
+
+
+def build_song_html(song: Song, settings: PrintSettings) -> str:
+    """Render the print HTML of a Song applying the given print settings."""
+    context = {
+        **_layout_context(settings),
+        "song": _song_context(song, settings, {}),
+    }
+    return render_to_string("songs/song_print.html", context)
+
+
+def render_songbook_pdf(songbook: Songbook, settings: PrintSettings) -> bytes:
+    """Render a songbook into one PDF with a table of contents.
+
+    The layout runs in the print pool.
+
+    Raises:
+        PrintOverloadedError: If the print pool rejects the render.
+    """
+    return render_in_pool(
+        html_to_pdf,
+        build_songbook_html(songbook, settings),
+        django_settings.PRINT_SONGBOOK_TIMEOUT,
+    )
+
+
+def build_songbook_html(songbook: Songbook, settings: PrintSettings) -> str:
+    """Render the print HTML of a songbook as a single document.
+
+    A song listed in several sections is laid out once and every table of
+    contents entry links to it. Chord diagrams and scheme images are
+    referenced by URL, so WeasyPrint loads and embeds each distinct one once
+    per document however many songs use it.
+    """
+    chord_sources: dict[tuple[int, str], str] = {}
+    songs: dict[int, dict[str, Any]] = {}
+    toc = []
+    for section in songbook["sections"]:
+        entries = []
+        for song in section["songs"]:
+            anchor = f"song-{song.uuid}"
+            if song.pk not in songs:
+                songs[song.pk] = _song_context(song, settings, chord_sources, anchor)
+            entries.append({"title": song.title, "anchor": anchor})
+        toc.append({"title": section["title"], "entries": entries})
+
+    context = {
+        **_layout_context(settings),
+        "title": songbook["title"],
+        "toc": toc,
+        "songs": list(songs.values()),
+    }
+    return render_to_string("songs/songbook_print.html", context)
+
+
+def html_to_pdf(html: str) -> bytes:
+    """Lay out print HTML with WeasyPrint. Runs in a print pool process.
+
+    The static stylesheet and the font configuration are shared by all
+    documents of the process instead of being rebuilt for every print.
+    """
+    return HTML(string=html).write_pdf(  # type: ignore[no-any-return]
+        stylesheets=[_print_stylesheet()], font_config=_font_config()
+    )
+
+
+def warm_up_printing() -> None:
+    """Lay out a tiny song so the first real print does not pay for startup.
+
+    Loads fontconfig and Pango, the print templates and the parsed static
+    stylesheet. Called from gunicorn hooks when `PRINT_WARMUP` is on: in
+    the master under `preload_app`, so every worker (and its print pool
+    children) forked later inherits the warm state. Failures are logged
+    and never stop the server from booting.
+    """
+    if not django_settings.PRINT_WARMUP:
+        return
+    started = time.monotonic()
+    try:
+        html_to_pdf(
+            build_song_html(Song(title="Am", text="Am Dm E Am"), _WARMUP_SETTINGS)
+        )
+    except Exception:
+        logger.exception("Print warm-up failed")
+        return
+    duration = time.monotonic() - started
+    print_warmup_duration_seconds.set(duration)
+    logger.info("Print warm-up took %.2fs", duration)
+
+
+@functools.cache
+def _font_config() -> FontConfiguration:
+    """Return the process-wide WeasyPrint font configuration."""
+    return FontConfiguration()
+
+
+@functools.cache
+def _print_stylesheet() -> CSS:
+    """Return the parsed static print stylesheet (`songs/print.css`)."""
+    return CSS(string=render_to_string("songs/print.css"), font_config=_font_config())
+
+
+def _layout_context(settings: PrintSettings) -> dict[str, Any]:
+    """Return the template variables shared by all songs of a document."""
+    return {
+        "columns_count": settings["columns_count"],
+        "chord_width": _CHORD_WIDTHS[settings["chord_orientation"]][
+            settings["chord_size"]
+        ],
+        "scheme_width": _SCHEME_WIDTHS[settings["scheme_size"]],
+        "text_font_size": _FONT_SIZES[settings["text_size"]],
+    }
+
+
+def _song_context(
+    song: Song,
+    settings: PrintSettings,
+    chord_sources: dict[tuple[int, str], str],
+    anchor: str = "",
+) -> dict[str, Any]:
+    """Return the template variables of one song.
+
+    `chord_sources` memoizes chord diagram data URIs across the songs of a
+    document, keyed by chord and orientation.
+    """
+    orientation = settings["chord_orientation"]
     chords = []
     if settings["show_chords"]:
         for chord in song.chords.all():
-            svg = (
-                chord.svg_vertical
-                if settings["chord_orientation"] == "vertical"
-                else chord.svg_horizontal
-            )
-            if svg:
-                chords.append({"title": chord.title, "svg": svg})
+            key = (chord.pk, orientation)
+            if key not in chord_sources:
+                svg = (
+                    chord.svg_vertical
+                    if orientation == "vertical"
+                    else chord.svg_horizontal
+                )
+                chord_sources[key] = _svg_data_uri(svg) if svg else ""
+            if chord_sources[key]:
+                chords.append({"title": chord.title, "src": chord_sources[key]})
 
     schemes = []
     if settings["show_schemes"]:
         for scheme in song.schemes.all():
-            if scheme.image:
+            image = scheme.print_image or scheme.image
+            if image:
                 schemes.append({
-                    "path": f"file://{scheme.image.path}",
+                    "path": f"file://{image.path}",
                     "inscription": scheme.inscription,
                 })
 
     text_html = ""
     if settings["show_text"] and song.text:
-        text_html = markdownify(song.text)
+        # Songs saved outside `save_song` have no stored HTML yet.
+        text_html = song.text_html or markdownify(song.text)
 
-    context = {
-        "song_title": song.title,
+    return {
+        "anchor": anchor,
+        "title": song.title,
         "chords": chords,
         "schemes": schemes,
         "text_html": text_html,
-        "columns_count": settings["columns_count"],
-        "chord_width": _CHORD_WIDTHS[settings["chord_orientation"]][
-            settings["chord_size"]
-        ],
-        "scheme_width": _SCHEME_WIDTHS[settings["scheme_size"]],
-        "text_font_size": _FONT_SIZES[settings["text_size"]],
     }
 
-    html_string = render_to_string("songs/song_print.html", context)
-    return HTML(string=html_string).write_pdf()  # type: ignore[no-any-return]
+
+def _svg_data_uri(svg: str) -> str:
+    """Return an SVG document as a base64 data URI."""
+    return "data:image/svg+xml;base64," + base64.b64encode(svg.encode()).decode()
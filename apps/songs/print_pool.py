@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Host-wide bounded pool for WeasyPrint rendering.
+
+Gunicorn `sync` workers cannot hand work to a shared in-memory queue, so
+the pool limits are lock files in `settings.PRINT_SLOTS_DIR`:
+
+- `PRINT_POOL_WORKERS` render slots: at most that many PDFs are laid out at
+  once on the host, whichever workers the requests landed on;
+- `PRINT_QUEUE_DEPTH` more queue tickets: requests beyond that are rejected
+  at once (429) instead of tying up yet another worker.
+
+A queued request waits up to `PRINT_QUEUE_TIMEOUT` seconds for a slot (503
+after that). The layout runs in a child process of the worker and is
+abandoned after `PRINT_RENDER_TIMEOUT` seconds (503), so a pathological
+document never trips gunicorn's worker timeout. Songbooks are only rendered
+by the print worker, under the longer `PRINT_SONGBOOK_TIMEOUT`. `flock`
+locks are released by the kernel when a process dies, so a crashed worker
+never leaks a slot.
+"""
+
+import fcntl
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import IO
+
+from django.conf import settings
+
+from apps.metrics.metrics import (
+    print_queue_wait_seconds,
+    print_rejected_total,
+    print_render_duration_seconds,
+)
+
+from .constants import PRINT_RETRY_AFTER_SECONDS
+
+logger = logging.getLogger("songs")
+
+_POLL_INTERVAL = 0.05
+
+_executor: ProcessPoolExecutor | None = None
+
+
+class PrintOverloadedError(Exception):
+    """Raised when the print pool rejects a render.
+
+    Attributes:
+        retry_after: Seconds the client should wait before retrying.
+    """
+
+    def __init__(self, retry_after: int = PRINT_RETRY_AFTER_SECONDS) -> None:
+        """Store the suggested retry delay."""
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+
+class PrintQueueFullError(PrintOverloadedError):
+    """Raised when every render slot and queue place on the host is taken."""
+
+
+class PrintBusyError(PrintOverloadedError):
+    """Raised when a queued render did not start or finish in time."""
+
+
+class PrintTimeoutError(PrintBusyError):
+    """Raised when a render ran past its timeout and was killed.
+
+    Retrying the same document will most likely time out again, so the
+    print worker fails the job instead of queueing it again.
+    """
+
+
+def render_in_pool(
+    render: Callable[[str], bytes], html: str, timeout: float | None = None
+) -> bytes:
+    """Run `render(html)` in the print pool and return its result.
+
+    `render` is pickled to a child process, so it must be a module-level
+    function. With `PRINT_POOL_WORKERS = 0` it runs inline without limits.
+    The render is killed after `timeout` seconds, `PRINT_RENDER_TIMEOUT` by
+    default.
+
+    Raises:
+        PrintQueueFullError: If no queue ticket is free.
+        PrintBusyError: If no slot frees up in time.
+        PrintTimeoutError: If the render times out.
+    """
+    workers = settings.PRINT_POOL_WORKERS
+    if workers <= 0:
+        return render(html)
+
+    slots_dir = Path(settings.PRINT_SLOTS_DIR)
+    queued_at = time.monotonic()
+    ticket = _acquire(slots_dir, "ticket", workers + settings.PRINT_QUEUE_DEPTH, 0)
+    if ticket is None:
+        print_rejected_total.labels(reason="queue_full").inc()
+        raise PrintQueueFullError
+
+    with ticket:
+        slot = _acquire(slots_dir, "slot", workers, settings.PRINT_QUEUE_TIMEOUT)
+        print_queue_wait_seconds.observe(time.monotonic() - queued_at)
+        if slot is None:
+            print_rejected_total.labels(reason="queue_timeout").inc()
+            raise PrintBusyError
+        with slot:
+            return _render(render, html, timeout or settings.PRINT_RENDER_TIMEOUT)
+
+
+def _render(render: Callable[[str], bytes], html: str, timeout: float) -> bytes:
+    """Run one render in the worker's executor, discarding it on failure."""
+    started = time.monotonic()
+    try:
+        return _get_executor().submit(render, html).result(timeout=timeout)
+    except FutureTimeoutError:
+        print_rejected_total.labels(reason="render_timeout").inc()
+        logger.warning("PDF render timed out after %ss", timeout)
+        _discard_executor()
+        raise PrintTimeoutError from None
+    except BrokenProcessPool:
+        logger.exception("PDF render process died")
+        _discard_executor()
+        raise
+    finally:
+        print_render_duration_seconds.observe(time.monotonic() - started)
+
+
+def _acquire(
+    directory: Path, kind: str, count: int, timeout: float
+) -> IO[bytes] | None:
+    """Lock one of `count` files named `{kind}-N.lock` in `directory`.
+
+    Polls until `timeout` seconds pass. Closing the returned file releases
+    the lock.
+
+    Returns:
+        IO[bytes] | None: The locked file, or None if all stayed taken.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        for index in range(count):
+            file = (directory / f"{kind}-{index}.lock").open("ab")
+            try:
+                fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                file.close()
+                continue
+            return file
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(_POLL_INTERVAL)
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return this worker's render executor, creating it on first use.
+
+    Created lazily so that with `preload_app` each gunicorn worker forks its
+    own children; `fork` lets them reuse the already imported WeasyPrint.
+    """
+    global _executor  # noqa: PLW0603
+
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.PRINT_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+    return _executor
+
+
+def _discard_executor() -> None:
+    """Kill the render children, so a stuck layout stops burning CPU."""
+    global _executor  # noqa: PLW0603
+
+    if _executor is not None:
+        _executor.terminate_workers()
+        _executor = None
@@ -6,9 +6,32 @@
 
 import uuid as uuid_module
 
-from apps.songs.models import Song
+from django.db.models import Q
+
+from apps.songs.constants import PrintJobStatusChoice
+from apps.songs.models import PrintJob, Song
 
 
 def get_song_by_uuid(uuid: uuid_module.UUID) -> Song | None:
     """Return a Song by UUID with prefetched chords and schemes, or None."""
     return Song.objects.filter(uuid=uuid).prefetch_related("chords", "schemes").first()
+
+
+def get_print_job_by_uuid(uuid: uuid_module.UUID) -> PrintJob | None:
+    """Return a PrintJob by UUID with its song, or None."""
+    return PrintJob.objects.filter(uuid=uuid).select_related("song").first()
+
+
+def get_print_job_queue_position(job: PrintJob) -> int | None:
+    """Return how many queued jobs are ahead of `job`, or None if not queued."""
+    if job.status != PrintJobStatusChoice.QUEUED:
+        return None
+    ahead = Q(created_at__lt=job.created_at) | Q(
+        created_at=job.created_at, id__lt=job.pk
+    )
+    return PrintJob.objects.filter(ahead, status=PrintJobStatusChoice.QUEUED).count()
+
+
+def count_queued_print_jobs() -> int:
+    """Return the number of print jobs waiting for the worker."""
+    return PrintJob.objects.filter(status=PrintJobStatusChoice.QUEUED).count()
@@ -4,9 +4,27 @@
 
 """Services for the songs app."""
 
+import logging
+from typing import TYPE_CHECKING, Any
+
+from django.core.files.base import ContentFile
+from django.db.models import prefetch_related_objects
 from django.utils import timezone
+from markdownx.utils import markdownify  # type: ignore[import-untyped]
+
+from apps.songs.constants import (
+    PRINT_JOB_RETENTION,
+    PRINT_JOB_STALE_AFTER,
+    PrintJobStatusChoice,
+)
+from apps.songs.models import PrintJob, Song
+from apps.songs.print_pool import PrintOverloadedError, PrintTimeoutError
+from apps.sync.services import bump_content_clock
+
+if TYPE_CHECKING:
+    from apps.songs.pdf_renderer import PrintSettings, Songbook
 
-from apps.songs.models import Song
+logger = logging.getLogger("songs")
 
 
 def save_song(song: Song) -> None:
@@ -18,7 +36,157 @@ def save_song(song: Song) -> None:
     Propagation updates `updated_at` on every Lesson that uses this song so
     that the sync endpoint reflects content changes originating in a song.
     Uses queryset.update() to avoid N+1 saves and to bypass auto_now
-    restrictions on Lesson.updated_at.
+    restrictions on Lesson.updated_at, then moves the sync content clock
+    past the new timestamps. The Markdown text is rendered to `text_html`
+    here, so prints never parse it.
     """
+    song.text_html = markdownify(song.text)
     song.save()
     song.lessons.all().update(updated_at=timezone.now())
+    bump_content_clock()
+
+
+def enqueue_print_job(song: Song, print_settings: "PrintSettings") -> PrintJob:
+    """Queue a background render of `song` with `print_settings`."""
+    return PrintJob.objects.create(song=song, settings=dict(print_settings))
+
+
+def enqueue_songbook_print_job(
+    songbook: "Songbook", print_settings: "PrintSettings"
+) -> PrintJob:
+    """Queue a background render of `songbook` with `print_settings`.
+
+    The job stores the song UUIDs, so the worker prints the songbook as it
+    was at this moment, with the songs' current content.
+    """
+    stored = {
+        "title": songbook["title"],
+        "sections": [
+            {
+                "title": section["title"],
+                "songs": [str(song.uuid) for song in section["songs"]],
+            }
+            for section in songbook["sections"]
+        ],
+    }
+    return PrintJob.objects.create(songbook=stored, settings=dict(print_settings))
+
+
+def claim_next_print_job() -> PrintJob | None:
+    """Mark the oldest queued print job as running and return it, or None.
+
+    The claim is a conditional UPDATE on the status, so several workers can
+    drain the same queue without row locks and never take the same job.
+    """
+    queued = PrintJob.objects.filter(status=PrintJobStatusChoice.QUEUED)
+    while (
+        pk := queued.order_by("created_at", "id").values_list("pk", flat=True).first()
+    ) is not None:
+        claimed = queued.filter(pk=pk).update(
+            status=PrintJobStatusChoice.RUNNING, started_at=timezone.now()
+        )
+        if claimed:
+            return PrintJob.objects.select_related("song").get(pk=pk)
+    return None
+
+
+def run_print_job(job: PrintJob) -> None:
+    """Render a claimed print job and store its PDF, or mark it failed.
+
+    Raises:
+        PrintOverloadedError: If the print pool rejected the render; the job
+            is back in the queue.
+    """
+    # WeasyPrint loads Pango on import; keep it out of admin and migrate.
+    from apps.songs.pdf_cache import (  # noqa: PLC0415
+        get_song_pdf,
+        get_songbook_pdf,
+    )
+
+    try:
+        if job.song is not None:
+            prefetch_related_objects([job.song], "chords", "schemes")
+            pdf = get_song_pdf(job.song, job.settings)
+        else:
+            pdf = get_songbook_pdf(_load_songbook(job.songbook or {}), job.settings)
+    except PrintTimeoutError:
+        logger.warning("Print job timed out: uuid=%s", job.uuid)
+        _fail_print_job(job, "Rendering took too long.")
+        return
+    except PrintOverloadedError:
+        PrintJob.objects.filter(pk=job.pk).update(
+            status=PrintJobStatusChoice.QUEUED, started_at=None
+        )
+        raise
+    except Exception as exc:
+        logger.exception("Print job failed: uuid=%s", job.uuid)
+        _fail_print_job(job, repr(exc))
+        return
+
+    job.pdf.save(f"{job.uuid}.pdf", ContentFile(pdf), save=False)
+    job.status = PrintJobStatusChoice.DONE
+    job.finished_at = timezone.now()
+    job.save(update_fields=["pdf", "status", "finished_at"])
+
+
+def requeue_stale_print_jobs() -> int:
+    """Queue again running jobs whose worker is assumed dead.
+
+    Returns:
+        int: Number of requeued jobs.
+    """
+    return PrintJob.objects.filter(
+        status=PrintJobStatusChoice.RUNNING,
+        started_at__lt=timezone.now() - PRINT_JOB_STALE_AFTER,
+    ).update(status=PrintJobStatusChoice.QUEUED, started_at=None)
+
+
+def purge_finished_print_jobs() -> int:
+    """Delete finished print jobs past their retention, with their PDFs.
+
+    Returns:
+        int: Number of deleted jobs.
+    """
+    jobs = list(
+        PrintJob.objects.filter(
+            status__in=(PrintJobStatusChoice.DONE, PrintJobStatusChoice.FAILED),
+            finished_at__lt=timezone.now() - PRINT_JOB_RETENTION,
+        )
+    )
+    for job in jobs:
+        if job.pdf:
+            job.pdf.delete(save=False)
+    PrintJob.objects.filter(pk__in=[job.pk for job in jobs]).delete()
+    return len(jobs)
+
+
+def _fail_print_job(job: PrintJob, error: str) -> None:
+    """Mark a claimed print job as failed with `error`."""
+    job.status = PrintJobStatusChoice.FAILED
+    job.error = error
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "error", "finished_at"])
+
+
+def _load_songbook(stored: dict[str, Any]) -> "Songbook":
+    """Rebuild a songbook stored by `enqueue_songbook_print_job`.
+
+    Songs deleted since the job was queued are left out.
+    """
+    uuids = [uuid for section in stored["sections"] for uuid in section["songs"]]
+    songs = {
+        str(song.uuid): song
+        for song in Song.objects.filter(uuid__in=uuids).prefetch_related(
+            "chords", "schemes"
+        )
+    }
+    return {
+        "title": stored["title"],
+        "sections": [
+            {
+                "title": section["title"],
+                "songs": [songs[uuid] for uuid in section["songs"] if uuid in songs],
+            }
+            for section in stored["sections"]
+        ],
+    }
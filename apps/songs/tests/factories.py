@@ -13,7 +13,7 @@ from apps.chords.models import Chord
 from apps.chords.tests.factories import ChordFactory
 from apps.schemes.models import ImageScheme
 from apps.schemes.tests.factories import ImageSchemeFactory
-from apps.songs.models import Song
+from apps.songs.models import PrintJob, Song
 
 
 class SongFactory(DjangoModelFactory[Song]):
@@ -80,3 +80,24 @@ class SongFactory(DjangoModelFactory[Song]):
         model = Song
         skip_postgeneration_save = True
         django_get_or_create = ("title",)
+
+
+class PrintJobFactory(DjangoModelFactory[PrintJob]):
+    """Factory for creating queued PrintJob instances with default settings."""
+
+    song = factory.SubFactory(SongFactory)  # type: ignore[attr-defined]
+    settings = factory.LazyFunction(  # type: ignore[attr-defined]
+        lambda: {
+            "show_chords": True,
+            "show_schemes": True,
+            "show_text": True,
+            "chord_orientation": "vertical",
+            "chord_size": 3,
+            "scheme_size": 3,
+            "text_size": 3,
+            "columns_count": 1,
+        }
+    )
+
+    class Meta:
+        model = PrintJob
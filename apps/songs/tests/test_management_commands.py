@@ -0,0 +1,52 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for songs management commands."""
+
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import Mock
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.songs import pdf_cache
+from apps.songs.constants import PRINT_JOB_STALE_AFTER, PrintJobStatusChoice
+from apps.songs.models import PrintJob
+from apps.songs.tests.factories import PrintJobFactory
+
+
+@pytest.fixture(autouse=True)
+def renderer(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the WeasyPrint renderer with a mock returning fixed bytes."""
+    mock = Mock(return_value=b"%PDF-1.7 job")
+    monkeypatch.setattr(pdf_cache, "render_song_pdf", mock)
+    return mock
+
+
+@pytest.mark.django_db
+def test_print_worker_once_drains_queue() -> None:
+    PrintJobFactory.create_batch(2)
+    out = StringIO()
+
+    call_command("print_worker", "--once", stdout=out)
+
+    assert set(PrintJob.objects.values_list("status", flat=True)) == {
+        PrintJobStatusChoice.DONE
+    }
+    assert "Processed 2 print job(s)." in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_print_worker_requeues_stale_jobs_on_start() -> None:
+    job = PrintJobFactory.create(
+        status=PrintJobStatusChoice.RUNNING,
+        started_at=timezone.now() - PRINT_JOB_STALE_AFTER - timedelta(seconds=1),
+    )
+
+    call_command("print_worker", "--once", stdout=StringIO())
+
+    job.refresh_from_db()
+    assert job.status == PrintJobStatusChoice.DONE
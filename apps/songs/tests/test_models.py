@@ -7,11 +7,12 @@
 import uuid
 
 import pytest
+from django.db import IntegrityError
 
 from apps.chords.tests.factories import ChordFactory
 from apps.schemes.tests.factories import ImageSchemeFactory
-from apps.songs.models import Song
-from apps.songs.tests.factories import SongFactory
+from apps.songs.models import PrintJob, Song
+from apps.songs.tests.factories import PrintJobFactory, SongFactory
 
 
 @pytest.mark.django_db
@@ -119,3 +120,11 @@ def test_song_get_or_create_by_title() -> None:
 
     assert song1.pk == song2.pk
     assert Song.objects.filter(title="Unique Song").count() == 1
+
+
+@pytest.mark.django_db
+def test_print_job_needs_either_song_or_songbook() -> None:
+    settings = PrintJobFactory.build().settings
+
+    with pytest.raises(IntegrityError):
+        PrintJob.objects.create(song=None, songbook=None, settings=settings)
@@ -0,0 +1,280 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for the song and songbook PDF cache."""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.chords.tests.factories import ChordFactory
+from apps.songs import pdf_cache
+from apps.songs.models import Song
+from apps.songs.pdf_cache import (
+    evict_lru,
+    get_song_pdf,
+    get_songbook_pdf,
+    print_cache_key,
+    read_cached_pdf,
+    songbook_cache_key,
+    store_cached_pdf,
+)
+from apps.songs.pdf_renderer import PrintSettings, Songbook, SongbookSection
+from apps.songs.selectors import get_song_by_uuid
+from apps.songs.tests.factories import SongFactory
+
+_SETTINGS = PrintSettings(
+    show_chords=True,
+    show_schemes=True,
+    show_text=True,
+    chord_orientation="vertical",
+    chord_size=3,
+    scheme_size=3,
+    text_size=3,
+    columns_count=1,
+)
+
+
+@pytest.fixture
+def renderer(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the WeasyPrint renderer with a mock returning fixed bytes."""
+    mock = Mock(return_value=b"%PDF-1.7 song")
+    monkeypatch.setattr(pdf_cache, "render_song_pdf", mock)
+    return mock
+
+
+def _fetch(song: Song) -> Song:
+    fetched = get_song_by_uuid(song.uuid)
+    assert fetched is not None
+    return fetched
+
+
+def _songbook(songs: list[Song]) -> Songbook:
+    return Songbook(title="Курс", sections=[SongbookSection(title="", songs=songs)])
+
+
+# =============================================================================
+# get_song_pdf
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_get_song_pdf_renders_once_for_repeated_requests(renderer: Mock) -> None:
+    song = _fetch(SongFactory.create())
+
+    first = get_song_pdf(song, _SETTINGS)
+    second = get_song_pdf(song, _SETTINGS)
+
+    assert first == second == b"%PDF-1.7 song"
+    renderer.assert_called_once()
+
+
+@pytest.mark.django_db
+def test_get_song_pdf_rerenders_after_song_edit(renderer: Mock) -> None:
+    song = SongFactory.create()
+    get_song_pdf(_fetch(song), _SETTINGS)
+
+    song.text = "new text"
+    song.save()
+    get_song_pdf(_fetch(song), _SETTINGS)
+
+    assert renderer.call_count == 2
+
+
+@pytest.mark.django_db
+def test_get_song_pdf_bypasses_cache_when_disabled(
+    renderer: Mock, settings: SettingsWrapper, print_cache_dir: Path
+) -> None:
+    settings.PRINT_CACHE_MAX_BYTES = 0
+    song = _fetch(SongFactory.create())
+
+    get_song_pdf(song, _SETTINGS)
+    get_song_pdf(song, _SETTINGS)
+
+    assert renderer.call_count == 2
+    assert not print_cache_dir.exists()
+
+
+@pytest.mark.django_db
+def test_get_songbook_pdf_renders_once_for_repeated_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    render = Mock(return_value=b"%PDF-1.7 songbook")
+    monkeypatch.setattr(pdf_cache, "render_songbook_pdf", render)
+    songbook = _songbook([_fetch(SongFactory.create())])
+
+    get_songbook_pdf(songbook, _SETTINGS)
+    pdf = get_songbook_pdf(songbook, _SETTINGS)
+
+    assert pdf == b"%PDF-1.7 songbook"
+    render.assert_called_once()
+
+
+# =============================================================================
+# print_cache_key / songbook_cache_key
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_songbook_cache_key_changes_when_a_song_changes() -> None:
+    songs = [SongFactory.create() for _ in range(2)]
+    before = songbook_cache_key(_songbook([_fetch(s) for s in songs]), _SETTINGS)
+
+    songs[1].text = "new text"
+    songs[1].save()
+
+    after = songbook_cache_key(_songbook([_fetch(s) for s in songs]), _SETTINGS)
+    assert after != before
+
+
+@pytest.mark.django_db
+def test_songbook_cache_key_differs_from_single_song_key() -> None:
+    song = _fetch(SongFactory.create())
+
+    assert songbook_cache_key(_songbook([song]), _SETTINGS) != print_cache_key(
+        song, _SETTINGS
+    )
+
+
+@pytest.mark.django_db
+def test_print_cache_key_changes_with_chord_content() -> None:
+    chord = ChordFactory.create()
+    song = SongFactory.create(chords=[chord])
+    before = print_cache_key(_fetch(song), _SETTINGS)
+
+    chord.content_hash = "0" * 16
+    chord.save()
+
+    assert print_cache_key(_fetch(song), _SETTINGS) != before
+
+
+@pytest.mark.django_db
+def test_print_cache_key_changes_with_chord_set() -> None:
+    song = SongFactory.create()
+    before = print_cache_key(_fetch(song), _SETTINGS)
+
+    song.chords.add(ChordFactory.create())
+
+    assert print_cache_key(_fetch(song), _SETTINGS) != before
+
+
+@pytest.mark.django_db
+def test_print_cache_key_changes_with_visible_settings() -> None:
+    song = _fetch(SongFactory.create())
+
+    assert print_cache_key(song, _SETTINGS) != print_cache_key(
+        song, _SETTINGS | {"chord_size": 5}
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("hidden", "change"),
+    [
+        ({"show_chords": False}, {"chord_size": 5, "chord_orientation": "horizontal"}),
+        ({"show_schemes": False}, {"scheme_size": 1}),
+        ({"show_text": False}, {"text_size": 2}),
+    ],
+)
+def test_print_cache_key_ignores_settings_of_hidden_sections(
+    hidden: dict[str, object], change: dict[str, object]
+) -> None:
+    song = _fetch(SongFactory.create())
+    base: PrintSettings = _SETTINGS | hidden  # type: ignore[assignment]
+    changed: PrintSettings = base | change  # type: ignore[assignment]
+
+    assert print_cache_key(song, base) == print_cache_key(song, changed)
+
+
+@pytest.mark.django_db
+def test_print_cache_key_ignores_chord_content_when_chords_hidden() -> None:
+    chord = ChordFactory.create()
+    song = SongFactory.create(chords=[chord])
+    hidden = _SETTINGS | {"show_chords": False}
+    before = print_cache_key(_fetch(song), hidden)
+
+    chord.content_hash = "0" * 16
+    chord.save()
+
+    assert print_cache_key(_fetch(song), hidden) == before
+
+
+# =============================================================================
+# read_cached_pdf / store_cached_pdf
+# =============================================================================
+
+
+def test_read_cached_pdf_returns_none_for_missing_key() -> None:
+    assert read_cached_pdf("missing") is None
+
+
+def test_store_cached_pdf_round_trips(print_cache_dir: Path) -> None:
+    store_cached_pdf("key", b"%PDF")
+
+    assert read_cached_pdf("key") == b"%PDF"
+    assert [p.name for p in print_cache_dir.iterdir()] == ["key.pdf"]
+
+
+def test_read_cached_pdf_refreshes_mtime(print_cache_dir: Path) -> None:
+    store_cached_pdf("key", b"%PDF")
+    path = print_cache_dir / "key.pdf"
+    os.utime(path, (0, 0))
+
+    read_cached_pdf("key")
+
+    assert path.stat().st_mtime > 0
+
+
+def test_store_cached_pdf_evicts_least_recently_used(
+    settings: SettingsWrapper, print_cache_dir: Path
+) -> None:
+    settings.PRINT_CACHE_MAX_BYTES = 10
+    store_cached_pdf("old", b"12345")
+    store_cached_pdf("used", b"12345")
+    os.utime(print_cache_dir / "old.pdf", (1, 1))
+    os.utime(print_cache_dir / "used.pdf", (2, 2))
+    read_cached_pdf("used")
+
+    store_cached_pdf("new", b"12345")
+
+    assert sorted(p.name for p in print_cache_dir.iterdir()) == ["new.pdf", "used.pdf"]
+
+
+def test_store_cached_pdf_swallows_io_errors(
+    settings: SettingsWrapper, tmp_path: Path
+) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    settings.PRINT_CACHE_DIR = blocker / "print"
+
+    store_cached_pdf("key", b"%PDF")
+
+    assert read_cached_pdf("key") is None
+
+
+# =============================================================================
+# evict_lru
+# =============================================================================
+
+
+def test_evict_lru_keeps_directory_within_limit(tmp_path: Path) -> None:
+    for mtime, name in enumerate(["a", "b", "c"], start=1):
+        path = tmp_path / f"{name}.pdf"
+        path.write_bytes(b"1234")
+        os.utime(path, (mtime, mtime))
+
+    deleted = evict_lru(tmp_path, 8)
+
+    assert deleted == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.pdf", "c.pdf"]
+
+
+def test_evict_lru_ignores_foreign_files(tmp_path: Path) -> None:
+    (tmp_path / "upload.tmp").write_bytes(b"123456789")
+
+    assert evict_lru(tmp_path, 0) == 0
+    assert (tmp_path / "upload.tmp").exists()
@@ -4,9 +4,30 @@
 
 """Tests for songs PDF renderer."""
 
+from unittest.mock import Mock
+
 import pytest
+from pytest_django.fixtures import SettingsWrapper
 
-from apps.songs.pdf_renderer import Orientation, PrintSettings, Size, render_song_pdf
+from apps.chords.tests.factories import ChordFactory
+from apps.metrics.metrics import print_warmup_duration_seconds
+from apps.schemes.services import ImageSchemeService
+from apps.schemes.tests.factories import ImageSchemeFactory
+from apps.songs import pdf_renderer
+from apps.songs.models import Song
+from apps.songs.pdf_renderer import (
+    Orientation,
+    PrintSettings,
+    Size,
+    Songbook,
+    SongbookSection,
+    build_song_html,
+    build_songbook_html,
+    html_to_pdf,
+    render_song_pdf,
+    render_songbook_pdf,
+    warm_up_printing,
+)
 from apps.songs.tests.factories import SongFactory
 
 
@@ -101,3 +122,180 @@ def test_render_song_pdf_with_xs_sizes_returns_pdf() -> None:
         _default_settings(chord_size=1, scheme_size=1, text_size=1),
     )
     assert result[:4] == b"%PDF"
+
+
+# =============================================================================
+# build_song_html / build_songbook_html
+# =============================================================================
+
+
+def _songbook(*sections: tuple[str, list[Song]]) -> Songbook:
+    return Songbook(
+        title="Сборник",
+        sections=[SongbookSection(title=t, songs=songs) for t, songs in sections],
+    )
+
+
+@pytest.mark.django_db
+def test_build_song_html_embeds_scheme_print_variant() -> None:
+    scheme = ImageSchemeFactory.build()
+    ImageSchemeService.save_scheme(scheme)
+    song = SongFactory.create(schemes=[scheme])
+
+    html = build_song_html(song, _default_settings())
+
+    assert f"file://{scheme.print_image.path}" in html
+    assert f"file://{scheme.image.path}" not in html
+
+
+@pytest.mark.django_db
+def test_build_song_html_uses_stored_text_html() -> None:
+    song = SongFactory.create(text="**markdown**", text_html="<p>stored</p>")
+
+    html = build_song_html(song, _default_settings())
+
+    assert "<p>stored</p>" in html
+    assert "<strong>" not in html
+
+
+@pytest.mark.django_db
+def test_build_song_html_embeds_chord_diagram_as_data_uri() -> None:
+    chord = ChordFactory.create(svg_vertical="<svg/>")
+    song = SongFactory.create(chords=[chord])
+
+    html = build_song_html(song, _default_settings())
+
+    assert 'src="data:image/svg+xml;base64,PHN2Zy8+"' in html
+
+
+@pytest.mark.django_db
+def test_build_song_html_skips_chords_without_diagram() -> None:
+    song = SongFactory.create(chords=[ChordFactory.create(svg_vertical="")])
+
+    html = build_song_html(song, _default_settings())
+
+    assert "data:image/svg+xml" not in html
+
+
+@pytest.mark.django_db
+def test_build_songbook_html_lists_every_song_in_toc() -> None:
+    first = SongFactory.create(title="Первая")
+    second = SongFactory.create(title="Вторая")
+
+    html = build_songbook_html(
+        _songbook(("Урок 1", [first]), ("Урок 2", [second])), _default_settings()
+    )
+
+    assert html.index("Урок 1") < html.index("Урок 2")
+    assert f'href="#song-{first.uuid}"' in html
+    assert f'href="#song-{second.uuid}"' in html
+
+
+@pytest.mark.django_db
+def test_build_songbook_html_lays_out_shared_song_once() -> None:
+    shared = SongFactory.create()
+
+    html = build_songbook_html(
+        _songbook(("Урок 1", [shared]), ("Урок 2", [shared])), _default_settings()
+    )
+
+    assert html.count(f'href="#song-{shared.uuid}"') == 2
+    assert html.count(f'id="song-{shared.uuid}"') == 1
+
+
+@pytest.mark.django_db
+def test_build_songbook_html_reuses_chord_diagram_across_songs() -> None:
+    chord = ChordFactory.create(svg_vertical="<svg/>")
+    songs = [SongFactory.create(chords=[chord]) for _ in range(2)]
+
+    html = build_songbook_html(_songbook(("", songs)), _default_settings())
+
+    sources = {
+        line.strip() for line in html.splitlines() if "data:image/svg+xml" in line
+    }
+    assert len(sources) == 1
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+def test_render_songbook_pdf_output_is_valid_pdf() -> None:
+    songs = [SongFactory.create(chords=1) for _ in range(2)]
+
+    result = render_songbook_pdf(
+        _songbook(("Урок", songs), ("Повтор", songs[:1])), _default_settings()
+    )
+
+    assert result[:4] == b"%PDF"
+
+
+def test_html_to_pdf_reuses_parsed_stylesheet(monkeypatch: pytest.MonkeyPatch) -> None:
+    html_class = Mock()
+    monkeypatch.setattr(pdf_renderer, "HTML", html_class)
+
+    html_to_pdf("<p>1</p>")
+    html_to_pdf("<p>2</p>")
+
+    first, second = html_class.return_value.write_pdf.call_args_list
+    assert first.kwargs["stylesheets"][0] is second.kwargs["stylesheets"][0]
+    assert first.kwargs["font_config"] is second.kwargs["font_config"]
+
+
+# =============================================================================
+# warm_up_printing
+# =============================================================================
+
+
+def _warmup_duration() -> float:
+    (metric,) = print_warmup_duration_seconds.collect()
+    return metric.samples[0].value
+
+
+def test_warm_up_printing_does_nothing_when_disabled(
+    settings: SettingsWrapper, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings.PRINT_WARMUP = False
+    render = Mock()
+    monkeypatch.setattr(pdf_renderer, "html_to_pdf", render)
+
+    warm_up_printing()
+
+    render.assert_not_called()
+
+
+def test_warm_up_printing_renders_and_records_duration(
+    settings: SettingsWrapper, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings.PRINT_WARMUP = True
+    render = Mock(return_value=b"%PDF")
+    monkeypatch.setattr(pdf_renderer, "html_to_pdf", render)
+    print_warmup_duration_seconds.set(-1)
+
+    warm_up_printing()
+
+    assert "Am Dm E Am" in render.call_args.args[0]
+    duration = _warmup_duration()
+    assert duration >= 0
+
+
+def test_warm_up_printing_swallows_render_errors(
+    settings: SettingsWrapper, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings.PRINT_WARMUP = True
+    monkeypatch.setattr(
+        pdf_renderer, "html_to_pdf", Mock(side_effect=OSError("no fonts"))
+    )
+    print_warmup_duration_seconds.set(-1)
+
+    warm_up_printing()
+
+    assert _warmup_duration() == -1
+
+
+@pytest.mark.integration
+def test_warm_up_printing_lays_out_real_document(settings: SettingsWrapper) -> None:
+    settings.PRINT_WARMUP = True
+
+    warm_up_printing()
+
+    duration = _warmup_duration()
+    assert duration > 0
@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for the print pool."""
+
+import fcntl
+from collections.abc import Generator
+from concurrent.futures import Future
+from pathlib import Path
+from typing import IO
+from unittest.mock import Mock
+
+import pytest
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.songs import print_pool
+from apps.songs.print_pool import (
+    PrintBusyError,
+    PrintQueueFullError,
+    PrintTimeoutError,
+    render_in_pool,
+)
+
+
+@pytest.fixture
+def slots_dir(settings: SettingsWrapper) -> Path:
+    """Configure a pool with one render slot and one queue place."""
+    settings.PRINT_POOL_WORKERS = 1
+    settings.PRINT_QUEUE_DEPTH = 1
+    settings.PRINT_QUEUE_TIMEOUT = 0.1
+    path = Path(settings.PRINT_SLOTS_DIR)
+    path.mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def held_locks() -> Generator[list[IO[bytes]]]:
+    """Collect lock files held by the test and release them afterwards."""
+    files: list[IO[bytes]] = []
+    yield files
+    for file in files:
+        file.close()
+
+
+def _hold(path: Path, held_locks: list[IO[bytes]]) -> None:
+    file = path.open("ab")
+    fcntl.flock(file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    held_locks.append(file)
+
+
+# =============================================================================
+# render_in_pool
+# =============================================================================
+
+
+def test_render_in_pool_renders_in_child_process(slots_dir: Path) -> None:
+    assert render_in_pool(str.encode, "песня") == "песня".encode()
+
+
+def test_render_in_pool_runs_inline_without_workers(
+    settings: SettingsWrapper,
+) -> None:
+    settings.PRINT_POOL_WORKERS = 0
+    render = Mock(return_value=b"%PDF")
+
+    assert render_in_pool(render, "<html/>") == b"%PDF"
+    render.assert_called_once_with("<html/>")
+
+
+def test_render_in_pool_releases_slot_and_ticket(slots_dir: Path) -> None:
+    render_in_pool(str.encode, "first")
+
+    assert render_in_pool(str.encode, "second") == b"second"
+
+
+def test_render_in_pool_rejects_when_queue_is_full(
+    slots_dir: Path, held_locks: list[IO[bytes]]
+) -> None:
+    _hold(slots_dir / "ticket-0.lock", held_locks)
+    _hold(slots_dir / "ticket-1.lock", held_locks)
+
+    with pytest.raises(PrintQueueFullError) as exc_info:
+        render_in_pool(str.encode, "song")
+
+    assert exc_info.value.retry_after > 0
+
+
+def test_render_in_pool_gives_up_waiting_for_slot(
+    slots_dir: Path, held_locks: list[IO[bytes]]
+) -> None:
+    _hold(slots_dir / "ticket-0.lock", held_locks)
+    _hold(slots_dir / "slot-0.lock", held_locks)
+
+    with pytest.raises(PrintBusyError):
+        render_in_pool(str.encode, "song")
+
+
+def test_render_in_pool_kills_render_after_timeout(
+    slots_dir: Path, settings: SettingsWrapper, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings.PRINT_RENDER_TIMEOUT = 0.01
+    executor = Mock()
+    executor.submit.return_value = Future()
+    monkeypatch.setattr(print_pool, "_executor", executor)
+
+    with pytest.raises(PrintTimeoutError):
+        render_in_pool(str.encode, "song")
+
+    executor.terminate_workers.assert_called_once()
+    assert print_pool._executor is None
+
+
+def test_render_in_pool_uses_given_timeout(
+    slots_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    future = Mock()
+    future.result.return_value = b"%PDF"
+    executor = Mock()
+    executor.submit.return_value = future
+    monkeypatch.setattr(print_pool, "_executor", executor)
+
+    assert render_in_pool(str.encode, "songbook", timeout=300) == b"%PDF"
+    future.result.assert_called_once_with(timeout=300)
@@ -8,8 +8,9 @@ import uuid
 
 import pytest
 
-from apps.songs.selectors import get_song_by_uuid
-from apps.songs.tests.factories import SongFactory
+from apps.songs.constants import PrintJobStatusChoice
+from apps.songs.selectors import get_print_job_queue_position, get_song_by_uuid
+from apps.songs.tests.factories import PrintJobFactory, SongFactory
 
 
 @pytest.mark.django_db
@@ -37,3 +38,19 @@ def test_get_song_by_uuid_prefetches_schemes() -> None:
     result = get_song_by_uuid(song.uuid)
     assert result is not None
     assert result.schemes.all().count() == 1
+
+
+@pytest.mark.django_db
+def test_get_print_job_queue_position_counts_older_queued_jobs() -> None:
+    PrintJobFactory.create()
+    PrintJobFactory.create(status=PrintJobStatusChoice.RUNNING)
+    job = PrintJobFactory.create()
+
+    assert get_print_job_queue_position(job) == 1
+
+
+@pytest.mark.django_db
+def test_get_print_job_queue_position_is_none_for_finished_job() -> None:
+    job = PrintJobFactory.create(status=PrintJobStatusChoice.DONE)
+
+    assert get_print_job_queue_position(job) is None
@@ -4,14 +4,41 @@
 
 """Tests for songs services."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
 
 import pytest
+from django.utils import timezone
 
 from apps.lessons.models import Lesson
 from apps.lessons.tests.factories import LessonFactory
-from apps.songs.services import save_song
-from apps.songs.tests.factories import SongFactory
+from apps.songs import pdf_cache
+from apps.songs.constants import (
+    PRINT_JOB_RETENTION,
+    PRINT_JOB_STALE_AFTER,
+    PrintJobStatusChoice,
+)
+from apps.songs.models import PrintJob
+from apps.songs.pdf_renderer import Songbook, SongbookSection
+from apps.songs.print_pool import PrintQueueFullError, PrintTimeoutError
+from apps.songs.services import (
+    claim_next_print_job,
+    enqueue_print_job,
+    enqueue_songbook_print_job,
+    purge_finished_print_jobs,
+    requeue_stale_print_jobs,
+    run_print_job,
+    save_song,
+)
+from apps.songs.tests.factories import PrintJobFactory, SongFactory
+
+
+@pytest.fixture
+def renderer(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace the WeasyPrint renderer with a mock returning fixed bytes."""
+    mock = Mock(return_value=b"%PDF-1.7 job")
+    monkeypatch.setattr(pdf_cache, "render_song_pdf", mock)
+    return mock
 
 
 @pytest.mark.django_db
@@ -25,6 +52,17 @@ def test_save_song_persists_changes_to_the_database() -> None:
     assert song.title == "Обновлённое название"
 
 
+@pytest.mark.django_db
+def test_save_song_renders_text_html() -> None:
+    song = SongFactory.create()
+    song.text = "**Am** Dm"
+
+    save_song(song)
+
+    song.refresh_from_db()
+    assert song.text_html == "<p><strong>Am</strong> Dm</p>"
+
+
 @pytest.mark.django_db
 def test_save_song_propagates_updated_at_to_related_lessons() -> None:
     old_ts = datetime(2026, 1, 1, tzinfo=UTC)
@@ -49,3 +87,169 @@ def test_save_song_does_not_affect_unrelated_lessons() -> None:
 
     unrelated.refresh_from_db()
     assert unrelated.updated_at == old_ts
+
+
+# =============================================================================
+# Print jobs
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_enqueue_print_job_creates_queued_job() -> None:
+    song = SongFactory.create()
+    settings = PrintJobFactory.build().settings
+
+    job = enqueue_print_job(song, settings)
+
+    assert job.status == PrintJobStatusChoice.QUEUED
+    assert job.settings == settings
+
+
+@pytest.mark.django_db
+def test_claim_next_print_job_takes_oldest_queued_job() -> None:
+    first = PrintJobFactory.create()
+    PrintJobFactory.create()
+    PrintJobFactory.create(status=PrintJobStatusChoice.DONE)
+    PrintJob.objects.filter(pk=first.pk).update(
+        created_at=timezone.now() - timedelta(minutes=1)
+    )
+
+    job = claim_next_print_job()
+
+    assert job is not None
+    assert job.pk == first.pk
+    assert job.status == PrintJobStatusChoice.RUNNING
+    assert job.started_at is not None
+
+
+@pytest.mark.django_db
+def test_claim_next_print_job_returns_none_when_queue_is_empty() -> None:
+    PrintJobFactory.create(status=PrintJobStatusChoice.RUNNING)
+
+    assert claim_next_print_job() is None
+
+
+@pytest.mark.django_db
+def test_run_print_job_stores_pdf(renderer: Mock) -> None:
+    PrintJobFactory.create()
+    job = claim_next_print_job()
+    assert job is not None
+
+    run_print_job(job)
+
+    job.refresh_from_db()
+    assert job.status == PrintJobStatusChoice.DONE
+    assert job.finished_at is not None
+    assert job.pdf.read() == b"%PDF-1.7 job"
+
+
+@pytest.mark.django_db
+def test_run_print_job_marks_job_failed_on_render_error(renderer: Mock) -> None:
+    renderer.side_effect = RuntimeError("layout failed")
+    PrintJobFactory.create()
+    job = claim_next_print_job()
+    assert job is not None
+
+    run_print_job(job)
+
+    job.refresh_from_db()
+    assert job.status == PrintJobStatusChoice.FAILED
+    assert "layout failed" in job.error
+
+
+@pytest.mark.django_db
+def test_run_print_job_requeues_job_when_print_pool_is_full(renderer: Mock) -> None:
+    renderer.side_effect = PrintQueueFullError()
+    PrintJobFactory.create()
+    job = claim_next_print_job()
+    assert job is not None
+
+    with pytest.raises(PrintQueueFullError):
+        run_print_job(job)
+
+    job.refresh_from_db()
+    assert job.status == PrintJobStatusChoice.QUEUED
+    assert job.started_at is None
+
+
+@pytest.mark.django_db
+def test_run_print_job_fails_job_when_render_times_out(renderer: Mock) -> None:
+    renderer.side_effect = PrintTimeoutError()
+    PrintJobFactory.create()
+    job = claim_next_print_job()
+    assert job is not None
+
+    run_print_job(job)
+
+    job.refresh_from_db()
+    assert job.status == PrintJobStatusChoice.FAILED
+    assert job.error == "Rendering took too long."
+
+
+@pytest.mark.django_db
+def test_run_print_job_renders_songbook_in_stored_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    render = Mock(return_value=b"%PDF-1.7 songbook")
+    monkeypatch.setattr(pdf_cache, "render_songbook_pdf", render)
+    first, second, deleted = SongFactory.create_batch(3)
+    songbook = Songbook(
+        title="Курс",
+        sections=[
+            SongbookSection(title="Урок", songs=[second, deleted, first]),
+        ],
+    )
+    enqueue_songbook_print_job(songbook, PrintJobFactory.build().settings)
+    deleted.delete()
+    job = claim_next_print_job()
+    assert job is not None
+
+    run_print_job(job)
+
+    job.refresh_from_db()
+    assert job.status == PrintJobStatusChoice.DONE
+    assert job.title == "Курс"
+    printed = render.call_args.args[0]
+    assert printed["title"] == "Курс"
+    assert printed["sections"][0]["songs"] == [second, first]
+
+
+@pytest.mark.django_db
+def test_requeue_stale_print_jobs_requeues_only_old_running_jobs() -> None:
+    now = timezone.now()
+    stale = PrintJobFactory.create(
+        status=PrintJobStatusChoice.RUNNING,
+        started_at=now - PRINT_JOB_STALE_AFTER - timedelta(seconds=1),
+    )
+    fresh = PrintJobFactory.create(status=PrintJobStatusChoice.RUNNING, started_at=now)
+
+    assert requeue_stale_print_jobs() == 1
+
+    stale.refresh_from_db()
+    fresh.refresh_from_db()
+    assert stale.status == PrintJobStatusChoice.QUEUED
+    assert fresh.status == PrintJobStatusChoice.RUNNING
+
+
+@pytest.mark.django_db
+def test_purge_finished_print_jobs_deletes_expired_jobs_and_files(
+    renderer: Mock,
+) -> None:
+    PrintJobFactory.create()
+    job = claim_next_print_job()
+    assert job is not None
+    run_print_job(job)
+    job.refresh_from_db()
+    name = job.pdf.name
+    assert name is not None
+    PrintJob.objects.filter(pk=job.pk).update(
+        finished_at=timezone.now() - PRINT_JOB_RETENTION - timedelta(seconds=1)
+    )
+    recent = PrintJobFactory.create(
+        status=PrintJobStatusChoice.FAILED, finished_at=timezone.now()
+    )
+
+    assert purge_finished_print_jobs() == 1
+
+    assert not job.pdf.storage.exists(name)
+    assert list(PrintJob.objects.values_list("pk", flat=True)) == [recent.pk]
@@ -5,13 +5,19 @@
 """Tests for songs API views."""
 
 import uuid
+from unittest.mock import Mock
 
 import pytest
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from apps.songs.tests.factories import SongFactory
+from apps.songs import pdf_cache
+from apps.songs.constants import PRINT_JOB_QUEUE_LIMIT, PrintJobStatusChoice
+from apps.songs.models import PrintJob
+from apps.songs.print_pool import PrintBusyError, PrintQueueFullError
+from apps.songs.services import claim_next_print_job, run_print_job
+from apps.songs.tests.factories import PrintJobFactory, SongFactory
 
 
 @pytest.fixture
@@ -146,3 +152,139 @@ def test_song_print_with_three_columns_returns_pdf(api_client: APIClient) -> Non
     )
 
     assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("error", "expected_status"),
+    [
+        (PrintQueueFullError(7), status.HTTP_429_TOO_MANY_REQUESTS),
+        (PrintBusyError(7), status.HTTP_503_SERVICE_UNAVAILABLE),
+    ],
+)
+def test_song_print_returns_retry_after_when_print_pool_rejects(
+    api_client: APIClient,
+    monkeypatch: pytest.MonkeyPatch,
+    error: Exception,
+    expected_status: int,
+) -> None:
+    monkeypatch.setattr(pdf_cache, "render_song_pdf", Mock(side_effect=error))
+    song = SongFactory.create()
+
+    response = api_client.post(
+        reverse("song-print", kwargs={"uuid": song.uuid}), data={}, format="json"
+    )
+
+    assert response.status_code == expected_status
+    assert response["Retry-After"] == "7"
+
+
+# =============================================================================
+# Print jobs
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_song_print_job_create_returns_202_with_queued_job(
+    api_client: APIClient,
+) -> None:
+    song = SongFactory.create()
+
+    response = api_client.post(
+        reverse("song-print-job-create", kwargs={"uuid": song.uuid}),
+        data={"columns_count": 2},
+        format="json",
+    )
+
+    job = PrintJob.objects.get()
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.data["uuid"] == str(job.uuid)
+    assert response.data["status"] == PrintJobStatusChoice.QUEUED
+    assert response.data["queue_position"] == 0
+    assert response["Location"].endswith(
+        reverse("print-job-detail", kwargs={"uuid": job.uuid})
+    )
+    assert job.settings["columns_count"] == 2
+
+
+@pytest.mark.django_db
+def test_song_print_job_create_returns_404_for_nonexistent_uuid(
+    api_client: APIClient,
+) -> None:
+    response = api_client.post(
+        reverse("song-print-job-create", kwargs={"uuid": uuid.uuid4()}),
+        data={},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_song_print_job_create_returns_429_when_queue_is_full(
+    api_client: APIClient,
+) -> None:
+    song = SongFactory.create()
+    PrintJobFactory.create_batch(PRINT_JOB_QUEUE_LIMIT, song=song)
+
+    response = api_client.post(
+        reverse("song-print-job-create", kwargs={"uuid": song.uuid}),
+        data={},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert "Retry-After" in response
+
+
+@pytest.mark.django_db
+def test_print_job_detail_reports_queue_position(api_client: APIClient) -> None:
+    PrintJobFactory.create()
+    job = PrintJobFactory.create()
+
+    response = api_client.get(reverse("print-job-detail", kwargs={"uuid": job.uuid}))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["queue_position"] == 1
+    assert response.data["download_url"] is None
+
+
+@pytest.mark.django_db
+def test_print_job_detail_returns_404_for_nonexistent_uuid(
+    api_client: APIClient,
+) -> None:
+    response = api_client.get(
+        reverse("print-job-detail", kwargs={"uuid": uuid.uuid4()})
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+def test_print_job_download_returns_409_until_done(api_client: APIClient) -> None:
+    job = PrintJobFactory.create()
+
+    response = api_client.get(reverse("print-job-pdf", kwargs={"uuid": job.uuid}))
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.django_db
+def test_print_job_download_serves_finished_pdf(
+    api_client: APIClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        pdf_cache, "render_song_pdf", Mock(return_value=b"%PDF-1.7 job")
+    )
+    job = PrintJobFactory.create(song=SongFactory.create(title="Звёздочка"))
+    claimed = claim_next_print_job()
+    assert claimed is not None
+    run_print_job(claimed)
+
+    detail = api_client.get(reverse("print-job-detail", kwargs={"uuid": job.uuid}))
+    response = api_client.get(detail.data["download_url"])
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/pdf"
+    assert response["Content-Disposition"] == 'inline; filename="Zvyozdochka.pdf"'
+    assert response.getvalue() == b"%PDF-1.7 job"
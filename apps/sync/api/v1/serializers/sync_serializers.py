@@ -9,11 +9,25 @@ from typing import Any
 from rest_framework import serializers
 
 from apps.chords.models import Chord
+from apps.chords.sprite import sprite_symbol_ids
 from apps.courses.models import Course, CourseLesson
 from apps.lessons.models import Lesson
+from apps.schemes.image_variants import thumbnail_urls
 from apps.schemes.models import ImageScheme
 
 
+def _unchanged_ids_field() -> serializers.ListField:
+    """Build the `unchanged_*` field, present only when `known_hashes` is sent."""
+    return serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        help_text=(
+            "IDs whose content hash is among `known_hashes`; their bodies are "
+            "omitted from the matching array."
+        ),
+    )
+
+
 class LessonFlatSerializer(serializers.ModelSerializer[Lesson]):
     """Lesson fields only — songs are in the top-level songs array."""
 
@@ -34,6 +48,24 @@ class SongFlatSerializer(serializers.Serializer[Any]):
     scheme_ids = serializers.ListField(child=serializers.IntegerField())
 
 
+class SongSyncSerializer(serializers.Serializer[Any]):
+    """Song sent once per payload (`format_version=3`), without lesson_uuid."""
+
+    uuid = serializers.UUIDField()
+    title = serializers.CharField()
+    text = serializers.CharField()
+    metronome = serializers.IntegerField()
+    chord_ids = serializers.ListField(child=serializers.IntegerField())
+    scheme_ids = serializers.ListField(child=serializers.IntegerField())
+
+
+class LessonSongFlatSerializer(serializers.Serializer[Any]):
+    """Lesson→song membership edge (`format_version=3`)."""
+
+    lesson_uuid = serializers.UUIDField()
+    song_uuid = serializers.UUIDField()
+
+
 class ChordSyncSerializer(serializers.ModelSerializer[Chord]):
     """Chord for offline sync."""
 
@@ -48,15 +80,69 @@ class ChordSyncSerializer(serializers.ModelSerializer[Chord]):
             "has_barre",
             "svg_horizontal",
             "svg_vertical",
+            "content_hash",
         )
 
 
+class ChordSpriteSyncSerializer(serializers.ModelSerializer[Chord]):
+    """Chord for offline sync (`format_version=4`), drawn from the chord sprite."""
+
+    sprite_horizontal = serializers.SerializerMethodField(
+        help_text="Id of the horizontal diagram's symbol in the chord sprite."
+    )
+    sprite_vertical = serializers.SerializerMethodField(
+        help_text="Id of the vertical diagram's symbol in the chord sprite."
+    )
+
+    class Meta:
+        model = Chord
+        fields = (
+            "id",
+            "title",
+            "musical_title",
+            "order_in_note",
+            "start_fret",
+            "has_barre",
+            "sprite_horizontal",
+            "sprite_vertical",
+            "content_hash",
+        )
+
+    @staticmethod
+    def get_sprite_horizontal(obj: Chord) -> str:
+        """Return the symbol id of the horizontal diagram."""
+        return sprite_symbol_ids(obj.pk)[0]
+
+    @staticmethod
+    def get_sprite_vertical(obj: Chord) -> str:
+        """Return the symbol id of the vertical diagram."""
+        return sprite_symbol_ids(obj.pk)[1]
+
+
 class SchemeSyncSerializer(serializers.ModelSerializer[ImageScheme]):
     """Scheme for offline sync."""
 
+    thumbnails = serializers.SerializerMethodField(
+        help_text="WebP thumbnail URLs by width in pixels, narrowest first."
+    )
+
     class Meta:
         model = ImageScheme
-        fields = ("id", "image", "inscription", "height", "width")
+        fields = (
+            "id",
+            "image",
+            "inscription",
+            "height",
+            "width",
+            "print_image",
+            "thumbnails",
+            "content_hash",
+        )
+
+    @staticmethod
+    def get_thumbnails(obj: ImageScheme) -> dict[str, str]:
+        """Return the thumbnail URLs of the scheme."""
+        return thumbnail_urls(obj.thumbnails, obj.image.storage)
 
 
 class CourseFlatSerializer(serializers.ModelSerializer[Course]):
@@ -86,12 +172,123 @@ class SyncLessonsResponseSerializer(serializers.Serializer[Any]):
     lessons = LessonFlatSerializer(many=True)
     songs = SongFlatSerializer(many=True)
     chords = ChordSyncSerializer(many=True)
+    unchanged_chords = _unchanged_ids_field()
+    schemes = SchemeSyncSerializer(many=True)
+    unchanged_schemes = _unchanged_ids_field()
+    course_uuids = serializers.ListField(child=serializers.UUIDField())
+    courses = CourseFlatSerializer(many=True)
+    course_lessons = CourseLessonFlatSerializer(many=True)
+
+
+class SyncRemovedSerializer(serializers.Serializer[Any]):
+    """IDs removed from the synced set since the client's last sync."""
+
+    lessons = serializers.ListField(child=serializers.UUIDField(), source="lesson")
+    courses = serializers.ListField(child=serializers.UUIDField(), source="course")
+    songs = serializers.ListField(child=serializers.UUIDField(), source="song")
+    chords = serializers.ListField(child=serializers.IntegerField(), source="chord")
+    schemes = serializers.ListField(child=serializers.IntegerField(), source="scheme")
+
+
+class SyncDeltaResponseSerializer(serializers.Serializer[Any]):
+    """Delta sync payload for `format_version=2`.
+
+    Same as `SyncLessonsResponseSerializer` but with `removed` in place of
+    the full `lesson_uuids` and `course_uuids` sets.
+    """
+
+    version = serializers.CharField(allow_null=True)
+    removed = SyncRemovedSerializer()
+    lessons = LessonFlatSerializer(many=True)
+    songs = SongFlatSerializer(many=True)
+    chords = ChordSyncSerializer(many=True)
+    unchanged_chords = _unchanged_ids_field()
     schemes = SchemeSyncSerializer(many=True)
+    unchanged_schemes = _unchanged_ids_field()
+    courses = CourseFlatSerializer(many=True)
+    course_lessons = CourseLessonFlatSerializer(many=True)
+
+
+class SyncUniqueSongsResponseSerializer(serializers.Serializer[Any]):
+    """Full sync payload for `format_version=3`.
+
+    Same as `SyncLessonsResponseSerializer` but every song appears once and
+    lesson membership is in `lesson_songs`.
+    """
+
+    version = serializers.CharField(allow_null=True)
+    lesson_uuids = serializers.ListField(child=serializers.UUIDField())
+    lessons = LessonFlatSerializer(many=True)
+    songs = SongSyncSerializer(many=True)
+    lesson_songs = LessonSongFlatSerializer(many=True)
+    chords = ChordSyncSerializer(many=True)
+    unchanged_chords = _unchanged_ids_field()
+    schemes = SchemeSyncSerializer(many=True)
+    unchanged_schemes = _unchanged_ids_field()
     course_uuids = serializers.ListField(child=serializers.UUIDField())
     courses = CourseFlatSerializer(many=True)
     course_lessons = CourseLessonFlatSerializer(many=True)
 
 
+class SyncUniqueSongsDeltaResponseSerializer(serializers.Serializer[Any]):
+    """Delta sync payload for `format_version=3`: removed IDs, unique songs."""
+
+    version = serializers.CharField(allow_null=True)
+    removed = SyncRemovedSerializer()
+    lessons = LessonFlatSerializer(many=True)
+    songs = SongSyncSerializer(many=True)
+    lesson_songs = LessonSongFlatSerializer(many=True)
+    chords = ChordSyncSerializer(many=True)
+    unchanged_chords = _unchanged_ids_field()
+    schemes = SchemeSyncSerializer(many=True)
+    unchanged_schemes = _unchanged_ids_field()
+    courses = CourseFlatSerializer(many=True)
+    course_lessons = CourseLessonFlatSerializer(many=True)
+
+
+class SyncChordSpriteResponseSerializer(serializers.Serializer[Any]):
+    """Full sync payload for `format_version=4`.
+
+    Same as `SyncUniqueSongsResponseSerializer` but chords reference the
+    chord sprite, whose version is in `chord_sprite`.
+    """
+
+    version = serializers.CharField(allow_null=True)
+    chord_sprite = serializers.CharField(
+        help_text="Version of the chord sprite; pass it as `v` when fetching it."
+    )
+    lesson_uuids = serializers.ListField(child=serializers.UUIDField())
+    lessons = LessonFlatSerializer(many=True)
+    songs = SongSyncSerializer(many=True)
+    lesson_songs = LessonSongFlatSerializer(many=True)
+    chords = ChordSpriteSyncSerializer(many=True)
+    unchanged_chords = _unchanged_ids_field()
+    schemes = SchemeSyncSerializer(many=True)
+    unchanged_schemes = _unchanged_ids_field()
+    course_uuids = serializers.ListField(child=serializers.UUIDField())
+    courses = CourseFlatSerializer(many=True)
+    course_lessons = CourseLessonFlatSerializer(many=True)
+
+
+class SyncChordSpriteDeltaResponseSerializer(serializers.Serializer[Any]):
+    """Delta sync payload for `format_version=4`: as 3, chords in the sprite."""
+
+    version = serializers.CharField(allow_null=True)
+    chord_sprite = serializers.CharField(
+        help_text="Version of the chord sprite; pass it as `v` when fetching it."
+    )
+    removed = SyncRemovedSerializer()
+    lessons = LessonFlatSerializer(many=True)
+    songs = SongSyncSerializer(many=True)
+    lesson_songs = LessonSongFlatSerializer(many=True)
+    chords = ChordSpriteSyncSerializer(many=True)
+    unchanged_chords = _unchanged_ids_field()
+    schemes = SchemeSyncSerializer(many=True)
+    unchanged_schemes = _unchanged_ids_field()
+    courses = CourseFlatSerializer(many=True)
+    course_lessons = CourseLessonFlatSerializer(many=True)
+
+
 class ContentVersionResponseSerializer(serializers.Serializer[Any]):
     """Shape of the /api/v1/sync/version/ response."""
 
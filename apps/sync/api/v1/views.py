@@ -5,18 +5,38 @@
 """Views for the sync app."""
 
 import logging
+import re
 from datetime import UTC, datetime
 from typing import Any
 
-from drf_spectacular.utils import OpenApiParameter, extend_schema
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    PolymorphicProxySerializer,
+    extend_schema,
+)
 from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.serializers import Serializer
 from rest_framework.views import APIView
 
-from apps.chords.models import Chord
-from apps.lessons.models import Lesson
-from apps.schemes.models import ImageScheme
+from apps.chords.sprite import get_chord_sprite_version
+from apps.metrics.metrics import sync_response_size_bytes
+from apps.shared.hashing import CONTENT_HASH_LENGTH
+from apps.sync.builders import build_sync_payload
+from apps.sync.constants import (
+    FORMAT_CHORD_SPRITE,
+    FORMAT_LEGACY,
+    FORMAT_UNIQUE_SONGS,
+    FORMAT_VERSIONS,
+    IDENTITY,
+    KNOWN_HASHES_PARAM,
+    PAYLOAD_REVISION,
+)
 from apps.sync.selectors import (
     get_content_version,
     get_course_lessons_for_sync,
@@ -24,15 +44,31 @@ from apps.sync.selectors import (
     get_lessons_for_sync,
     get_published_course_uuids,
     get_published_lesson_uuids,
+    get_removals_since,
+)
+from apps.sync.services import available_encodings, get_full_sync_snapshot
+from apps.sync.utils import (
+    choose_encoding,
+    collect_song_data,
+    collect_unique_song_data,
+    is_not_modified,
+    make_etag,
 )
 
 from .serializers.sync_serializers import (
     ContentVersionResponseSerializer,
+    SyncChordSpriteDeltaResponseSerializer,
+    SyncChordSpriteResponseSerializer,
+    SyncDeltaResponseSerializer,
     SyncLessonsResponseSerializer,
+    SyncUniqueSongsDeltaResponseSerializer,
+    SyncUniqueSongsResponseSerializer,
 )
 
 logger = logging.getLogger("sync")
 
+_CONTENT_HASH_RE = re.compile(rf"[0-9a-f]{{{CONTENT_HASH_LENGTH}}}")
+
 _SINCE_PARAM = OpenApiParameter(
     name="since",
     type=str,
@@ -40,16 +76,62 @@ _SINCE_PARAM = OpenApiParameter(
     description=(
         "ISO-8601 timestamp. When provided, only lessons updated after this "
         "point are included in `lessons`, `songs`, `chords`, and `schemes`. "
-        "`lesson_uuids` always contains the full set of published UUIDs "
-        "regardless of this parameter."
+        "With `format_version=1`, `lesson_uuids` always contains the full set "
+        "of published UUIDs regardless of this parameter."
     ),
     required=False,
     examples=[],
 )
 
+_FORMAT_VERSION_PARAM = OpenApiParameter(
+    name="format_version",
+    type=int,
+    location=OpenApiParameter.QUERY,
+    description=(
+        "Payload format. `1` (default) sends the full `lesson_uuids` and "
+        "`course_uuids` sets on every sync. `2` replaces them in delta "
+        "responses with `removed`: IDs of lessons, courses, songs, chords "
+        "and schemes removed after `since`. `3` is `2` with every song sent "
+        "once (without `lesson_uuid`) and lesson membership in `lesson_songs`. "
+        "`4` is `3` with chord diagrams replaced by symbol ids in the chord "
+        "sprite (`/api/v1/chords/sprite.svg`), whose version is in "
+        "`chord_sprite`."
+    ),
+    required=False,
+    enum=sorted(FORMAT_VERSIONS),
+)
+
+
+_KNOWN_HASHES_PARAM = OpenApiParameter(
+    name=KNOWN_HASHES_PARAM,
+    type=str,
+    location=OpenApiParameter.QUERY,
+    description=(
+        "Comma-separated `content_hash` values of chords and schemes the "
+        "client already stores. Matching chords and schemes are listed by ID "
+        "in `unchanged_chords` / `unchanged_schemes` instead of being sent in "
+        "full. Responses with this parameter are not served pre-compressed."
+    ),
+    required=False,
+)
+
 
 @extend_schema(
-    parameters=[_SINCE_PARAM], responses={200: SyncLessonsResponseSerializer}
+    parameters=[_SINCE_PARAM, _FORMAT_VERSION_PARAM, _KNOWN_HASHES_PARAM],
+    responses={
+        200: PolymorphicProxySerializer(
+            component_name="SyncResponse",
+            serializers=[
+                SyncLessonsResponseSerializer,
+                SyncDeltaResponseSerializer,
+                SyncUniqueSongsResponseSerializer,
+                SyncUniqueSongsDeltaResponseSerializer,
+                SyncChordSpriteResponseSerializer,
+                SyncChordSpriteDeltaResponseSerializer,
+            ],
+            resource_type_field_name=None,
+        )
+    },
 )
 class LessonsSyncView(APIView):
     """Flat sync payload for offline download.
@@ -60,76 +142,207 @@ class LessonsSyncView(APIView):
     Delta sync: use `?since=<ISO-8601>` to receive only changed lessons and
     their associated songs/chords/schemes. `lesson_uuids` and `course_*`
     fields are always the complete published set regardless of `since`.
+    With `?format_version=2` a delta carries `removed` IDs from the
+    tombstone log instead of the full UUID sets, keeping it proportional to
+    the number of changes rather than to the catalog size.
+    `?format_version=3` additionally sends each song once, with lesson
+    membership as a `lesson_songs` edge list, so shared songs (and their
+    long `text`) are not repeated per lesson. `?format_version=4` also
+    leaves the chord SVGs out: clients draw them from the chord sprite.
+    `?known_hashes=` lists the chord and scheme content hashes the client
+    holds; those bodies are replaced by their IDs, which keeps deltas of
+    chord-heavy lessons small.
+
+    Responses carry a strong ETag derived from the content version and
+    `since`; a matching `If-None-Match` gets an empty 304. The full sync is
+    served gzip- or brotli-encoded from pre-compressed snapshot variants
+    when `Accept-Encoding` allows it.
+
+    The version is the content clock, which every synced write moves, so
+    the ETag changes with any edit to the payload — bulk `QuerySet.update`
+    calls outside the services are the one way around it.
     """
 
     permission_classes = (AllowAny,)
 
-    def get(self, request: Request) -> Response:
-        """Return flat sync payload."""
+    def get(self, request: Request) -> HttpResponse:
+        """Return flat sync payload.
+
+        The full sync (no `since`) is served from a pre-encoded snapshot
+        keyed by the content version; delta syncs and requests with
+        `known_hashes` are built per request.
+        """
         since = self._parse_since(request)
         if since is None and "since" in request.query_params:
             return Response(
                 {"detail": "Invalid `since` value — expected ISO-8601 datetime."},
                 status=400,
             )
+        format_version = self._parse_format_version(request)
+        if format_version is None:
+            return Response(
+                {"detail": "Invalid `format_version` value — expected 1, 2, 3 or 4."},
+                status=400,
+            )
 
+        known_hashes = self._parse_known_hashes(request)
+        if known_hashes is None and KNOWN_HASHES_PARAM in request.query_params:
+            return Response(
+                {"detail": "Invalid `known_hashes` value — expected content hashes."},
+                status=400,
+            )
+
+        version = get_content_version()
+        encoding = IDENTITY
+        if since is None and known_hashes is None:
+            encoding = choose_encoding(
+                request.headers.get("Accept-Encoding", ""), available_encodings()
+            )
+        etag = self._etag(version, since, format_version, encoding, known_hashes)
+        if is_not_modified(request, etag):
+            return self._finalize(HttpResponseNotModified(), etag)
+
+        if since is not None or known_hashes is not None:
+            response = HttpResponse(
+                self._render(since, version, format_version, known_hashes),
+                content_type="application/json",
+            )
+            return self._finalize(response, etag)
+
+        layout = (
+            format_version if format_version >= FORMAT_UNIQUE_SONGS else FORMAT_LEGACY
+        )
+        variants = get_full_sync_snapshot(
+            version,
+            lambda: self._render(None, version, layout),
+            layout=layout,
+        )
+        if encoding not in variants:  # built by a worker with another setup
+            encoding = IDENTITY
+            etag = self._etag(version, since, format_version, encoding)
+        body = variants[encoding]
+        sync_response_size_bytes.labels(encoding=encoding).observe(len(body))
+        response = HttpResponse(body, content_type="application/json")
+        if encoding != IDENTITY:
+            response["Content-Encoding"] = encoding
+        return self._finalize(response, etag)
+
+    @staticmethod
+    def _render(
+        since: datetime | None,
+        version: str | None,
+        format_version: int,
+        known_hashes: frozenset[str] | None = None,
+    ) -> bytes:
+        """Return the encoded payload, from the fast builder unless disabled."""
+        if settings.SYNC_FAST_ENCODER:
+            return build_sync_payload(since, version, format_version, known_hashes)
+        body: bytes = JSONRenderer().render(
+            LessonsSyncView._build_payload(since, version, format_version, known_hashes)
+        )
+        return body
+
+    @staticmethod
+    def _build_payload(
+        since: datetime | None,
+        version: str | None,
+        format_version: int,
+        known_hashes: frozenset[str] | None = None,
+    ) -> dict[str, Any]:
+        """Run the sync selectors and serialize the flat payload with DRF.
+
+        The reference implementation `apps.sync.builders` must match.
+
+        Full syncs of formats 1 and 2 are identical, so they share a snapshot.
+        Chords and schemes whose content hash is in `known_hashes` are listed
+        by ID in `unchanged_chords` / `unchanged_schemes` instead.
+        """
         lessons_list = list(get_lessons_for_sync(since))
-        songs_out, chord_map, scheme_map = self._collect_song_data(lessons_list)
+        unique_songs = format_version >= FORMAT_UNIQUE_SONGS
+        chord_sprite = format_version == FORMAT_CHORD_SPRITE
+        payload: dict[str, Any] = {"version": version, "lessons": lessons_list}
+        if chord_sprite:
+            payload["chord_sprite"] = get_chord_sprite_version()
+        if unique_songs:
+            songs_out, lesson_songs, chord_map, scheme_map = collect_unique_song_data(
+                lessons_list
+            )
+            payload["lesson_songs"] = lesson_songs
+        else:
+            songs_out, chord_map, scheme_map = collect_song_data(lessons_list)
 
         logger.debug(
-            "Sync: since=%s lessons=%d songs=%d chords=%d schemes=%d",
+            "Sync: since=%s format=%d lessons=%d songs=%d chords=%d schemes=%d",
             since,
+            format_version,
             len(lessons_list),
             len(songs_out),
             len(chord_map),
             len(scheme_map),
         )
 
-        payload = {
-            "version": get_content_version(),
-            "lesson_uuids": get_published_lesson_uuids(),
-            "lessons": lessons_list,
+        chords, schemes = list(chord_map.values()), list(scheme_map.values())
+        if known_hashes is not None:
+            payload["unchanged_chords"] = [
+                c.pk for c in chords if c.content_hash in known_hashes
+            ]
+            payload["unchanged_schemes"] = [
+                s.pk for s in schemes if s.content_hash in known_hashes
+            ]
+            chords = [c for c in chords if c.content_hash not in known_hashes]
+            schemes = [s for s in schemes if s.content_hash not in known_hashes]
+
+        payload |= {
             "songs": songs_out,
-            "chords": list(chord_map.values()),
-            "schemes": list(scheme_map.values()),
-            "course_uuids": get_published_course_uuids(),
+            "chords": chords,
+            "schemes": schemes,
             "courses": get_courses_for_sync(),
             "course_lessons": get_course_lessons_for_sync(),
         }
-        return Response(SyncLessonsResponseSerializer(payload).data)
+        serializer: type[Serializer[Any]]
+        if since is not None and format_version != FORMAT_LEGACY:
+            payload["removed"] = get_removals_since(since)
+            if chord_sprite:
+                serializer = SyncChordSpriteDeltaResponseSerializer
+            elif unique_songs:
+                serializer = SyncUniqueSongsDeltaResponseSerializer
+            else:
+                serializer = SyncDeltaResponseSerializer
+        else:
+            payload["lesson_uuids"] = get_published_lesson_uuids()
+            payload["course_uuids"] = get_published_course_uuids()
+            if chord_sprite:
+                serializer = SyncChordSpriteResponseSerializer
+            elif unique_songs:
+                serializer = SyncUniqueSongsResponseSerializer
+            else:
+                serializer = SyncLessonsResponseSerializer
+        return serializer(payload).data
 
     @staticmethod
-    def _collect_song_data(
-        lessons: list[Lesson],
-    ) -> tuple[list[dict[str, Any]], dict[int, Chord], dict[int, ImageScheme]]:
-        """Collect songs, chords, and schemes from prefetched lessons.
+    def _finalize(response: HttpResponse, etag: str) -> HttpResponse:
+        """Attach validators; every representation may depend on the encoding."""
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return _with_etag(response, etag)
 
-        No extra DB queries. A song shared across multiple lessons appears once
-        per lesson with a different lesson_uuid — mirrors the M2M relationship.
-        """
-        songs_out: list[dict[str, Any]] = []
-        chord_map: dict[int, Chord] = {}
-        scheme_map: dict[int, ImageScheme] = {}
-
-        for lesson in lessons:
-            for song in lesson.songs.all():
-                song_chords = list(song.chords.all())
-                song_schemes = list(song.schemes.all())
-                songs_out.append({
-                    "uuid": song.uuid,
-                    "lesson_uuid": lesson.uuid,
-                    "title": song.title,
-                    "text": song.text,
-                    "metronome": song.metronome,
-                    "chord_ids": [c.pk for c in song_chords],
-                    "scheme_ids": [s.pk for s in song_schemes],
-                })
-                for c in song_chords:
-                    chord_map.setdefault(c.pk, c)
-                for s in song_schemes:
-                    scheme_map.setdefault(s.pk, s)
-
-        return songs_out, chord_map, scheme_map
+    @staticmethod
+    def _etag(
+        version: str | None,
+        since: datetime | None,
+        format_version: int,
+        encoding: str,
+        known_hashes: frozenset[str] | None = None,
+    ) -> str:
+        """Return the ETag of one representation of the sync payload."""
+        return make_etag(
+            "lessons",
+            PAYLOAD_REVISION,
+            version,
+            since.isoformat() if since else None,
+            format_version,
+            encoding,
+            ",".join(sorted(known_hashes)) if known_hashes is not None else None,
+        )
 
     @staticmethod
     def _parse_since(request: Request) -> datetime | None:
@@ -151,6 +364,38 @@ class LessonsSyncView(APIView):
                 dt = dt.replace(tzinfo=UTC)
             return dt
 
+    @staticmethod
+    def _parse_known_hashes(request: Request) -> frozenset[str] | None:
+        """Parse the ?known_hashes= query param (comma-separated content hashes).
+
+        Returns None if the param is absent or malformed (caller checks
+        `KNOWN_HASHES_PARAM in request.query_params` to tell them apart).
+        An empty value is a valid, empty set.
+        """
+        raw = request.query_params.get(KNOWN_HASHES_PARAM)
+        if raw is None:
+            return None
+        hashes = frozenset(filter(None, (part.strip() for part in raw.split(","))))
+        if not all(_CONTENT_HASH_RE.fullmatch(value) for value in hashes):
+            return None
+        return hashes
+
+    @staticmethod
+    def _parse_format_version(request: Request) -> int | None:
+        """Parse the ?format_version= query param.
+
+        Returns `FORMAT_LEGACY` if the param is absent and None if it is not
+        one of `FORMAT_VERSIONS`.
+        """
+        raw = request.query_params.get("format_version")
+        if raw is None:
+            return FORMAT_LEGACY
+        try:
+            value = int(raw)
+        except ValueError:
+            return None
+        return value if value in FORMAT_VERSIONS else None
+
 
 @extend_schema(responses={200: ContentVersionResponseSerializer})
 class ContentVersionView(APIView):
@@ -158,12 +403,26 @@ class ContentVersionView(APIView):
 
     The client calls this on app launch. If `version` matches the locally
     stored value, no sync is needed. Only when it differs does the client
-    call `LessonsSyncView`.
+    call `LessonsSyncView`. Clients that send the previous ETag back in
+    `If-None-Match` get an empty 304 instead.
     """
 
     permission_classes = (AllowAny,)
 
-    def get(self, request: Request) -> Response:  # noqa: PLR6301
+    def get(self, request: Request) -> HttpResponse:  # noqa: PLR6301
         """Return current content version."""
-        payload = {"version": get_content_version()}
-        return Response(ContentVersionResponseSerializer(payload).data)
+        version = get_content_version()
+        etag = make_etag("version", version)
+        if is_not_modified(request, etag):
+            return _with_etag(HttpResponseNotModified(), etag)
+
+        payload = {"version": version}
+        response = Response(ContentVersionResponseSerializer(payload).data)
+        return _with_etag(response, etag)
+
+
+def _with_etag(response: HttpResponse, etag: str) -> HttpResponse:
+    """Attach the ETag and ask caches to revalidate before reusing the body."""
+    response["ETag"] = etag
+    response["Cache-Control"] = "no-cache"
+    return response
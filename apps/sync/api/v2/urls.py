@@ -0,0 +1,13 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""URL configuration for sync API v2."""
+
+from django.urls import path
+
+from .views import LessonsStreamView
+
+urlpatterns = [
+    path("sync/lessons/", LessonsStreamView.as_view(), name="sync-lessons-stream"),
+]
@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Views for the sync app, API v2."""
+
+import logging
+from collections.abc import Iterator, Mapping
+from datetime import UTC, datetime
+from typing import Any
+
+from django.http import StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.permissions import AllowAny
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.sync.api.v1.serializers.sync_serializers import (
+    ChordSyncSerializer,
+    CourseFlatSerializer,
+    CourseLessonFlatSerializer,
+    LessonFlatSerializer,
+    SchemeSyncSerializer,
+    SongFlatSerializer,
+    SyncRemovedSerializer,
+)
+from apps.sync.constants import NDJSON_CONTENT_TYPE, STREAM_BATCH_SIZE
+from apps.sync.selectors import (
+    get_content_version,
+    get_course_lessons_for_sync,
+    get_courses_for_sync,
+    get_lesson_batch_for_sync,
+    get_removals_since,
+)
+from apps.sync.utils import collect_song_data, decode_cursor, encode_cursor
+
+logger = logging.getLogger("sync")
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Render a response as a single NDJSON line.
+
+    Only used for error responses; the stream itself is written by the view.
+    Registering it lets clients send `Accept: application/x-ndjson`.
+    """
+
+    media_type = NDJSON_CONTENT_TYPE
+    format = "ndjson"
+
+    def render(  # noqa: PLR6301
+        self,
+        data: Any,  # noqa: ANN401
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        """Return `data` as one compact JSON line."""
+        body: bytes = JSONRenderer().render(data)
+        return body + b"\n"
+
+
+@extend_schema(
+    parameters=[
+        OpenApiParameter(
+            name="since",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=(
+                "ISO-8601 timestamp. Only lessons updated after it are streamed "
+                "and `removed` lists what was removed after it."
+            ),
+            required=False,
+        ),
+        OpenApiParameter(
+            name="cursor",
+            type=str,
+            location=OpenApiParameter.QUERY,
+            description=(
+                "Value of the last `cursor` line received. Resumes an "
+                "interrupted download; `since` is taken from the cursor."
+            ),
+            required=False,
+        ),
+    ],
+    responses={(200, NDJSON_CONTENT_TYPE): OpenApiTypes.STR},
+)
+class LessonsStreamView(APIView):
+    """Streaming sync for very large catalogs.
+
+    Writes newline-delimited JSON, one object per line, tagged by `type`:
+
+    - `meta`: `{"version": ...}`, always first;
+    - `lesson`, `song`, `chord`, `scheme`: one entity in `data`, in the same
+      shape as the v1 payload arrays. Lessons go in (updated_at, id) order,
+      each chord and scheme is sent once per response;
+    - `cursor`: after every batch of lessons. Pass the last one back as
+      `?cursor=` to resume an interrupted download;
+    - `course`, `course_lesson`: the complete published set, after lessons;
+    - `removed` (delta only): IDs removed after `since`, as in v1
+      `format_version=2`;
+    - `end`: `{"version": ...}`, the last line. A stream without it was
+      cut off.
+
+    Lessons are fetched `STREAM_BATCH_SIZE` at a time, so worker memory stays
+    flat regardless of catalog size.
+    """
+
+    permission_classes = (AllowAny,)
+    renderer_classes = (JSONRenderer, NDJSONRenderer)
+
+    def get(self, request: Request) -> HttpResponseBase:
+        """Stream the sync payload from `since` or from a cursor."""
+        try:
+            since, after = self._parse_position(request)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=400)
+
+        response = StreamingHttpResponse(
+            self._stream(since, after), content_type=NDJSON_CONTENT_TYPE
+        )
+        response["Cache-Control"] = "no-store"
+        return response
+
+    def _stream(
+        self, since: datetime | None, after: tuple[datetime, int] | None
+    ) -> Iterator[bytes]:
+        """Yield the NDJSON lines of one sync response."""
+        version = get_content_version()
+        yield _line("meta", {"version": version})
+
+        seen_chords: set[int] = set()
+        seen_schemes: set[int] = set()
+        batches = 0
+        while True:
+            batch = get_lesson_batch_for_sync(since, after, STREAM_BATCH_SIZE)
+            if not batch:
+                break
+            batches += 1
+            yield from self._batch_lines(batch, seen_chords, seen_schemes)
+            last = batch[-1]
+            after = (last.updated_at, last.pk)
+            yield _line("cursor", {"cursor": encode_cursor(since, *after)})
+            if len(batch) < STREAM_BATCH_SIZE:
+                break
+
+        for course in get_courses_for_sync().iterator():
+            yield _line("course", CourseFlatSerializer(course).data)
+        for membership in get_course_lessons_for_sync().iterator():
+            yield _line("course_lesson", CourseLessonFlatSerializer(membership).data)
+        if since is not None:
+            yield _line(
+                "removed", SyncRemovedSerializer(get_removals_since(since)).data
+            )
+        yield _line("end", {"version": version})
+
+        logger.debug(
+            "Sync stream: since=%s batches=%d chords=%d schemes=%d",
+            since,
+            batches,
+            len(seen_chords),
+            len(seen_schemes),
+        )
+
+    @staticmethod
+    def _batch_lines(
+        batch: list[Any], seen_chords: set[int], seen_schemes: set[int]
+    ) -> Iterator[bytes]:
+        """Yield lessons of one batch followed by their songs, chords, schemes."""
+        songs, chord_map, scheme_map = collect_song_data(batch)
+        for lesson in batch:
+            yield _line("lesson", LessonFlatSerializer(lesson).data)
+        for song in songs:
+            yield _line("song", SongFlatSerializer(song).data)
+        for pk, chord in chord_map.items():
+            if pk not in seen_chords:
+                seen_chords.add(pk)
+                yield _line("chord", ChordSyncSerializer(chord).data)
+        for pk, scheme in scheme_map.items():
+            if pk not in seen_schemes:
+                seen_schemes.add(pk)
+                yield _line("scheme", SchemeSyncSerializer(scheme).data)
+
+    @staticmethod
+    def _parse_position(
+        request: Request,
+    ) -> tuple[datetime | None, tuple[datetime, int] | None]:
+        """Return `since` and the keyset position to continue after.
+
+        Raises:
+            ValueError: If `cursor` or `since` is present but invalid.
+        """
+        cursor = request.query_params.get("cursor")
+        if cursor is not None:
+            return decode_cursor(cursor)
+
+        raw = request.query_params.get("since")
+        if raw is None:
+            return None, None
+        try:
+            since = datetime.fromisoformat(raw)
+        except ValueError as exc:
+            msg = "Invalid `since` value — expected ISO-8601 datetime."
+            raise ValueError(msg) from exc
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        return since, None
+
+
+def _line(kind: str, data: Mapping[str, Any]) -> bytes:
+    """Encode one NDJSON line of the stream."""
+    body: bytes = JSONRenderer().render({"type": kind, "data": data})
+    return body + b"\n"
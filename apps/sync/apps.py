@@ -12,3 +12,7 @@ class SyncConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.sync"
+
+    def ready(self) -> None:  # noqa: PLR6301
+        """Connect the receivers that feed the tombstone log."""
+        from . import signals  # noqa: F401, PLC0415
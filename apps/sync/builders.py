@@ -0,0 +1,294 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""values()-based builder for the flat sync payload.
+
+Produces the same bytes as rendering the sync serializers with DRF's
+`JSONRenderer`, without instantiating model objects or running DRF field
+machinery per row: rows are read as tuples, M2M ids come from the through
+tables in bulk, and the result is encoded with orjson. Field names and
+order are taken from the serializers, so the two paths cannot drift apart
+silently — `test_builders.py` compares their output byte for byte.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Any
+
+import orjson
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework.serializers import Serializer
+
+from apps.chords.models import Chord
+from apps.chords.sprite import get_chord_sprite_version, sprite_symbol_ids
+from apps.lessons.models import Lesson
+from apps.schemes.image_variants import thumbnail_urls
+from apps.schemes.models import ImageScheme
+from apps.songs.models import Song
+
+from .api.v1.serializers.sync_serializers import (
+    ChordSpriteSyncSerializer,
+    ChordSyncSerializer,
+    CourseFlatSerializer,
+    LessonFlatSerializer,
+    SchemeSyncSerializer,
+    SyncChordSpriteDeltaResponseSerializer,
+    SyncChordSpriteResponseSerializer,
+    SyncDeltaResponseSerializer,
+    SyncLessonsResponseSerializer,
+    SyncUniqueSongsDeltaResponseSerializer,
+    SyncUniqueSongsResponseSerializer,
+)
+from .constants import (
+    FORMAT_CHORD_SPRITE,
+    FORMAT_LEGACY,
+    FORMAT_UNIQUE_SONGS,
+    EntityType,
+)
+from .selectors import (
+    get_course_lessons_for_sync,
+    get_courses_for_sync,
+    get_published_course_uuids,
+    get_published_lesson_uuids,
+    get_removals_since,
+)
+
+_LessonSong = Lesson.songs.through
+_SongChord = Song.chords.through
+_SongScheme = Song.schemes.through
+
+
+def build_sync_payload(
+    since: datetime | None,
+    version: str | None,
+    format_version: int,
+    known_hashes: frozenset[str] | None = None,
+) -> bytes:
+    """Return the encoded sync payload for `since` and `format_version`.
+
+    Byte-identical to `JSONRenderer().render(LessonsSyncView._build_payload(...))`
+    for the same arguments and database state, in a constant number of
+    queries.
+    """
+    unique_songs = format_version >= FORMAT_UNIQUE_SONGS
+    chord_sprite = format_version == FORMAT_CHORD_SPRITE
+    sections: dict[str, Any] = {"version": version}
+    if chord_sprite:
+        sections["chord_sprite"] = get_chord_sprite_version()
+    sections |= _lesson_sections(
+        since, unique_songs=unique_songs, chord_sprite=chord_sprite
+    )
+    if known_hashes is not None:
+        for name in ("chords", "schemes"):
+            bodies = sections[name]
+            sections[f"unchanged_{name}"] = [
+                body["id"] for body in bodies if body["content_hash"] in known_hashes
+            ]
+            sections[name] = [
+                body for body in bodies if body["content_hash"] not in known_hashes
+            ]
+    sections |= {"courses": _courses(), "course_lessons": _course_lessons()}
+    serializer: type[Serializer[Any]]
+    if since is not None and format_version != FORMAT_LEGACY:
+        sections["removed"] = _removed(since)
+        if chord_sprite:
+            serializer = SyncChordSpriteDeltaResponseSerializer
+        elif unique_songs:
+            serializer = SyncUniqueSongsDeltaResponseSerializer
+        else:
+            serializer = SyncDeltaResponseSerializer
+    else:
+        sections["lesson_uuids"] = [str(pk) for pk in get_published_lesson_uuids()]
+        sections["course_uuids"] = [str(pk) for pk in get_published_course_uuids()]
+        if chord_sprite:
+            serializer = SyncChordSpriteResponseSerializer
+        elif unique_songs:
+            serializer = SyncUniqueSongsResponseSerializer
+        else:
+            serializer = SyncLessonsResponseSerializer
+    names = list(serializer().fields.keys())
+    return _encode({name: sections[name] for name in names if name in sections})
+
+
+def _lesson_sections(  # noqa: PLR0914
+    since: datetime | None, *, unique_songs: bool, chord_sprite: bool
+) -> dict[str, list[dict[str, Any]]]:
+    """Return `lessons`, `songs`, `lesson_songs`, `chords` and `schemes`.
+
+    Songs, chords and schemes appear in the order `collect_song_data` (or
+    `collect_unique_song_data`) meets them walking the prefetched lessons.
+    """
+    lessons = Lesson.objects.filter(is_published=True).order_by("updated_at", "id")
+    if since is not None:
+        lessons = lessons.filter(updated_at__gt=since)
+    lesson_fields = LessonFlatSerializer.Meta.fields
+    lesson_rows = list(lessons.values_list("id", *lesson_fields))
+
+    lesson_songs = _LessonSong.objects.filter(lesson__in=lessons.values("id"))
+    song_ids = lesson_songs.values("song_id")
+    song_chords = _SongChord.objects.filter(song_id__in=song_ids)
+    song_schemes = _SongScheme.objects.filter(song_id__in=song_ids)
+    songs = {
+        row[0]: row[1:]
+        for row in Song.objects.filter(pk__in=song_ids).values_list(
+            "id", "uuid", "title", "text", "metronome"
+        )
+    }
+    songs_of = _group(lesson_songs.values_list("lesson_id", "song_id"))
+    chords_of = _group(song_chords.values_list("song_id", "chord_id"))
+    schemes_of = _group(song_schemes.values_list("song_id", "imagescheme_id"))
+
+    songs_out: list[dict[str, Any]] = []
+    edges_out: list[dict[str, Any]] = []
+    seen_songs: set[int] = set()
+    for lesson_pk, lesson_uuid, *_ in lesson_rows:
+        for song_pk in songs_of.get(lesson_pk, ()):
+            song_uuid, title, text, metronome = songs[song_pk]
+            song: dict[str, Any] = {"uuid": str(song_uuid)}
+            if unique_songs:
+                edges_out.append({
+                    "lesson_uuid": str(lesson_uuid),
+                    "song_uuid": song["uuid"],
+                })
+                if song_pk in seen_songs:
+                    continue
+                seen_songs.add(song_pk)
+            else:
+                song["lesson_uuid"] = str(lesson_uuid)
+            songs_out.append(
+                song
+                | {
+                    "title": title,
+                    "text": text,
+                    "metronome": metronome,
+                    "chord_ids": chords_of.get(song_pk, []),
+                    "scheme_ids": schemes_of.get(song_pk, []),
+                }
+            )
+
+    chords = _chords(
+        Chord.objects.filter(pk__in=song_chords.values("chord_id")),
+        chord_sprite=chord_sprite,
+    )
+    schemes = _rows_by_id(
+        ImageScheme.objects.filter(pk__in=song_schemes.values("imagescheme_id")),
+        SchemeSyncSerializer.Meta.fields,
+    )
+    image_storage = ImageScheme._meta.get_field("image").storage
+    for scheme in schemes.values():
+        # DRF's ImageField renders the storage URL (no request in context).
+        for field in ("image", "print_image"):
+            scheme[field] = image_storage.url(scheme[field]) if scheme[field] else None
+        scheme["thumbnails"] = thumbnail_urls(scheme["thumbnails"], image_storage)
+
+    return {
+        "lessons": [_lesson(lesson_fields, row[1:]) for row in lesson_rows],
+        "songs": songs_out,
+        "lesson_songs": edges_out,
+        "chords": [chords[pk] for pk in _first_seen(songs_out, "chord_ids")],
+        "schemes": [schemes[pk] for pk in _first_seen(songs_out, "scheme_ids")],
+    }
+
+
+def _chords(qs: QuerySet[Chord], *, chord_sprite: bool) -> dict[int, dict[str, Any]]:
+    """Return `{id: chord}` as the chord serializer of the format renders them."""
+    if not chord_sprite:
+        return _rows_by_id(qs, ChordSyncSerializer.Meta.fields)
+    fields = ChordSpriteSyncSerializer.Meta.fields
+    sprite_fields = ("sprite_horizontal", "sprite_vertical")
+    chords = _rows_by_id(qs, [name for name in fields if name not in sprite_fields])
+    for pk, chord in chords.items():
+        chord.update(zip(sprite_fields, sprite_symbol_ids(pk), strict=True))
+    return {pk: {name: chord[name] for name in fields} for pk, chord in chords.items()}
+
+
+def _courses() -> list[dict[str, Any]]:
+    """Return published courses as CourseFlatSerializer renders them."""
+    fields = CourseFlatSerializer.Meta.fields
+    courses = [
+        dict(zip(fields, row, strict=True))
+        for row in get_courses_for_sync().values_list(*fields)
+    ]
+    for course in courses:
+        course["uuid"] = str(course["uuid"])
+        course["created_at"] = _datetime(course["created_at"])
+        course["updated_at"] = _datetime(course["updated_at"])
+    return courses
+
+
+def _course_lessons() -> list[dict[str, Any]]:
+    """Return published memberships as CourseLessonFlatSerializer renders them."""
+    return [
+        {"course_uuid": str(course), "lesson_uuid": str(lesson), "order": order}
+        for course, lesson, order in get_course_lessons_for_sync().values_list(
+            "course__uuid", "lesson__uuid", "order"
+        )
+    ]
+
+
+def _removed(since: datetime) -> dict[str, list[Any]]:
+    """Return removals after `since` as SyncRemovedSerializer renders them."""
+    removed = get_removals_since(since)
+    return {
+        "lessons": removed[EntityType.LESSON],
+        "courses": removed[EntityType.COURSE],
+        "songs": removed[EntityType.SONG],
+        "chords": [int(pk) for pk in removed[EntityType.CHORD]],
+        "schemes": [int(pk) for pk in removed[EntityType.SCHEME]],
+    }
+
+
+def _group(rows: Iterable[tuple[int, int]]) -> dict[int, list[int]]:
+    """Group (key, value) pairs into `{key: [value, ...]}`, values ascending.
+
+    Matches the id ordering of the prefetches in `get_lessons_for_sync`.
+    """
+    grouped: defaultdict[int, list[int]] = defaultdict(list)
+    for key, value in rows:
+        grouped[key].append(value)
+    for values in grouped.values():
+        values.sort()
+    return grouped
+
+
+def _first_seen(songs: list[dict[str, Any]], key: str) -> Iterable[int]:
+    """Return the ids listed under `key` in `songs`, deduplicated in order."""
+    return dict.fromkeys(pk for song in songs for pk in song[key])
+
+
+def _rows_by_id(qs: QuerySet[Any], fields: Sequence[str]) -> dict[int, dict[str, Any]]:
+    """Return `{id: {field: value}}` for `qs`; `fields` must start with `id`."""
+    return {
+        row[0]: dict(zip(fields, row, strict=True)) for row in qs.values_list(*fields)
+    }
+
+
+def _lesson(fields: Sequence[str], row: Sequence[Any]) -> dict[str, Any]:
+    """Return a lesson row as LessonFlatSerializer renders it."""
+    lesson = dict(zip(fields, row, strict=True))
+    lesson["uuid"] = str(lesson["uuid"])
+    lesson["updated_at"] = _datetime(lesson["updated_at"])
+    return lesson
+
+
+def _datetime(value: datetime) -> str:
+    """Format a datetime the way DRF's DateTimeField does (ISO-8601, `Z` for UTC)."""
+    text = timezone.localtime(value).isoformat()
+    return text.removesuffix("+00:00") + "Z" if text.endswith("+00:00") else text
+
+
+def _encode(payload: dict[str, Any]) -> bytes:
+    """Encode like DRF's JSONRenderer with its default compact, unicode settings.
+
+    orjson already writes compact JSON without escaping non-ASCII text;
+    JSONRenderer additionally escapes U+2028 and U+2029.
+    """
+    return (
+        orjson
+        .dumps(payload)
+        .replace(b"\xe2\x80\xa8", b"\\u2028")
+        .replace(b"\xe2\x80\xa9", b"\\u2029")
+    )
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Module-level constants for the sync app."""
+
+from typing import Final
+
+from django.db import models
+
+SNAPSHOT_CACHE_ALIAS: Final[str] = "sync"
+"""Cache alias for full-sync snapshots (shared between workers, see CACHES)."""
+
+SNAPSHOT_CACHE_PREFIX: Final[str] = "sync:snapshot"
+"""Cache key prefix for pre-rendered full-sync payloads."""
+
+SNAPSHOT_CURRENT_KEY: Final[str] = f"{SNAPSHOT_CACHE_PREFIX}:current"
+"""Cache key prefix holding the key of the live snapshot of each layout."""
+
+SNAPSHOT_TIMEOUT: Final[int | None] = None
+"""Snapshot lifetime: none, every content edit moves the content clock.
+
+A snapshot is keyed by the version it was built for and dropped when the
+next version is built, so it can live until then.
+"""
+
+SNAPSHOT_BUILD_LOCK_TIMEOUT: Final[int] = 60
+"""Seconds a snapshot build lock is held before another worker may rebuild."""
+
+SNAPSHOT_BUILD_WAIT: Final[float] = 5.0
+"""Seconds a request waits for another worker's build before rendering itself."""
+
+SNAPSHOT_BUILD_POLL: Final[float] = 0.05
+"""Seconds between cache checks while waiting for another worker's build."""
+
+IDENTITY: Final[str] = "identity"
+"""Content-coding name for an uncompressed body."""
+
+GZIP: Final[str] = "gzip"
+"""Content-coding name for gzip."""
+
+BROTLI: Final[str] = "br"
+"""Content-coding name for brotli."""
+
+ENCODING_PREFERENCE: Final[tuple[str, ...]] = (BROTLI, GZIP, IDENTITY)
+"""Server-side preference between encodings the client rates equally."""
+
+FORMAT_LEGACY: Final[int] = 1
+"""Original payload: delta syncs carry the full published UUID sets."""
+
+FORMAT_TOMBSTONES: Final[int] = 2
+"""Delta syncs carry `removed` IDs from the tombstone log instead."""
+
+FORMAT_UNIQUE_SONGS: Final[int] = 3
+"""As 2, plus each song is sent once and lesson membership in `lesson_songs`."""
+
+FORMAT_CHORD_SPRITE: Final[int] = 4
+"""As 3, but chords name their symbols in the chord sprite instead of carrying SVGs."""
+
+FORMAT_VERSIONS: Final[frozenset[int]] = frozenset({
+    FORMAT_LEGACY,
+    FORMAT_TOMBSTONES,
+    FORMAT_UNIQUE_SONGS,
+    FORMAT_CHORD_SPRITE,
+})
+"""Payload format versions a client may request via `?format_version=`."""
+
+PAYLOAD_REVISION: Final[int] = 2
+"""Revision of the payload fields, bumped whenever they change.
+
+Part of the snapshot cache key and the ETag, so bodies cached or held by
+clients from before a deploy are not reused after the fields change.
+"""
+
+KNOWN_HASHES_PARAM: Final[str] = "known_hashes"
+"""Query parameter listing the chord and scheme content hashes a client has."""
+
+
+CONTENT_CLOCK_PK: Final[int] = 1
+"""Primary key of the single `ContentClock` row."""
+
+STREAM_BATCH_SIZE: Final[int] = 200
+"""Lessons fetched (with their songs, chords and schemes) per streamed batch."""
+
+STREAM_CURSOR_SALT: Final[str] = "sync.stream.cursor"
+"""Signing salt for the resumable cursors of the streaming sync endpoint."""
+
+NDJSON_CONTENT_TYPE: Final[str] = "application/x-ndjson"
+"""Media type of the streaming sync response (one JSON document per line)."""
+
+
+class EntityType(models.TextChoices):
+    """Kinds of synced entities that can be removed from the client."""
+
+    LESSON = "lesson", "Урок"
+    COURSE = "course", "Курс"
+    SONG = "song", "Песня"
+    CHORD = "chord", "Аккорд"
+    SCHEME = "scheme", "Схема"
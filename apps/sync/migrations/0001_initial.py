@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 19:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "entity_type",
+                    models.CharField(
+                        choices=[
+                            ("lesson", "Урок"),
+                            ("course", "Курс"),
+                            ("song", "Песня"),
+                            ("chord", "Аккорд"),
+                            ("scheme", "Схема"),
+                        ],
+                        max_length=10,
+                        verbose_name="Тип",
+                    ),
+                ),
+                (
+                    "entity_id",
+                    models.CharField(max_length=36, verbose_name="Идентификатор"),
+                ),
+                (
+                    "removed_at",
+                    models.DateTimeField(db_index=True, verbose_name="Удалено"),
+                ),
+            ],
+            options={
+                "verbose_name": "Удалённая запись",
+                "verbose_name_plural": "Удалённые записи",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("entity_type", "entity_id"),
+                        name="unique_tombstone_entity",
+                    )
+                ],
+            },
+        ),
+    ]
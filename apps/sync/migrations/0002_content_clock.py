@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+# Generated by Django 6.0.7 on 2026-10-18 19:50
+
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.models import Max
+
+
+def seed_clock(apps: Apps, _schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Start the clock at the version clients already hold, so none resyncs."""
+    Lesson = apps.get_model("lessons", "Lesson")
+    Tombstone = apps.get_model("sync", "Tombstone")
+    ContentClock = apps.get_model("sync", "ContentClock")
+    latest = Lesson.objects.filter(is_published=True).aggregate(ts=Max("updated_at"))
+    if latest["ts"] is None:
+        return
+    removed = Tombstone.objects.aggregate(ts=Max("removed_at"))["ts"]
+    changed_at = max(latest["ts"], removed) if removed else latest["ts"]
+    ContentClock.objects.create(pk=1, changed_at=changed_at)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lessons", "0003_add_updated_at_id_index"),
+        ("sync", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentClock",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("changed_at", models.DateTimeField(verbose_name="Изменено")),
+            ],
+            options={
+                "verbose_name": "Версия контента",
+                "verbose_name_plural": "Версия контента",
+            },
+        ),
+        migrations.RunPython(seed_clock, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Models for the sync app."""
+
+from typing import ClassVar
+
+from django.db import models
+
+from apps.sync.constants import EntityType
+
+
+class ContentClock(models.Model):
+    """Singleton row stamped whenever anything in the sync payload changes.
+
+    Bumped by the sync signal receivers on lesson, course, song, chord,
+    scheme and membership writes, and explicitly by bulk service paths that
+    bypass signals. Reading it is the O(1) content-version check.
+
+    Attributes:
+        changed_at (datetime): Time of the latest content change. Never
+            moves backwards and is never older than any synced updated_at.
+    """
+
+    changed_at = models.DateTimeField("Изменено")
+
+    class Meta:
+        verbose_name = "Версия контента"
+        verbose_name_plural = "Версия контента"
+
+    def __str__(self) -> str:
+        return f"Content changed at {self.changed_at}"
+
+
+class Tombstone(models.Model):
+    """Change-log entry for an entity clients must drop on their next sync.
+
+    Written when a lesson or course is unpublished and when a lesson,
+    course, song, chord or scheme is deleted; removed again when the entity
+    is re-published. Lets delta syncs send only what disappeared since the
+    client's last sync instead of the whole published set.
+
+    Attributes:
+        entity_type (str): Kind of the removed entity.
+        entity_id (str): UUID (lessons, courses, songs) or primary key
+            (chords, schemes) as the sync payload identifies the entity.
+        removed_at (datetime): When the entity stopped being synced.
+    """
+
+    entity_type = models.CharField("Тип", max_length=10, choices=EntityType.choices)
+    entity_id = models.CharField("Идентификатор", max_length=36)
+    removed_at = models.DateTimeField("Удалено", db_index=True)
+
+    class Meta:
+        verbose_name = "Удалённая запись"
+        verbose_name_plural = "Удалённые записи"
+        constraints: ClassVar[list[models.BaseConstraint]] = [
+            models.UniqueConstraint(
+                fields=("entity_type", "entity_id"),
+                name="unique_tombstone_entity",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.entity_type} {self.entity_id} removed at {self.removed_at}"
@@ -6,11 +6,31 @@
 
 import uuid
 from datetime import datetime
+from typing import Any
 
-from django.db.models import Max, QuerySet
+from django.db.models import Prefetch, Q, QuerySet
 
+from apps.chords.models import Chord
 from apps.courses.models import Course, CourseLesson
 from apps.lessons.models import Lesson
+from apps.schemes.models import ImageScheme
+from apps.songs.models import Song
+
+from .constants import CONTENT_CLOCK_PK, EntityType
+from .models import ContentClock, Tombstone
+
+
+def _song_prefetches() -> "tuple[Prefetch[Any], ...]":
+    """Prefetch lesson songs with their chords and schemes, each in id order.
+
+    The explicit ordering keeps the payload deterministic, which the
+    values()-based builder in `apps.sync.builders` relies on for parity.
+    """
+    return (
+        Prefetch("songs", queryset=Song.objects.order_by("id")),
+        Prefetch("songs__chords", queryset=Chord.objects.order_by("id")),
+        Prefetch("songs__schemes", queryset=ImageScheme.objects.order_by("id")),
+    )
 
 
 def get_lessons_for_sync(since: datetime | None = None) -> QuerySet[Lesson]:
@@ -22,17 +42,42 @@ def get_lessons_for_sync(since: datetime | None = None) -> QuerySet[Lesson]:
     qs = (
         Lesson.objects
         .filter(is_published=True)
-        .order_by("updated_at")
-        .prefetch_related(
-            "songs__chords",
-            "songs__schemes",
-        )
+        .order_by("updated_at", "id")
+        .prefetch_related(*_song_prefetches())
     )
     if since is not None:
         qs = qs.filter(updated_at__gt=since)
     return qs
 
 
+def get_lesson_batch_for_sync(
+    since: datetime | None,
+    after: tuple[datetime, int] | None,
+    limit: int,
+) -> list[Lesson]:
+    """Return the next `limit` published lessons in (updated_at, id) order.
+
+    Keyset pagination: `after` is the (updated_at, id) of the last lesson
+    already sent, so each batch is an index range scan and the position
+    stays valid when lessons are edited in between — an edited lesson gets
+    a newer updated_at and is simply sent again at the end.
+    """
+    qs = (
+        Lesson.objects
+        .filter(is_published=True)
+        .order_by("updated_at", "id")
+        .prefetch_related(*_song_prefetches())
+    )
+    if since is not None:
+        qs = qs.filter(updated_at__gt=since)
+    if after is not None:
+        updated_at, pk = after
+        qs = qs.filter(
+            Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=pk)
+        )
+    return list(qs[:limit])
+
+
 def get_published_lesson_uuids() -> list[uuid.UUID]:
     """Return UUIDs of all currently published lessons.
 
@@ -48,7 +93,7 @@ def get_courses_for_sync() -> QuerySet[Course]:
     Always the full set — no delta filtering — since course membership changes
     do not bump Lesson.updated_at.
     """
-    return Course.objects.filter(is_published=True).order_by("updated_at")
+    return Course.objects.filter(is_published=True).order_by("updated_at", "id")
 
 
 def get_course_lessons_for_sync() -> QuerySet[CourseLesson]:
@@ -61,7 +106,7 @@ def get_course_lessons_for_sync() -> QuerySet[CourseLesson]:
         CourseLesson.objects
         .filter(course__is_published=True, lesson__is_published=True)
         .select_related("course", "lesson")
-        .order_by("course__updated_at", "order")
+        .order_by("course__updated_at", "course_id", "order")
     )
 
 
@@ -75,14 +120,38 @@ def get_published_course_uuids() -> list[uuid.UUID]:
 
 
 def get_content_version() -> str | None:
-    """Return the latest lesson updated_at as an ISO-8601 string.
+    """Return the content clock as an ISO-8601 string.
 
-    Returns None when there are no published lessons.
+    One primary-key lookup. The clock moves on every change to lessons,
+    courses, memberships, songs, chords, schemes and on every removal, so
+    the value covers everything the sync payload contains.
+
+    Returns None while no content has been published yet.
     The client stores this value and compares it on next launch to decide
     whether a sync is needed at all.
     """
-    result = Lesson.objects.filter(is_published=True).aggregate(
-        version=Max("updated_at")
+    ts = (
+        ContentClock.objects
+        .filter(pk=CONTENT_CLOCK_PK)
+        .values_list("changed_at", flat=True)
+        .first()
     )
-    ts = result["version"]
     return ts.isoformat() if ts is not None else None
+
+
+def get_removals_since(since: datetime) -> dict[str, list[str]]:
+    """Return IDs of entities removed after `since`, grouped by entity type.
+
+    Every `EntityType` value is present as a key, so the result can be
+    serialized as-is even when nothing was removed.
+    """
+    removals: dict[str, list[str]] = {entity_type: [] for entity_type in EntityType}
+    rows = (
+        Tombstone.objects
+        .filter(removed_at__gt=since)
+        .order_by("removed_at", "pk")
+        .values_list("entity_type", "entity_id")
+    )
+    for entity_type, entity_id in rows:
+        removals[entity_type].append(entity_id)
+    return removals
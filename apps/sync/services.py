@@ -0,0 +1,164 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Services for the sync app."""
+
+import gzip
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+import brotli  # type: ignore[import-untyped]
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .constants import (
+    BROTLI,
+    CONTENT_CLOCK_PK,
+    FORMAT_LEGACY,
+    GZIP,
+    IDENTITY,
+    PAYLOAD_REVISION,
+    SNAPSHOT_BUILD_LOCK_TIMEOUT,
+    SNAPSHOT_BUILD_POLL,
+    SNAPSHOT_BUILD_WAIT,
+    SNAPSHOT_CACHE_ALIAS,
+    SNAPSHOT_CACHE_PREFIX,
+    SNAPSHOT_CURRENT_KEY,
+    SNAPSHOT_TIMEOUT,
+    EntityType,
+)
+from .models import ContentClock, Tombstone
+
+logger = logging.getLogger("sync")
+
+type SnapshotVariants = dict[str, bytes]
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Return the content-codings every snapshot is stored in."""
+    if not settings.SYNC_PRECOMPRESS:
+        return (IDENTITY,)
+    return (BROTLI, GZIP, IDENTITY)
+
+
+def get_full_sync_snapshot(
+    version: str | None,
+    render: Callable[[], bytes],
+    *,
+    layout: int = FORMAT_LEGACY,
+) -> SnapshotVariants:
+    """Return the pre-encoded full-sync payload for `version`, building it once.
+
+    The rendered JSON is stored in the `sync` cache under a key derived from
+    the content version, so only the first cold-start client after an edit
+    pays for the selectors and serializers; everyone else gets a byte copy.
+    When a new version is built, the snapshot of the previous one is dropped.
+    Payload layouts (format versions whose full sync differs) are cached
+    side by side and never evict each other.
+
+    A build lock keeps concurrent requests for a new version from rendering
+    it in parallel: they wait for the first builder and only render on their
+    own (without storing) if it does not finish within `SNAPSHOT_BUILD_WAIT`.
+
+    With `SYNC_PRECOMPRESS` enabled the snapshot also carries gzip and brotli
+    variants, so compression runs once per version instead of once per
+    request.
+
+    Args:
+        version: Current content version as returned by `get_content_version`.
+        render: Callable producing the encoded payload on a cache miss.
+        layout: Format version whose full-sync body `render` produces.
+
+    Returns:
+        SnapshotVariants: Body bytes keyed by content-coding name.
+    """
+    cache = caches[SNAPSHOT_CACHE_ALIAS]
+    key = f"{SNAPSHOT_CACHE_PREFIX}:{PAYLOAD_REVISION}:{layout}:{version}"
+    current = f"{SNAPSHOT_CURRENT_KEY}:{layout}"
+    snapshot: SnapshotVariants | None = cache.get(key)
+    if snapshot is not None:
+        return snapshot
+
+    lock = f"{key}:lock"
+    if not cache.add(lock, True, timeout=SNAPSHOT_BUILD_LOCK_TIMEOUT):
+        snapshot = _wait_for_snapshot(key)
+        if snapshot is not None:
+            return snapshot
+        logger.warning("Sync snapshot build for version=%s timed out", version)
+        return _compress_variants(render())
+
+    try:
+        snapshot = _compress_variants(render())
+        previous: str | None = cache.get(current)
+        if previous is not None and previous != key:
+            cache.delete(previous)
+        cache.set_many({key: snapshot, current: key}, timeout=SNAPSHOT_TIMEOUT)
+    finally:
+        cache.delete(lock)
+    logger.info(
+        "Sync snapshot built: layout=%d version=%s %s",
+        layout,
+        version,
+        " ".join(f"{name}={len(body)}" for name, body in snapshot.items()),
+    )
+    return snapshot
+
+
+def _wait_for_snapshot(key: str) -> SnapshotVariants | None:
+    """Poll the cache for a snapshot another worker is building."""
+    cache = caches[SNAPSHOT_CACHE_ALIAS]
+    deadline = time.monotonic() + SNAPSHOT_BUILD_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(SNAPSHOT_BUILD_POLL)
+        snapshot: SnapshotVariants | None = cache.get(key)
+        if snapshot is not None:
+            return snapshot
+    return None
+
+
+def _compress_variants(raw: bytes) -> SnapshotVariants:
+    """Encode `raw` in every content-coding returned by `available_encodings`."""
+    variants: SnapshotVariants = {IDENTITY: raw}
+    encodings = available_encodings()
+    if GZIP in encodings:
+        variants[GZIP] = gzip.compress(raw, compresslevel=9, mtime=0)
+    if BROTLI in encodings:
+        variants[BROTLI] = brotli.compress(raw)
+    return variants
+
+
+def bump_content_clock() -> None:
+    """Move the content version forward after a change to synced content.
+
+    The clock never goes backwards, even if this host's time is behind the
+    one that stamped it last: it advances to now or by one microsecond.
+    """
+    now = timezone.now()
+    updated = ContentClock.objects.filter(pk=CONTENT_CLOCK_PK).update(
+        changed_at=Greatest(Value(now), F("changed_at") + timedelta(microseconds=1))
+    )
+    if not updated:
+        ContentClock.objects.get_or_create(
+            pk=CONTENT_CLOCK_PK, defaults={"changed_at": now}
+        )
+
+
+def record_removal(entity_type: EntityType, entity_id: object) -> None:
+    """Log that an entity left the synced set, refreshing an existing entry."""
+    Tombstone.objects.update_or_create(
+        entity_type=entity_type,
+        entity_id=str(entity_id),
+        defaults={"removed_at": timezone.now()},
+    )
+    bump_content_clock()
+
+
+def forget_removal(entity_type: EntityType, entity_id: object) -> None:
+    """Drop the tombstone of an entity that is synced again."""
+    Tombstone.objects.filter(entity_type=entity_type, entity_id=str(entity_id)).delete()
@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Signal receivers feeding the sync tombstone log and content clock.
+
+Lessons and courses are edited through the admin and chords, songs and
+schemes through several service paths, so receivers are the one place that
+sees every publish, unpublish, edit and delete. Bulk paths that bypass
+signals (`bulk_update`, `QuerySet.update`) bump the clock themselves.
+"""
+
+from typing import Any
+
+from django.db import models
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.chords.models import Chord
+from apps.courses.models import Course, CourseLesson
+from apps.lessons.models import Lesson
+from apps.schemes.models import ImageScheme
+from apps.songs.models import Song
+
+from .constants import EntityType
+from .services import bump_content_clock, forget_removal, record_removal
+
+_WAS_PUBLISHED = "_sync_was_published"
+"""Instance attribute holding `is_published` as stored before the save."""
+
+
+@receiver(pre_save, sender=Lesson, dispatch_uid="sync_lesson_saving")
+def lesson_saving(sender: type[Lesson], instance: Lesson, **kwargs: Any) -> None:  # noqa: ANN401
+    """Remember whether the lesson was published before this save."""
+    _remember_publication(sender, instance)
+
+
+@receiver(pre_save, sender=Course, dispatch_uid="sync_course_saving")
+def course_saving(sender: type[Course], instance: Course, **kwargs: Any) -> None:  # noqa: ANN401
+    """Remember whether the course was published before this save."""
+    _remember_publication(sender, instance)
+
+
+@receiver(post_save, sender=Lesson, dispatch_uid="sync_lesson_saved")
+def lesson_saved(sender: type[Lesson], instance: Lesson, **kwargs: Any) -> None:  # noqa: ANN401
+    """Track lesson publish/unpublish transitions and edits."""
+    _track_publication(EntityType.LESSON, instance)
+
+
+@receiver(post_save, sender=Course, dispatch_uid="sync_course_saved")
+def course_saved(sender: type[Course], instance: Course, **kwargs: Any) -> None:  # noqa: ANN401
+    """Track course publish/unpublish transitions and edits."""
+    _track_publication(EntityType.COURSE, instance)
+
+
+@receiver(post_save, sender=Song, dispatch_uid="sync_song_saved")
+@receiver(post_save, sender=Chord, dispatch_uid="sync_chord_saved")
+@receiver(post_save, sender=ImageScheme, dispatch_uid="sync_scheme_saved")
+@receiver(post_save, sender=CourseLesson, dispatch_uid="sync_membership_saved")
+@receiver(post_delete, sender=CourseLesson, dispatch_uid="sync_membership_deleted")
+def content_changed(sender: type[models.Model], **kwargs: Any) -> None:  # noqa: ANN401
+    """Move the content clock after a synced entity was written."""
+    bump_content_clock()
+
+
+@receiver(m2m_changed, sender=Lesson.songs.through, dispatch_uid="sync_lesson_songs")
+@receiver(m2m_changed, sender=Song.chords.through, dispatch_uid="sync_song_chords")
+@receiver(m2m_changed, sender=Song.schemes.through, dispatch_uid="sync_song_schemes")
+@receiver(
+    m2m_changed, sender=Course.lessons.through, dispatch_uid="sync_course_lessons"
+)
+def relation_changed(
+    sender: type[models.Model],
+    action: str,
+    **kwargs: Any,  # noqa: ANN401
+) -> None:
+    """Move the content clock after a synced many-to-many relation changed."""
+    if action in {"post_add", "post_remove", "post_clear"}:
+        bump_content_clock()
+
+
+@receiver(post_delete, sender=Lesson, dispatch_uid="sync_lesson_deleted")
+def lesson_deleted(sender: type[Lesson], instance: Lesson, **kwargs: Any) -> None:  # noqa: ANN401
+    """Log a deleted lesson."""
+    record_removal(EntityType.LESSON, instance.uuid)
+
+
+@receiver(post_delete, sender=Course, dispatch_uid="sync_course_deleted")
+def course_deleted(sender: type[Course], instance: Course, **kwargs: Any) -> None:  # noqa: ANN401
+    """Log a deleted course."""
+    record_removal(EntityType.COURSE, instance.uuid)
+
+
+@receiver(post_delete, sender=Song, dispatch_uid="sync_song_deleted")
+def song_deleted(sender: type[Song], instance: Song, **kwargs: Any) -> None:  # noqa: ANN401
+    """Log a deleted song."""
+    record_removal(EntityType.SONG, instance.uuid)
+
+
+@receiver(post_delete, sender=Chord, dispatch_uid="sync_chord_deleted")
+def chord_deleted(sender: type[Chord], instance: Chord, **kwargs: Any) -> None:  # noqa: ANN401
+    """Log a deleted chord."""
+    record_removal(EntityType.CHORD, instance.pk)
+
+
+@receiver(post_delete, sender=ImageScheme, dispatch_uid="sync_scheme_deleted")
+def scheme_deleted(
+    sender: type[ImageScheme],
+    instance: ImageScheme,
+    **kwargs: Any,  # noqa: ANN401
+) -> None:
+    """Log a deleted scheme."""
+    record_removal(EntityType.SCHEME, instance.pk)
+
+
+def _remember_publication(
+    model: type[Lesson] | type[Course], instance: Lesson | Course
+) -> None:
+    """Store the persisted `is_published` on the instance for `post_save`."""
+    was_published = (
+        instance.pk is not None
+        and model.objects.filter(pk=instance.pk, is_published=True).exists()
+    )
+    setattr(instance, _WAS_PUBLISHED, was_published)
+
+
+def _track_publication(entity_type: EntityType, instance: Lesson | Course) -> None:
+    """Tombstone on unpublish, clear the tombstone on re-publish.
+
+    Only transitions touch the log. Edits of published entities move the
+    content clock; saving a draft leaves the content version untouched.
+    """
+    was_published: bool = getattr(instance, _WAS_PUBLISHED, False)
+    if was_published and not instance.is_published:
+        record_removal(entity_type, instance.uuid)
+    elif instance.is_published:
+        if not was_published:
+            forget_removal(entity_type, instance.uuid)
+        bump_content_clock()
@@ -5,8 +5,25 @@
 """Pytest fixtures for the sync app tests."""
 
 import pytest
+from django.core.cache import caches
+from pytest_django.fixtures import SettingsWrapper
 from rest_framework.test import APIClient
 
+from apps.sync.constants import SNAPSHOT_CACHE_ALIAS
+
+
+@pytest.fixture(autouse=True)
+def sync_cache(settings: SettingsWrapper) -> None:
+    """Keep snapshots in process memory so tests never touch CACHE_DIR."""
+    settings.CACHES = {
+        **settings.CACHES,
+        SNAPSHOT_CACHE_ALIAS: {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "sync-tests",
+        },
+    }
+    caches[SNAPSHOT_CACHE_ALIAS].clear()
+
 
 @pytest.fixture
 def api_client() -> APIClient:
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for the values()-based sync payload builder."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from pytest_django.fixtures import SettingsWrapper
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.chords.models import Chord
+from apps.chords.services import ChordService
+from apps.chords.tests.factories import ChordFactory
+from apps.courses.tests.factories import CourseFactory, CourseLessonFactory
+from apps.lessons.tests.factories import LessonFactory
+from apps.schemes.models import ImageScheme
+from apps.schemes.services import ImageSchemeService
+from apps.schemes.tests.factories import ImageSchemeFactory
+from apps.songs.tests.factories import SongFactory
+from apps.sync.api.v1.views import LessonsSyncView
+from apps.sync.builders import build_sync_payload
+from apps.sync.constants import FORMAT_VERSIONS, SNAPSHOT_CACHE_ALIAS, EntityType
+from apps.sync.selectors import get_content_version
+from apps.sync.services import record_removal
+
+_AWKWARD_TEXT = 'Am  C\n\t"Припев" — ёлка 🎸\\ \u2028line\u2029para\x01\x1f/<>&'
+_SINCE = datetime(2000, 1, 1, tzinfo=UTC)
+
+
+def _drf(since: datetime | None, format_version: int) -> bytes:
+    version = get_content_version()
+    body: bytes = JSONRenderer().render(
+        LessonsSyncView._build_payload(since, version, format_version)
+    )
+    return body
+
+
+def _fast(since: datetime | None, format_version: int) -> bytes:
+    return build_sync_payload(since, get_content_version(), format_version)
+
+
+@pytest.fixture
+def catalog() -> None:
+    """Create a catalog covering every field type, with shared songs and chords."""
+    chords = [
+        ChordFactory.create(title=_AWKWARD_TEXT, svg_vertical="<svg/>"),
+        ChordFactory.create(has_barre=True),
+        ChordFactory.create(),
+    ]
+    schemes = [ImageSchemeFactory.create(inscription=_AWKWARD_TEXT) for _ in range(2)]
+    ImageSchemeService.save_scheme(schemes[0])
+    ImageScheme.objects.filter(pk=schemes[1].pk).update(image="", height=None)
+    shared = SongFactory.create(
+        text=_AWKWARD_TEXT, chords=[chords[2], chords[0]], schemes=schemes
+    )
+    lessons = [
+        LessonFactory.create(is_published=True, title=_AWKWARD_TEXT),
+        LessonFactory.create(is_published=True, description=""),
+        LessonFactory.create(is_published=True),
+        LessonFactory.create(is_published=False),
+    ]
+    lessons[0].songs.add(shared, SongFactory.create(chords=[chords[1]]))
+    lessons[1].songs.add(shared)
+    lessons[3].songs.add(SongFactory.create(chords=[ChordFactory.create()]))
+    course = CourseFactory.create(is_published=True, description=_AWKWARD_TEXT)
+    CourseLessonFactory.create(course=course, lesson=lessons[1], order=2)
+    CourseLessonFactory.create(course=course, lesson=lessons[0], order=1)
+    CourseLessonFactory.create(course=course, lesson=lessons[3], order=3)
+    CourseFactory.create(is_published=False)
+    record_removal(EntityType.LESSON, "2b6b1c52-3d2f-4c8e-9a55-8a3f0c4b7e10")
+    record_removal(EntityType.CHORD, "42")
+
+
+# =============================================================================
+# build_sync_payload — parity with the DRF serializers
+# =============================================================================
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("catalog")
+@pytest.mark.parametrize("format_version", sorted(FORMAT_VERSIONS))
+def test_build_sync_payload_full_sync_matches_drf(format_version: int) -> None:
+    assert _fast(None, format_version) == _drf(None, format_version)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("catalog")
+@pytest.mark.parametrize("format_version", sorted(FORMAT_VERSIONS))
+def test_build_sync_payload_delta_matches_drf(format_version: int) -> None:
+    assert _fast(_SINCE, format_version) == _drf(_SINCE, format_version)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("catalog")
+@pytest.mark.parametrize("format_version", sorted(FORMAT_VERSIONS))
+def test_build_sync_payload_empty_delta_matches_drf(format_version: int) -> None:
+    since = datetime.now(UTC) + timedelta(days=1)
+
+    assert _fast(since, format_version) == _drf(since, format_version)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("catalog")
+@pytest.mark.parametrize("format_version", sorted(FORMAT_VERSIONS))
+def test_build_sync_payload_with_known_hashes_matches_drf(format_version: int) -> None:
+    for chord in Chord.objects.all():
+        ChordService.regenerate_svg(chord=chord)
+    known = frozenset({Chord.objects.earliest("pk").content_hash, "0" * 16})
+    version = get_content_version()
+
+    fast = build_sync_payload(_SINCE, version, format_version, known)
+    drf = JSONRenderer().render(
+        LessonsSyncView._build_payload(_SINCE, version, format_version, known)
+    )
+
+    assert fast == drf
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("format_version", sorted(FORMAT_VERSIONS))
+def test_build_sync_payload_empty_catalog_matches_drf(format_version: int) -> None:
+    assert _fast(None, format_version) == _drf(None, format_version)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("catalog")
+def test_build_sync_payload_escapes_line_separators_like_drf() -> None:
+    body = _fast(None, 1)
+
+    assert b"\\u2028" in body
+    assert "\u2028".encode() not in body
+
+
+# =============================================================================
+# build_sync_payload — query count
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_build_sync_payload_query_count_does_not_grow_with_catalog() -> None:
+    LessonFactory.create(is_published=True).songs.add(SongFactory.create(chords=1))
+    with CaptureQueriesContext(connection) as small:
+        _fast(None, 1)
+
+    for _ in range(5):
+        song = SongFactory.create(chords=2, schemes=1)
+        LessonFactory.create(is_published=True).songs.add(song)
+    with CaptureQueriesContext(connection) as large:
+        _fast(None, 1)
+
+    assert len(large) == len(small)
+
+
+# =============================================================================
+# LessonsSyncView — SYNC_FAST_ENCODER
+# =============================================================================
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("catalog")
+@pytest.mark.parametrize("since", [None, _SINCE.isoformat()])
+def test_sync_lessons_body_does_not_depend_on_encoder(
+    api_client: APIClient, settings: SettingsWrapper, since: str | None
+) -> None:
+    params = {"format_version": "2"} | ({"since": since} if since else {})
+    settings.SYNC_FAST_ENCODER = True
+    fast = api_client.get(reverse("sync-lessons"), params)
+
+    settings.SYNC_FAST_ENCODER = False
+    caches[SNAPSHOT_CACHE_ALIAS].clear()
+    drf = api_client.get(reverse("sync-lessons"), params)
+
+    assert fast.content == drf.content
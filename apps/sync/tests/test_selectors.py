@@ -11,13 +11,17 @@ import pytest
 from apps.courses.tests.factories import CourseFactory, CourseLessonFactory
 from apps.lessons.models import Lesson
 from apps.lessons.tests.factories import LessonFactory
+from apps.sync.constants import EntityType
+from apps.sync.models import ContentClock, Tombstone
 from apps.sync.selectors import (
     get_content_version,
     get_course_lessons_for_sync,
     get_courses_for_sync,
+    get_lesson_batch_for_sync,
     get_lessons_for_sync,
     get_published_course_uuids,
     get_published_lesson_uuids,
+    get_removals_since,
 )
 
 
@@ -64,6 +68,31 @@ def test_get_lessons_for_sync_with_since_excludes_exact_cutoff() -> None:
     assert result == []
 
 
+@pytest.mark.django_db
+def test_get_lesson_batch_for_sync_limits_batch() -> None:
+    LessonFactory.create_batch(3, is_published=True)
+
+    result = get_lesson_batch_for_sync(None, None, 2)
+
+    assert len(result) == 2
+
+
+@pytest.mark.django_db
+def test_get_lesson_batch_for_sync_continues_after_position() -> None:
+    ts = datetime(2026, 3, 1, tzinfo=UTC)
+    lessons = LessonFactory.create_batch(3, is_published=True)
+    Lesson.objects.filter(pk__in=[lesson.pk for lesson in lessons]).update(
+        updated_at=ts
+    )
+    first = min(lesson.pk for lesson in lessons)
+
+    result = get_lesson_batch_for_sync(None, (ts, first), 10)
+
+    assert [lesson.pk for lesson in result] == sorted(
+        lesson.pk for lesson in lessons if lesson.pk != first
+    )
+
+
 @pytest.mark.django_db
 def test_get_published_lesson_uuids_returns_uuids_of_published_lessons() -> None:
     lesson = LessonFactory.create(is_published=True)
@@ -102,17 +131,44 @@ def test_get_content_version_returns_none_when_no_published_lessons() -> None:
 
 
 @pytest.mark.django_db
-def test_get_content_version_returns_latest_updated_at() -> None:
-    t1 = datetime(2026, 1, 1, tzinfo=UTC)
-    t2 = datetime(2026, 6, 1, tzinfo=UTC)
-    l1 = LessonFactory.create(is_published=True)
-    l2 = LessonFactory.create(is_published=True)
-    Lesson.objects.filter(pk=l1.pk).update(updated_at=t1)
-    Lesson.objects.filter(pk=l2.pk).update(updated_at=t2)
+def test_get_content_version_returns_clock_value() -> None:
+    ts = datetime(2026, 6, 1, tzinfo=UTC)
+    ContentClock.objects.update_or_create(pk=1, defaults={"changed_at": ts})
 
     version = get_content_version()
 
-    assert version == t2.isoformat()
+    assert version == ts.isoformat()
+
+
+@pytest.mark.django_db
+def test_get_content_version_is_not_older_than_lessons() -> None:
+    lesson = LessonFactory.create(is_published=True)
+
+    version = get_content_version()
+
+    assert version is not None
+    assert datetime.fromisoformat(version) >= lesson.updated_at
+
+
+@pytest.mark.django_db
+def test_get_content_version_moves_on_removal() -> None:
+    lesson = LessonFactory.create(is_published=True)
+    before = get_content_version()
+
+    lesson.is_published = False
+    lesson.save()
+
+    assert get_content_version() != before
+
+
+@pytest.mark.django_db
+def test_get_content_version_moves_on_course_change() -> None:
+    LessonFactory.create(is_published=True)
+    before = get_content_version()
+
+    CourseFactory.create(is_published=True)
+
+    assert get_content_version() != before
 
 
 # =============================================================================
@@ -209,3 +265,44 @@ def test_get_course_lessons_for_sync_excludes_unpublished_lesson() -> None:
     result = list(get_course_lessons_for_sync())
 
     assert result == []
+
+
+# =============================================================================
+# get_removals_since
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_get_removals_since_groups_ids_by_entity_type() -> None:
+    cutoff = datetime(2026, 3, 1, tzinfo=UTC)
+    removed_at = cutoff + timedelta(days=1)
+    Tombstone.objects.create(
+        entity_type=EntityType.SONG, entity_id="song-1", removed_at=removed_at
+    )
+    Tombstone.objects.create(
+        entity_type=EntityType.CHORD, entity_id="7", removed_at=removed_at
+    )
+
+    result = get_removals_since(cutoff)
+
+    assert result == {
+        "lesson": [],
+        "course": [],
+        "song": ["song-1"],
+        "chord": ["7"],
+        "scheme": [],
+    }
+
+
+@pytest.mark.django_db
+def test_get_removals_since_excludes_older_removals() -> None:
+    cutoff = datetime(2026, 3, 1, tzinfo=UTC)
+    Tombstone.objects.create(
+        entity_type=EntityType.LESSON,
+        entity_id="old",
+        removed_at=cutoff - timedelta(days=1),
+    )
+
+    result = get_removals_since(cutoff)
+
+    assert result["lesson"] == []
@@ -0,0 +1,188 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for sync services."""
+
+import gzip
+import time
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import brotli  # type: ignore[import-untyped]
+import pytest
+from django.core.cache import caches
+from pytest_django.fixtures import SettingsWrapper
+
+from apps.sync import services
+from apps.sync.constants import (
+    PAYLOAD_REVISION,
+    SNAPSHOT_CACHE_ALIAS,
+    SNAPSHOT_CACHE_PREFIX,
+)
+from apps.sync.models import ContentClock
+from apps.sync.services import (
+    available_encodings,
+    bump_content_clock,
+    get_full_sync_snapshot,
+)
+
+
+def test_get_full_sync_snapshot_returns_rendered_bytes() -> None:
+    render = Mock(return_value=b'{"version":"v1"}')
+
+    result = get_full_sync_snapshot("v1", render)
+
+    assert result["identity"] == b'{"version":"v1"}'
+
+
+def test_get_full_sync_snapshot_renders_once_per_version() -> None:
+    render = Mock(return_value=b"{}")
+
+    get_full_sync_snapshot("v1", render)
+    get_full_sync_snapshot("v1", render)
+
+    render.assert_called_once()
+
+
+def test_get_full_sync_snapshot_rebuilds_for_new_version() -> None:
+    render = Mock(side_effect=[b"old", b"new"])
+
+    get_full_sync_snapshot("v1", render)
+    result = get_full_sync_snapshot("v2", render)
+
+    assert result["identity"] == b"new"
+    assert render.call_count == 2
+
+
+def test_get_full_sync_snapshot_drops_stale_snapshot() -> None:
+    get_full_sync_snapshot("v1", Mock(return_value=b"old"))
+    get_full_sync_snapshot("v2", Mock(return_value=b"new"))
+
+    assert (
+        caches[SNAPSHOT_CACHE_ALIAS].get(
+            f"{SNAPSHOT_CACHE_PREFIX}:{PAYLOAD_REVISION}:1:v1"
+        )
+        is None
+    )
+
+
+def test_get_full_sync_snapshot_keeps_layouts_apart() -> None:
+    get_full_sync_snapshot("v1", Mock(return_value=b"legacy"))
+    get_full_sync_snapshot("v1", Mock(return_value=b"unique"), layout=3)
+
+    result = get_full_sync_snapshot("v1", Mock(return_value=b"rebuilt"))
+
+    assert result["identity"] == b"legacy"
+
+
+def test_get_full_sync_snapshot_releases_build_lock() -> None:
+    get_full_sync_snapshot("v1", Mock(return_value=b"{}"))
+
+    lock = f"{SNAPSHOT_CACHE_PREFIX}:{PAYLOAD_REVISION}:1:v1:lock"
+    assert caches[SNAPSHOT_CACHE_ALIAS].get(lock) is None
+
+
+def test_get_full_sync_snapshot_waits_for_concurrent_build(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = caches[SNAPSHOT_CACHE_ALIAS]
+    key = f"{SNAPSHOT_CACHE_PREFIX}:{PAYLOAD_REVISION}:1:v1"
+    cache.add(f"{key}:lock", True)
+    render = Mock(return_value=b"mine")
+
+    def finish_build(_: float) -> None:
+        cache.set(key, {"identity": b"theirs"})
+
+    monkeypatch.setattr(time, "sleep", finish_build)
+    result = get_full_sync_snapshot("v1", render)
+
+    assert result["identity"] == b"theirs"
+    render.assert_not_called()
+
+
+def test_get_full_sync_snapshot_renders_itself_when_build_stalls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache = caches[SNAPSHOT_CACHE_ALIAS]
+    cache.add(f"{SNAPSHOT_CACHE_PREFIX}:{PAYLOAD_REVISION}:1:v1:lock", True)
+    monkeypatch.setattr(services, "SNAPSHOT_BUILD_WAIT", 0.0)
+
+    result = get_full_sync_snapshot("v1", Mock(return_value=b"mine"))
+
+    assert result["identity"] == b"mine"
+    assert cache.get(f"{SNAPSHOT_CACHE_PREFIX}:{PAYLOAD_REVISION}:1:v1") is None
+
+
+def test_get_full_sync_snapshot_handles_missing_version() -> None:
+    render = Mock(return_value=b'{"version":null}')
+
+    get_full_sync_snapshot(None, render)
+    result = get_full_sync_snapshot(None, render)
+
+    assert result["identity"] == b'{"version":null}'
+    render.assert_called_once()
+
+
+# =============================================================================
+# Pre-compressed variants
+# =============================================================================
+
+
+def test_get_full_sync_snapshot_stores_gzip_variant() -> None:
+    raw = b'{"songs":["' + b"la " * 1000 + b'"]}'
+
+    result = get_full_sync_snapshot("v1", Mock(return_value=raw))
+
+    assert gzip.decompress(result["gzip"]) == raw
+    assert len(result["gzip"]) < len(raw)
+
+
+def test_get_full_sync_snapshot_stores_brotli_variant() -> None:
+    raw = b'{"songs":["' + b"la " * 1000 + b'"]}'
+
+    result = get_full_sync_snapshot("v1", Mock(return_value=raw))
+
+    assert brotli.decompress(result["br"]) == raw
+
+
+def test_get_full_sync_snapshot_skips_compression_when_disabled(
+    settings: SettingsWrapper,
+) -> None:
+    settings.SYNC_PRECOMPRESS = False
+
+    result = get_full_sync_snapshot("v1", Mock(return_value=b"{}"))
+
+    assert set(result) == {"identity"}
+
+
+def test_available_encodings_prefers_brotli() -> None:
+    assert available_encodings() == ("br", "gzip", "identity")
+
+
+def test_available_encodings_when_disabled(settings: SettingsWrapper) -> None:
+    settings.SYNC_PRECOMPRESS = False
+
+    assert available_encodings() == ("identity",)
+
+
+# =============================================================================
+# Content clock
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_bump_content_clock_creates_clock() -> None:
+    bump_content_clock()
+
+    assert ContentClock.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_bump_content_clock_never_moves_backwards() -> None:
+    future = datetime(2999, 1, 1, tzinfo=UTC)
+    ContentClock.objects.create(pk=1, changed_at=future)
+
+    bump_content_clock()
+
+    assert ContentClock.objects.get().changed_at == future + timedelta(microseconds=1)
@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for the sync tombstone signal receivers."""
+
+from datetime import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.chords.tests.factories import ChordFactory
+from apps.courses.tests.factories import CourseFactory, CourseLessonFactory
+from apps.lessons.tests.factories import LessonFactory
+from apps.schemes.tests.factories import ImageSchemeFactory
+from apps.songs.services import save_song
+from apps.songs.tests.factories import SongFactory
+from apps.sync.constants import EntityType
+from apps.sync.models import Tombstone
+from apps.sync.selectors import get_content_version
+
+
+def _tombstoned(entity_type: EntityType) -> set[str]:
+    return set(
+        Tombstone.objects.filter(entity_type=entity_type).values_list(
+            "entity_id", flat=True
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_unpublishing_lesson_records_tombstone() -> None:
+    lesson = LessonFactory.create(is_published=True)
+
+    lesson.is_published = False
+    lesson.save()
+
+    assert _tombstoned(EntityType.LESSON) == {str(lesson.uuid)}
+
+
+@pytest.mark.django_db
+def test_republishing_lesson_clears_tombstone() -> None:
+    lesson = LessonFactory.create(is_published=True)
+    lesson.is_published = False
+    lesson.save()
+
+    lesson.is_published = True
+    lesson.save()
+
+    assert _tombstoned(EntityType.LESSON) == set()
+
+
+@pytest.mark.django_db
+def test_creating_unpublished_lesson_records_nothing() -> None:
+    LessonFactory.create(is_published=False)
+
+    assert not Tombstone.objects.exists()
+
+
+@pytest.mark.django_db
+def test_editing_draft_records_nothing() -> None:
+    LessonFactory.create(is_published=True)
+    draft = LessonFactory.create(is_published=False)
+    version = get_content_version()
+
+    draft.title = "Черновик"
+    draft.save()
+
+    assert not Tombstone.objects.exists()
+    assert get_content_version() == version
+
+
+@pytest.mark.django_db
+def test_editing_published_lesson_skips_tombstone_table() -> None:
+    lesson = LessonFactory.create(is_published=True)
+
+    lesson.title = "Новое название"
+    with CaptureQueriesContext(connection) as ctx:
+        lesson.save()
+
+    assert not any("sync_tombstone" in query["sql"] for query in ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_unpublishing_course_records_tombstone() -> None:
+    course = CourseFactory.create(is_published=True)
+
+    course.is_published = False
+    course.save()
+
+    assert _tombstoned(EntityType.COURSE) == {str(course.uuid)}
+
+
+@pytest.mark.django_db
+def test_deleting_lesson_records_tombstone() -> None:
+    lesson = LessonFactory.create(is_published=True)
+    lesson_uuid = str(lesson.uuid)
+
+    lesson.delete()
+
+    assert _tombstoned(EntityType.LESSON) == {lesson_uuid}
+
+
+@pytest.mark.django_db
+def test_deleting_song_records_tombstone() -> None:
+    song = SongFactory.create()
+    song_uuid = str(song.uuid)
+
+    song.delete()
+
+    assert _tombstoned(EntityType.SONG) == {song_uuid}
+
+
+@pytest.mark.django_db
+def test_deleting_chord_records_tombstone() -> None:
+    chord = ChordFactory.create()
+    chord_id = str(chord.pk)
+
+    chord.delete()
+
+    assert _tombstoned(EntityType.CHORD) == {chord_id}
+
+
+@pytest.mark.django_db
+def test_deleting_scheme_records_tombstone() -> None:
+    scheme = ImageSchemeFactory.create()
+    scheme_id = str(scheme.pk)
+
+    scheme.delete()
+
+    assert _tombstoned(EntityType.SCHEME) == {scheme_id}
+
+
+# =============================================================================
+# Content clock
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_editing_published_lesson_moves_version() -> None:
+    lesson = LessonFactory.create(is_published=True)
+    before = get_content_version()
+
+    lesson.title = "Новое название"
+    lesson.save()
+
+    assert get_content_version() != before
+
+
+@pytest.mark.django_db
+def test_chord_save_moves_version() -> None:
+    chord = ChordFactory.create()
+    before = get_content_version()
+
+    chord.title = "Am7"
+    chord.save()
+
+    assert get_content_version() != before
+
+
+@pytest.mark.django_db
+def test_course_membership_change_moves_version() -> None:
+    lesson = LessonFactory.create(is_published=True)
+    course = CourseFactory.create(is_published=True)
+    before = get_content_version()
+
+    CourseLessonFactory.create(course=course, lesson=lesson, order=1)
+
+    assert get_content_version() != before
+
+
+@pytest.mark.django_db
+def test_lesson_songs_change_moves_version() -> None:
+    lesson = LessonFactory.create(is_published=True)
+    song = SongFactory.create()
+    before = get_content_version()
+
+    lesson.songs.add(song)
+
+    assert get_content_version() != before
+
+
+@pytest.mark.django_db
+def test_save_song_keeps_version_ahead_of_lessons() -> None:
+    song = SongFactory.create()
+    lesson = LessonFactory.create(is_published=True, songs=[song])
+
+    save_song(song)
+
+    lesson.refresh_from_db()
+    version = get_content_version()
+    assert version is not None
+    assert datetime.fromisoformat(version) >= lesson.updated_at
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for sync utilities."""
+
+from datetime import UTC, datetime
+
+import pytest
+from django.test import RequestFactory
+
+from apps.lessons.tests.factories import LessonFactory
+from apps.songs.tests.factories import SongFactory
+from apps.sync.utils import (
+    choose_encoding,
+    collect_unique_song_data,
+    decode_cursor,
+    encode_cursor,
+    is_not_modified,
+    make_etag,
+)
+
+
+def test_make_etag_is_quoted() -> None:
+    etag = make_etag("lessons", "2026-01-01T00:00:00+00:00")
+
+    assert etag.startswith('"')
+    assert etag.endswith('"')
+
+
+def test_make_etag_is_stable_for_same_parts() -> None:
+    assert make_etag("lessons", "v1", None) == make_etag("lessons", "v1", None)
+
+
+def test_make_etag_differs_when_any_part_differs() -> None:
+    base = make_etag("lessons", "v1", None)
+
+    assert make_etag("lessons", "v2", None) != base
+    assert make_etag("lessons", "v1", "2026-01-01") != base
+    assert make_etag("version", "v1", None) != base
+
+
+def test_is_not_modified_false_without_header() -> None:
+    request = RequestFactory().get("/")
+
+    assert is_not_modified(request, make_etag("v1")) is False
+
+
+def test_is_not_modified_true_for_matching_etag() -> None:
+    etag = make_etag("v1")
+    request = RequestFactory().get("/", headers={"If-None-Match": etag})
+
+    assert is_not_modified(request, etag) is True
+
+
+def test_is_not_modified_true_for_one_of_several_etags() -> None:
+    etag = make_etag("v1")
+    header = f"{make_etag('v0')}, {etag}"
+    request = RequestFactory().get("/", headers={"If-None-Match": header})
+
+    assert is_not_modified(request, etag) is True
+
+
+def test_is_not_modified_ignores_weak_prefix() -> None:
+    etag = make_etag("v1")
+    request = RequestFactory().get("/", headers={"If-None-Match": f"W/{etag}"})
+
+    assert is_not_modified(request, etag) is True
+
+
+def test_is_not_modified_true_for_wildcard() -> None:
+    request = RequestFactory().get("/", headers={"If-None-Match": "*"})
+
+    assert is_not_modified(request, make_etag("v1")) is True
+
+
+def test_is_not_modified_false_for_other_etag() -> None:
+    request = RequestFactory().get("/", headers={"If-None-Match": make_etag("v0")})
+
+    assert is_not_modified(request, make_etag("v1")) is False
+
+
+def test_choose_encoding_defaults_to_identity() -> None:
+    assert choose_encoding("", ("br", "gzip", "identity")) == "identity"
+
+
+def test_choose_encoding_prefers_brotli_when_equally_rated() -> None:
+    assert choose_encoding("gzip, deflate, br", ("br", "gzip", "identity")) == "br"
+
+
+def test_choose_encoding_falls_back_to_gzip_without_brotli() -> None:
+    assert choose_encoding("gzip, br", ("gzip", "identity")) == "gzip"
+
+
+def test_choose_encoding_honours_q_values() -> None:
+    header = "br;q=0.5, gzip;q=0.9"
+
+    assert choose_encoding(header, ("br", "gzip", "identity")) == "gzip"
+
+
+def test_choose_encoding_skips_excluded_encoding() -> None:
+    assert choose_encoding("br;q=0, gzip", ("br", "gzip", "identity")) == "gzip"
+
+
+def test_choose_encoding_accepts_wildcard() -> None:
+    assert choose_encoding("*", ("gzip", "identity")) == "gzip"
+
+
+def test_choose_encoding_ignores_unavailable_encodings() -> None:
+    assert choose_encoding("br", ("identity",)) == "identity"
+
+
+def test_choose_encoding_treats_malformed_q_as_excluded() -> None:
+    assert choose_encoding("gzip;q=abc", ("gzip", "identity")) == "identity"
+
+
+# =============================================================================
+# Stream cursors
+# =============================================================================
+
+
+def test_cursor_round_trips() -> None:
+    since = datetime(2026, 1, 1, tzinfo=UTC)
+    updated_at = datetime(2026, 3, 1, 12, 30, 0, 123456, tzinfo=UTC)
+
+    result = decode_cursor(encode_cursor(since, updated_at, 42))
+
+    assert result == (since, (updated_at, 42))
+
+
+def test_cursor_round_trips_without_since() -> None:
+    updated_at = datetime(2026, 3, 1, tzinfo=UTC)
+
+    result = decode_cursor(encode_cursor(None, updated_at, 1))
+
+    assert result == (None, (updated_at, 1))
+
+
+def test_decode_cursor_rejects_tampered_value() -> None:
+    cursor = encode_cursor(None, datetime(2026, 3, 1, tzinfo=UTC), 1)
+
+    with pytest.raises(ValueError, match="cursor"):
+        decode_cursor(cursor[:-1] + ("A" if cursor[-1] != "A" else "B"))
+
+
+# =============================================================================
+# collect_unique_song_data
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_collect_unique_song_data_dedupes_shared_songs() -> None:
+    song = SongFactory.create(chords=1)
+    lessons = [
+        LessonFactory.create(is_published=True, songs=[song]),
+        LessonFactory.create(is_published=True, songs=[song]),
+    ]
+
+    songs, lesson_songs, chords, _ = collect_unique_song_data(lessons)
+
+    assert len(songs) == 1
+    assert len(lesson_songs) == 2
+    assert len(chords) == 1
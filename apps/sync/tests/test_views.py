@@ -4,19 +4,29 @@
 
 """Tests for sync API views."""
 
+import gzip
 from datetime import UTC, datetime, timedelta
 
 import pytest
 from django.urls import reverse
+from pytest_django import DjangoAssertNumQueries
+from pytest_django.fixtures import SettingsWrapper
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.chords.models import Chord
+from apps.chords.services import ChordService
+from apps.chords.sprite import get_chord_sprite_version
 from apps.chords.tests.factories import ChordFactory
 from apps.courses.tests.factories import CourseFactory, CourseLessonFactory
 from apps.lessons.models import Lesson
 from apps.lessons.tests.factories import LessonFactory
+from apps.metrics.registry import get_registry
+from apps.schemes.services import ImageSchemeService
 from apps.schemes.tests.factories import ImageSchemeFactory
 from apps.songs.tests.factories import SongFactory
+from apps.sync.constants import EntityType
+from apps.sync.models import Tombstone
 
 # =============================================================================
 # LessonsSyncView — GET /api/v1/sync/lessons/ — top-level keys
@@ -36,56 +46,56 @@ def test_sync_lessons_response_contains_version_key(api_client: APIClient) -> No
 
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "version" in response.data
+    assert "version" in response.json()
 
 
 @pytest.mark.django_db
 def test_sync_lessons_response_contains_lesson_uuids_key(api_client: APIClient) -> None:
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "lesson_uuids" in response.data
+    assert "lesson_uuids" in response.json()
 
 
 @pytest.mark.django_db
 def test_sync_lessons_response_contains_lessons_key(api_client: APIClient) -> None:
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "lessons" in response.data
+    assert "lessons" in response.json()
 
 
 @pytest.mark.django_db
 def test_sync_lessons_response_contains_songs_key(api_client: APIClient) -> None:
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "songs" in response.data
+    assert "songs" in response.json()
 
 
 @pytest.mark.django_db
 def test_sync_lessons_response_contains_chords_key(api_client: APIClient) -> None:
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "chords" in response.data
+    assert "chords" in response.json()
 
 
 @pytest.mark.django_db
 def test_sync_lessons_response_contains_schemes_key(api_client: APIClient) -> None:
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "schemes" in response.data
+    assert "schemes" in response.json()
 
 
 @pytest.mark.django_db
 def test_sync_lessons_response_contains_course_uuids_key(api_client: APIClient) -> None:
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "course_uuids" in response.data
+    assert "course_uuids" in response.json()
 
 
 @pytest.mark.django_db
 def test_sync_lessons_response_contains_courses_key(api_client: APIClient) -> None:
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "courses" in response.data
+    assert "courses" in response.json()
 
 
 @pytest.mark.django_db
@@ -94,7 +104,7 @@ def test_sync_lessons_response_contains_course_lessons_key(
 ) -> None:
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "course_lessons" in response.data
+    assert "course_lessons" in response.json()
 
 
 # =============================================================================
@@ -108,7 +118,7 @@ def test_sync_lessons_includes_published_lesson(api_client: APIClient) -> None:
 
     response = api_client.get(reverse("sync-lessons"))
 
-    uuids = [item["uuid"] for item in response.data["lessons"]]
+    uuids = [item["uuid"] for item in response.json()["lessons"]]
     assert str(lesson.uuid) in uuids
 
 
@@ -118,7 +128,7 @@ def test_sync_lessons_excludes_unpublished_lesson(api_client: APIClient) -> None
 
     response = api_client.get(reverse("sync-lessons"))
 
-    assert response.data["lessons"] == []
+    assert response.json()["lessons"] == []
 
 
 @pytest.mark.django_db
@@ -127,7 +137,7 @@ def test_sync_lessons_lesson_uuids_excludes_unpublished(api_client: APIClient) -
 
     response = api_client.get(reverse("sync-lessons"))
 
-    assert str(secret.uuid) not in response.data["lesson_uuids"]
+    assert str(secret.uuid) not in response.json()["lesson_uuids"]
 
 
 @pytest.mark.django_db
@@ -136,7 +146,7 @@ def test_sync_lessons_lesson_contains_updated_at_field(api_client: APIClient) ->
 
     response = api_client.get(reverse("sync-lessons"))
 
-    assert "updated_at" in response.data["lessons"][0]
+    assert "updated_at" in response.json()["lessons"][0]
 
 
 @pytest.mark.django_db
@@ -148,8 +158,8 @@ def test_sync_lessons_lesson_uuids_contains_all_published(
 
     response = api_client.get(reverse("sync-lessons"))
 
-    assert str(lesson_a.uuid) in response.data["lesson_uuids"]
-    assert str(lesson_b.uuid) in response.data["lesson_uuids"]
+    assert str(lesson_a.uuid) in response.json()["lesson_uuids"]
+    assert str(lesson_b.uuid) in response.json()["lesson_uuids"]
 
 
 # =============================================================================
@@ -164,7 +174,7 @@ def test_sync_lessons_songs_are_in_top_level_array(api_client: APIClient) -> Non
 
     response = api_client.get(reverse("sync-lessons"))
 
-    titles = [s["title"] for s in response.data["songs"]]
+    titles = [s["title"] for s in response.json()["songs"]]
     assert "Звезда по имени Солнце" in titles
 
 
@@ -175,7 +185,7 @@ def test_sync_lessons_song_has_lesson_uuid(api_client: APIClient) -> None:
 
     response = api_client.get(reverse("sync-lessons"))
 
-    song_data = next(s for s in response.data["songs"] if s["uuid"] == str(song.uuid))
+    song_data = next(s for s in response.json()["songs"] if s["uuid"] == str(song.uuid))
     assert song_data["lesson_uuid"] == str(lesson.uuid)
 
 
@@ -187,7 +197,7 @@ def test_sync_lessons_song_has_chord_ids(api_client: APIClient) -> None:
 
     response = api_client.get(reverse("sync-lessons"))
 
-    song_data = next(s for s in response.data["songs"] if s["uuid"] == str(song.uuid))
+    song_data = next(s for s in response.json()["songs"] if s["uuid"] == str(song.uuid))
     assert chord.id in song_data["chord_ids"]
 
 
@@ -199,7 +209,7 @@ def test_sync_lessons_song_has_scheme_ids(api_client: APIClient) -> None:
 
     response = api_client.get(reverse("sync-lessons"))
 
-    song_data = next(s for s in response.data["songs"] if s["uuid"] == str(song.uuid))
+    song_data = next(s for s in response.json()["songs"] if s["uuid"] == str(song.uuid))
     assert scheme.id in song_data["scheme_ids"]
 
 
@@ -212,7 +222,7 @@ def test_sync_lessons_songs_from_unpublished_lesson_excluded(
 
     response = api_client.get(reverse("sync-lessons"))
 
-    assert response.data["songs"] == []
+    assert response.json()["songs"] == []
 
 
 # =============================================================================
@@ -228,7 +238,7 @@ def test_sync_lessons_chords_are_in_top_level_array(api_client: APIClient) -> No
 
     response = api_client.get(reverse("sync-lessons"))
 
-    chord_ids = [c["id"] for c in response.data["chords"]]
+    chord_ids = [c["id"] for c in response.json()["chords"]]
     assert chord.id in chord_ids
 
 
@@ -243,7 +253,7 @@ def test_sync_lessons_chord_shared_across_songs_appears_once(
 
     response = api_client.get(reverse("sync-lessons"))
 
-    chord_ids = [c["id"] for c in response.data["chords"]]
+    chord_ids = [c["id"] for c in response.json()["chords"]]
     assert chord_ids.count(chord.id) == 1
 
 
@@ -260,7 +270,7 @@ def test_sync_lessons_since_filters_older_lessons(api_client: APIClient) -> None
 
     response = api_client.get(reverse("sync-lessons"), {"since": cutoff.isoformat()})
 
-    assert response.data["lessons"] == []
+    assert response.json()["lessons"] == []
 
 
 @pytest.mark.django_db
@@ -271,7 +281,7 @@ def test_sync_lessons_since_includes_newer_lessons(api_client: APIClient) -> Non
 
     response = api_client.get(reverse("sync-lessons"), {"since": cutoff.isoformat()})
 
-    uuids = [item["uuid"] for item in response.data["lessons"]]
+    uuids = [item["uuid"] for item in response.json()["lessons"]]
     assert str(newer.uuid) in uuids
 
 
@@ -285,8 +295,8 @@ def test_sync_lessons_since_lesson_uuids_always_contains_all_published(
 
     response = api_client.get(reverse("sync-lessons"), {"since": cutoff.isoformat()})
 
-    assert response.data["lessons"] == []
-    assert str(old.uuid) in response.data["lesson_uuids"]
+    assert response.json()["lessons"] == []
+    assert str(old.uuid) in response.json()["lesson_uuids"]
 
 
 @pytest.mark.django_db
@@ -309,7 +319,7 @@ def test_sync_lessons_delta_songs_scoped_to_changed_lessons(
 
     response = api_client.get(reverse("sync-lessons"), {"since": cutoff.isoformat()})
 
-    song_titles = [s["title"] for s in response.data["songs"]]
+    song_titles = [s["title"] for s in response.json()["songs"]]
     assert "Новая песня" in song_titles
     assert "Старая песня" not in song_titles
 
@@ -336,7 +346,7 @@ def test_sync_lessons_delta_chords_scoped_to_changed_lessons(
 
     response = api_client.get(reverse("sync-lessons"), {"since": cutoff.isoformat()})
 
-    chord_ids = [c["id"] for c in response.data["chords"]]
+    chord_ids = [c["id"] for c in response.json()["chords"]]
     assert new_chord.id in chord_ids
     assert old_chord.id not in chord_ids
 
@@ -357,7 +367,7 @@ def test_sync_lessons_naive_since_is_treated_as_utc(api_client: APIClient) -> No
 
     response = api_client.get(reverse("sync-lessons"), {"since": naive_iso})
 
-    uuids = [item["uuid"] for item in response.data["lessons"]]
+    uuids = [item["uuid"] for item in response.json()["lessons"]]
     assert str(newer.uuid) in uuids
 
 
@@ -379,7 +389,7 @@ def test_sync_version_returns_version_key(api_client: APIClient) -> None:
 
     response = api_client.get(reverse("sync-version"))
 
-    assert "version" in response.data
+    assert "version" in response.json()
 
 
 @pytest.mark.django_db
@@ -388,7 +398,7 @@ def test_sync_version_returns_none_when_no_published_lessons(
 ) -> None:
     response = api_client.get(reverse("sync-version"))
 
-    assert response.data["version"] is None
+    assert response.json()["version"] is None
 
 
 @pytest.mark.django_db
@@ -397,7 +407,7 @@ def test_sync_version_value_is_valid_iso8601(api_client: APIClient) -> None:
 
     response = api_client.get(reverse("sync-version"))
 
-    datetime.fromisoformat(response.data["version"])
+    datetime.fromisoformat(response.json()["version"])
 
 
 # =============================================================================
@@ -411,7 +421,7 @@ def test_sync_lessons_courses_includes_published_course(api_client: APIClient) -
 
     response = api_client.get(reverse("sync-lessons"))
 
-    uuids = [c["uuid"] for c in response.data["courses"]]
+    uuids = [c["uuid"] for c in response.json()["courses"]]
     assert str(course.uuid) in uuids
 
 
@@ -423,7 +433,7 @@ def test_sync_lessons_courses_excludes_unpublished_course(
 
     response = api_client.get(reverse("sync-lessons"))
 
-    assert response.data["courses"] == []
+    assert response.json()["courses"] == []
 
 
 @pytest.mark.django_db
@@ -432,7 +442,7 @@ def test_sync_lessons_course_uuids_contains_published(api_client: APIClient) ->
 
     response = api_client.get(reverse("sync-lessons"))
 
-    assert str(course.uuid) in response.data["course_uuids"]
+    assert str(course.uuid) in response.json()["course_uuids"]
 
 
 @pytest.mark.django_db
@@ -441,7 +451,7 @@ def test_sync_lessons_course_uuids_excludes_unpublished(api_client: APIClient) -
 
     response = api_client.get(reverse("sync-lessons"))
 
-    assert str(secret.uuid) not in response.data["course_uuids"]
+    assert str(secret.uuid) not in response.json()["course_uuids"]
 
 
 # =============================================================================
@@ -460,7 +470,7 @@ def test_sync_lessons_course_lessons_contain_membership(api_client: APIClient) -
     found = next(
         (
             cl
-            for cl in response.data["course_lessons"]
+            for cl in response.json()["course_lessons"]
             if cl["course_uuid"] == str(course.uuid)
             and cl["lesson_uuid"] == str(lesson.uuid)
         ),
@@ -479,7 +489,7 @@ def test_sync_lessons_course_lessons_have_order(api_client: APIClient) -> None:
 
     found = next(
         cl
-        for cl in response.data["course_lessons"]
+        for cl in response.json()["course_lessons"]
         if cl["course_uuid"] == str(course.uuid)
     )
     assert found["order"] == 3
@@ -497,6 +507,516 @@ def test_sync_lessons_course_lessons_exclude_unpublished_lesson(
 
     response = api_client.get(reverse("sync-lessons"))
 
-    lesson_uuids_in_cl = [cl["lesson_uuid"] for cl in response.data["course_lessons"]]
+    lesson_uuids_in_cl = [cl["lesson_uuid"] for cl in response.json()["course_lessons"]]
     assert str(published.uuid) in lesson_uuids_in_cl
     assert str(unpublished.uuid) not in lesson_uuids_in_cl
+
+
+# =============================================================================
+# Full-sync snapshot
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_sync_lessons_full_sync_is_served_as_json(api_client: APIClient) -> None:
+    response = api_client.get(reverse("sync-lessons"))
+
+    assert response["Content-Type"] == "application/json"
+
+
+@pytest.mark.django_db
+def test_sync_lessons_full_sync_repeat_only_reads_version(
+    api_client: APIClient,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    song = SongFactory.create(chords=2, schemes=1)
+    LessonFactory.create(is_published=True, songs=[song])
+    first = api_client.get(reverse("sync-lessons"))
+
+    with django_assert_num_queries(1):
+        second = api_client.get(reverse("sync-lessons"))
+
+    assert second.content == first.content
+
+
+@pytest.mark.django_db
+def test_sync_lessons_full_sync_reflects_new_version(api_client: APIClient) -> None:
+    api_client.get(reverse("sync-lessons"))
+    lesson = LessonFactory.create(is_published=True)
+
+    response = api_client.get(reverse("sync-lessons"))
+
+    uuids = [item["uuid"] for item in response.json()["lessons"]]
+    assert str(lesson.uuid) in uuids
+
+
+# =============================================================================
+# Conditional GET — ETag / If-None-Match
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_sync_lessons_response_has_etag(api_client: APIClient) -> None:
+    response = api_client.get(reverse("sync-lessons"))
+
+    assert response["ETag"].startswith('"')
+
+
+@pytest.mark.django_db
+def test_sync_lessons_returns_304_for_matching_etag(api_client: APIClient) -> None:
+    LessonFactory.create(is_published=True)
+    etag = api_client.get(reverse("sync-lessons"))["ETag"]
+
+    response = api_client.get(reverse("sync-lessons"), headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_sync_lessons_304_only_reads_version(
+    api_client: APIClient,
+    django_assert_num_queries: DjangoAssertNumQueries,
+) -> None:
+    cutoff = datetime(2026, 3, 1, tzinfo=UTC)
+    LessonFactory.create(is_published=True, songs=2)
+    params = {"since": cutoff.isoformat()}
+    etag = api_client.get(reverse("sync-lessons"), params)["ETag"]
+
+    with django_assert_num_queries(1):
+        response = api_client.get(
+            reverse("sync-lessons"), params, headers={"If-None-Match": etag}
+        )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_sync_lessons_etag_depends_on_since(api_client: APIClient) -> None:
+    full = api_client.get(reverse("sync-lessons"))
+    delta = api_client.get(
+        reverse("sync-lessons"), {"since": datetime(2026, 3, 1, tzinfo=UTC).isoformat()}
+    )
+
+    assert full["ETag"] != delta["ETag"]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_returns_200_after_content_change(api_client: APIClient) -> None:
+    etag = api_client.get(reverse("sync-lessons"))["ETag"]
+    LessonFactory.create(is_published=True)
+
+    response = api_client.get(reverse("sync-lessons"), headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_sync_lessons_304_varies_on_accept_encoding(api_client: APIClient) -> None:
+    etag = api_client.get(reverse("sync-lessons"))["ETag"]
+
+    response = api_client.get(reverse("sync-lessons"), headers={"If-None-Match": etag})
+
+    assert "Accept-Encoding" in response["Vary"]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_delta_varies_on_accept_encoding(api_client: APIClient) -> None:
+    response = api_client.get(
+        reverse("sync-lessons"), {"since": datetime(2026, 3, 1, tzinfo=UTC).isoformat()}
+    )
+
+    assert "Accept-Encoding" in response["Vary"]
+
+
+@pytest.mark.django_db
+def test_sync_version_returns_304_for_matching_etag(api_client: APIClient) -> None:
+    LessonFactory.create(is_published=True)
+    etag = api_client.get(reverse("sync-version"))["ETag"]
+
+    response = api_client.get(reverse("sync-version"), headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+
+@pytest.mark.django_db
+def test_sync_version_etag_differs_from_sync_lessons_etag(
+    api_client: APIClient,
+) -> None:
+    LessonFactory.create(is_published=True)
+
+    version = api_client.get(reverse("sync-version"))
+    lessons = api_client.get(reverse("sync-lessons"))
+
+    assert version["ETag"] != lessons["ETag"]
+
+
+# =============================================================================
+# Pre-compressed full sync — Accept-Encoding
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_sync_lessons_serves_gzip_variant(api_client: APIClient) -> None:
+    song = SongFactory.create(chords=2)
+    LessonFactory.create(is_published=True, songs=[song])
+    plain = api_client.get(reverse("sync-lessons"))
+
+    response = api_client.get(
+        reverse("sync-lessons"), headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.content) == plain.content
+
+
+@pytest.mark.django_db
+def test_sync_lessons_serves_identity_without_accept_encoding(
+    api_client: APIClient,
+) -> None:
+    response = api_client.get(reverse("sync-lessons"))
+
+    assert not response.has_header("Content-Encoding")
+    assert "Accept-Encoding" in response["Vary"]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_etag_differs_per_encoding(api_client: APIClient) -> None:
+    plain = api_client.get(reverse("sync-lessons"))
+    gzipped = api_client.get(
+        reverse("sync-lessons"), headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert plain["ETag"] != gzipped["ETag"]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_delta_is_not_precompressed(api_client: APIClient) -> None:
+    response = api_client.get(
+        reverse("sync-lessons"),
+        {"since": datetime(2026, 3, 1, tzinfo=UTC).isoformat()},
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert not response.has_header("Content-Encoding")
+
+
+@pytest.mark.django_db
+def test_sync_lessons_falls_back_to_identity_for_foreign_snapshot(
+    api_client: APIClient, settings: SettingsWrapper
+) -> None:
+    settings.SYNC_PRECOMPRESS = False
+    api_client.get(reverse("sync-lessons"))
+    settings.SYNC_PRECOMPRESS = True
+
+    response = api_client.get(
+        reverse("sync-lessons"), headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert not response.has_header("Content-Encoding")
+    assert response.json()["lessons"] == []
+
+
+@pytest.mark.django_db
+def test_sync_lessons_records_response_size_by_encoding(
+    api_client: APIClient,
+) -> None:
+    api_client.get(reverse("sync-lessons"), headers={"Accept-Encoding": "gzip"})
+
+    count = get_registry().get_sample_value(
+        "guitar0_backend_sync_response_size_bytes_count", {"encoding": "gzip"}
+    )
+    assert count is not None
+    assert count >= 1
+
+
+# =============================================================================
+# Tombstone deltas — ?format_version=2
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_sync_lessons_format_2_delta_lists_removed_ids(api_client: APIClient) -> None:
+    cutoff = datetime(2026, 3, 1, tzinfo=UTC)
+    song = SongFactory.create()
+    song_uuid = str(song.uuid)
+    lesson = LessonFactory.create(is_published=True)
+    Tombstone.objects.create(
+        entity_type=EntityType.LESSON,
+        entity_id=str(lesson.uuid),
+        removed_at=cutoff - timedelta(days=1),
+    )
+    song.delete()
+
+    response = api_client.get(
+        reverse("sync-lessons"),
+        {"since": cutoff.isoformat(), "format_version": "2"},
+    )
+
+    removed = response.json()["removed"]
+    assert removed["songs"] == [song_uuid]
+    assert removed["lessons"] == []
+
+
+@pytest.mark.django_db
+def test_sync_lessons_format_2_delta_omits_full_uuid_sets(
+    api_client: APIClient,
+) -> None:
+    LessonFactory.create(is_published=True)
+    CourseFactory.create(is_published=True)
+
+    response = api_client.get(
+        reverse("sync-lessons"),
+        {"since": datetime(2026, 3, 1, tzinfo=UTC).isoformat(), "format_version": "2"},
+    )
+
+    assert "lesson_uuids" not in response.json()
+    assert "course_uuids" not in response.json()
+
+
+@pytest.mark.django_db
+def test_sync_lessons_format_2_full_sync_keeps_uuid_sets(
+    api_client: APIClient,
+) -> None:
+    lesson = LessonFactory.create(is_published=True)
+
+    response = api_client.get(reverse("sync-lessons"), {"format_version": "2"})
+
+    assert response.json()["lesson_uuids"] == [str(lesson.uuid)]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_invalid_format_version_returns_400(
+    api_client: APIClient,
+) -> None:
+    response = api_client.get(reverse("sync-lessons"), {"format_version": "9"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_sync_lessons_etag_depends_on_format_version(api_client: APIClient) -> None:
+    since = datetime(2026, 3, 1, tzinfo=UTC).isoformat()
+    legacy = api_client.get(reverse("sync-lessons"), {"since": since})
+    tombstones = api_client.get(
+        reverse("sync-lessons"), {"since": since, "format_version": "2"}
+    )
+
+    assert legacy["ETag"] != tombstones["ETag"]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_unpublish_invalidates_etag(api_client: APIClient) -> None:
+    newer = LessonFactory.create(is_published=True)
+    older = LessonFactory.create(is_published=True)
+    Lesson.objects.filter(pk=older.pk).update(
+        updated_at=newer.updated_at - timedelta(days=1)
+    )
+    older.refresh_from_db()
+    params = {
+        "since": datetime(2026, 3, 1, tzinfo=UTC).isoformat(),
+        "format_version": "2",
+    }
+    etag = api_client.get(reverse("sync-lessons"), params)["ETag"]
+
+    older.is_published = False
+    older.save()
+    response = api_client.get(
+        reverse("sync-lessons"), params, headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["removed"]["lessons"] == [str(older.uuid)]
+
+
+# =============================================================================
+# Unique songs — ?format_version=3
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_sync_lessons_format_3_sends_shared_song_once(api_client: APIClient) -> None:
+    song = SongFactory.create()
+    first = LessonFactory.create(is_published=True, songs=[song])
+    second = LessonFactory.create(is_published=True, songs=[song])
+
+    response = api_client.get(reverse("sync-lessons"), {"format_version": "3"})
+
+    data = response.json()
+    assert [s["uuid"] for s in data["songs"]] == [str(song.uuid)]
+    assert "lesson_uuid" not in data["songs"][0]
+    assert sorted(edge["lesson_uuid"] for edge in data["lesson_songs"]) == sorted([
+        str(first.uuid),
+        str(second.uuid),
+    ])
+
+
+@pytest.mark.django_db
+def test_sync_lessons_format_3_full_sync_keeps_uuid_sets(
+    api_client: APIClient,
+) -> None:
+    lesson = LessonFactory.create(is_published=True)
+
+    response = api_client.get(reverse("sync-lessons"), {"format_version": "3"})
+
+    assert response.json()["lesson_uuids"] == [str(lesson.uuid)]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_format_3_delta_lists_removed_ids(api_client: APIClient) -> None:
+    lesson = LessonFactory.create(is_published=True)
+    lesson.is_published = False
+    lesson.save()
+
+    response = api_client.get(
+        reverse("sync-lessons"),
+        {"since": datetime(2026, 3, 1, tzinfo=UTC).isoformat(), "format_version": "3"},
+    )
+
+    data = response.json()
+    assert data["removed"]["lessons"] == [str(lesson.uuid)]
+    assert "lesson_uuids" not in data
+    assert data["lesson_songs"] == []
+
+
+@pytest.mark.django_db
+def test_sync_lessons_full_sync_snapshot_is_per_format(api_client: APIClient) -> None:
+    LessonFactory.create(is_published=True, songs=1)
+
+    legacy = api_client.get(reverse("sync-lessons"))
+    unique = api_client.get(reverse("sync-lessons"), {"format_version": "3"})
+
+    assert "lesson_songs" not in legacy.json()
+    assert "lesson_songs" in unique.json()
+
+
+@pytest.mark.django_db
+def test_sync_lessons_format_4_references_chord_sprite(api_client: APIClient) -> None:
+    chord = ChordFactory.create(title="Am")
+    LessonFactory.create(is_published=True, songs=[SongFactory.create(chords=[chord])])
+
+    response = api_client.get(reverse("sync-lessons"), {"format_version": "4"})
+
+    data = response.json()
+    assert data["chord_sprite"] == get_chord_sprite_version()
+    assert "lesson_songs" in data
+    [synced] = data["chords"]
+    assert synced["sprite_horizontal"] == f"chord-{chord.pk}-h"
+    assert synced["sprite_vertical"] == f"chord-{chord.pk}-v"
+    assert "svg_horizontal" not in synced
+
+
+# =============================================================================
+# Known content hashes — ?known_hashes=
+# =============================================================================
+
+
+def _chord_with_hash() -> Chord:
+    chord = ChordFactory.create()
+    ChordService.regenerate_svg(chord=chord)
+    return chord
+
+
+@pytest.mark.django_db
+def test_sync_lessons_chords_carry_content_hash(api_client: APIClient) -> None:
+    chord = _chord_with_hash()
+    LessonFactory.create(is_published=True).songs.add(
+        SongFactory.create(chords=[chord])
+    )
+
+    response = api_client.get(reverse("sync-lessons"))
+
+    assert response.json()["chords"][0]["content_hash"] == chord.content_hash
+
+
+@pytest.mark.django_db
+def test_sync_lessons_known_hashes_omit_known_chords(api_client: APIClient) -> None:
+    known, changed = _chord_with_hash(), _chord_with_hash()
+    song = SongFactory.create(chords=[known, changed])
+    LessonFactory.create(is_published=True).songs.add(song)
+
+    response = api_client.get(
+        reverse("sync-lessons"),
+        {"since": "2000-01-01T00:00:00Z", "known_hashes": known.content_hash},
+    )
+
+    data = response.json()
+    assert [c["id"] for c in data["chords"]] == [changed.pk]
+    assert data["unchanged_chords"] == [known.pk]
+    assert data["unchanged_schemes"] == []
+    assert data["songs"][0]["chord_ids"] == [known.pk, changed.pk]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_known_hashes_omit_known_schemes(api_client: APIClient) -> None:
+    scheme = ImageSchemeFactory.build()
+    ImageSchemeService.save_scheme(scheme)
+    LessonFactory.create(is_published=True).songs.add(
+        SongFactory.create(schemes=[scheme])
+    )
+
+    response = api_client.get(
+        reverse("sync-lessons"), {"known_hashes": scheme.content_hash}
+    )
+
+    data = response.json()
+    assert data["schemes"] == []
+    assert data["unchanged_schemes"] == [scheme.pk]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_without_known_hashes_has_no_unchanged_keys(
+    api_client: APIClient,
+) -> None:
+    response = api_client.get(
+        reverse("sync-lessons"), {"since": "2000-01-01T00:00:00Z"}
+    )
+
+    assert "unchanged_chords" not in response.json()
+
+
+@pytest.mark.django_db
+def test_sync_lessons_empty_known_hashes_sends_every_body(
+    api_client: APIClient,
+) -> None:
+    chord = _chord_with_hash()
+    LessonFactory.create(is_published=True).songs.add(
+        SongFactory.create(chords=[chord])
+    )
+
+    response = api_client.get(reverse("sync-lessons"), {"known_hashes": ""})
+
+    data = response.json()
+    assert [c["id"] for c in data["chords"]] == [chord.pk]
+    assert data["unchanged_chords"] == []
+
+
+@pytest.mark.django_db
+def test_sync_lessons_invalid_known_hashes_returns_400(api_client: APIClient) -> None:
+    response = api_client.get(reverse("sync-lessons"), {"known_hashes": "not-a-hash"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_sync_lessons_etag_depends_on_known_hashes(api_client: APIClient) -> None:
+    LessonFactory.create(is_published=True)
+
+    first = api_client.get(reverse("sync-lessons"), {"known_hashes": "0" * 16})
+    second = api_client.get(reverse("sync-lessons"), {"known_hashes": "1" * 16})
+
+    assert first["ETag"] != second["ETag"]
+
+
+@pytest.mark.django_db
+def test_sync_lessons_known_hashes_are_not_served_compressed(
+    api_client: APIClient,
+) -> None:
+    response = api_client.get(
+        reverse("sync-lessons"), {"known_hashes": ""}, HTTP_ACCEPT_ENCODING="gzip"
+    )
+
+    assert "Content-Encoding" not in response
@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Tests for the streaming sync API view (v2)."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.chords.tests.factories import ChordFactory
+from apps.courses.tests.factories import CourseFactory
+from apps.lessons.models import Lesson
+from apps.lessons.tests.factories import LessonFactory
+from apps.songs.tests.factories import SongFactory
+from apps.sync.api.v2 import views
+
+
+def _read(response: Any) -> list[dict[str, Any]]:  # noqa: ANN401
+    assert isinstance(response, StreamingHttpResponse)
+    body = b"".join(response.streaming_content)  # type: ignore[arg-type]
+    return [json.loads(line) for line in body.splitlines()]
+
+
+def _of_type(lines: list[dict[str, Any]], kind: str) -> list[Any]:
+    return [line["data"] for line in lines if line["type"] == kind]
+
+
+@pytest.fixture
+def small_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(views, "STREAM_BATCH_SIZE", 1)
+
+
+# =============================================================================
+# LessonsStreamView — GET /api/v2/sync/lessons/
+# =============================================================================
+
+
+@pytest.mark.django_db
+def test_sync_stream_is_ndjson(api_client: APIClient) -> None:
+    response = api_client.get(reverse("sync-lessons-stream"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+
+
+@pytest.mark.django_db
+def test_sync_stream_starts_with_meta_and_ends_with_end(api_client: APIClient) -> None:
+    LessonFactory.create(is_published=True)
+
+    lines = _read(api_client.get(reverse("sync-lessons-stream")))
+
+    assert lines[0]["type"] == "meta"
+    assert lines[-1]["type"] == "end"
+    assert lines[-1]["data"]["version"] == lines[0]["data"]["version"]
+
+
+@pytest.mark.django_db
+def test_sync_stream_lessons_in_keyset_order(
+    api_client: APIClient, small_batches: None
+) -> None:
+    first = LessonFactory.create(is_published=True)
+    second = LessonFactory.create(is_published=True)
+    Lesson.objects.filter(pk=second.pk).update(
+        updated_at=first.updated_at - timedelta(days=1)
+    )
+
+    lines = _read(api_client.get(reverse("sync-lessons-stream")))
+
+    uuids = [lesson["uuid"] for lesson in _of_type(lines, "lesson")]
+    assert uuids == [str(second.uuid), str(first.uuid)]
+
+
+@pytest.mark.django_db
+def test_sync_stream_emits_cursor_after_each_batch(
+    api_client: APIClient, small_batches: None
+) -> None:
+    LessonFactory.create_batch(3, is_published=True)
+
+    lines = _read(api_client.get(reverse("sync-lessons-stream")))
+
+    assert len(_of_type(lines, "cursor")) == 3
+
+
+@pytest.mark.django_db
+def test_sync_stream_sends_shared_chord_once(
+    api_client: APIClient, small_batches: None
+) -> None:
+    chord = ChordFactory.create()
+    LessonFactory.create(is_published=True, songs=[SongFactory.create(chords=[chord])])
+    LessonFactory.create(is_published=True, songs=[SongFactory.create(chords=[chord])])
+
+    lines = _read(api_client.get(reverse("sync-lessons-stream")))
+
+    assert [c["id"] for c in _of_type(lines, "chord")] == [chord.pk]
+    assert len(_of_type(lines, "song")) == 2
+
+
+@pytest.mark.django_db
+def test_sync_stream_resumes_from_cursor(
+    api_client: APIClient, small_batches: None
+) -> None:
+    LessonFactory.create_batch(3, is_published=True)
+    lines = _read(api_client.get(reverse("sync-lessons-stream")))
+    all_uuids = [lesson["uuid"] for lesson in _of_type(lines, "lesson")]
+    cursor = _of_type(lines, "cursor")[0]["cursor"]
+
+    resumed = _read(api_client.get(reverse("sync-lessons-stream"), {"cursor": cursor}))
+
+    uuids = [lesson["uuid"] for lesson in _of_type(resumed, "lesson")]
+    assert uuids == all_uuids[1:]
+
+
+@pytest.mark.django_db
+def test_sync_stream_cursor_keeps_since(
+    api_client: APIClient, small_batches: None
+) -> None:
+    cutoff = datetime(2026, 3, 1, tzinfo=UTC)
+    LessonFactory.create_batch(2, is_published=True)
+    lines = _read(
+        api_client.get(reverse("sync-lessons-stream"), {"since": cutoff.isoformat()})
+    )
+    cursor = _of_type(lines, "cursor")[0]["cursor"]
+
+    resumed = _read(api_client.get(reverse("sync-lessons-stream"), {"cursor": cursor}))
+
+    assert len(_of_type(resumed, "removed")) == 1
+
+
+@pytest.mark.django_db
+def test_sync_stream_full_sync_has_no_removed_line(api_client: APIClient) -> None:
+    lines = _read(api_client.get(reverse("sync-lessons-stream")))
+
+    assert _of_type(lines, "removed") == []
+
+
+@pytest.mark.django_db
+def test_sync_stream_delta_lists_removed_ids(api_client: APIClient) -> None:
+    cutoff = datetime(2026, 3, 1, tzinfo=UTC)
+    lesson = LessonFactory.create(is_published=True)
+    lesson.is_published = False
+    lesson.save()
+
+    lines = _read(
+        api_client.get(reverse("sync-lessons-stream"), {"since": cutoff.isoformat()})
+    )
+
+    assert _of_type(lines, "removed")[0]["lessons"] == [str(lesson.uuid)]
+    assert _of_type(lines, "lesson") == []
+
+
+@pytest.mark.django_db
+def test_sync_stream_includes_courses(api_client: APIClient) -> None:
+    course = CourseFactory.create(is_published=True)
+
+    lines = _read(api_client.get(reverse("sync-lessons-stream")))
+
+    assert [c["uuid"] for c in _of_type(lines, "course")] == [str(course.uuid)]
+
+
+@pytest.mark.django_db
+def test_sync_stream_invalid_cursor_returns_400(api_client: APIClient) -> None:
+    response = api_client.get(reverse("sync-lessons-stream"), {"cursor": "forged"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_sync_stream_invalid_since_returns_400(api_client: APIClient) -> None:
+    response = api_client.get(reverse("sync-lessons-stream"), {"since": "not-a-date"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+def test_sync_stream_error_is_rendered_for_ndjson_clients(
+    api_client: APIClient,
+) -> None:
+    response = api_client.get(
+        reverse("sync-lessons-stream"),
+        {"cursor": "forged"},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert json.loads(response.content)["detail"] == "Invalid `cursor` value."
@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Utilities for the sync app."""
+
+import hashlib
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from django.core import signing
+from django.http import HttpRequest
+from django.utils.http import parse_etags
+from rest_framework.request import Request
+
+from apps.chords.models import Chord
+from apps.lessons.models import Lesson
+from apps.schemes.models import ImageScheme
+
+from .constants import ENCODING_PREFERENCE, IDENTITY, STREAM_CURSOR_SALT
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong, quoted ETag from the values a response depends on.
+
+    The parts are joined and hashed, so the tag changes whenever any of them
+    does and never leaks the raw values to the client.
+    """
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def is_not_modified(request: Request | HttpRequest, etag: str) -> bool:
+    """Return True when the request's If-None-Match already matches `etag`.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a
+    `W/` prefix added by an intermediary does not defeat the match.
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    etags = parse_etags(header)
+    if "*" in etags:
+        return True
+    return etag.removeprefix("W/") in {tag.removeprefix("W/") for tag in etags}
+
+
+def choose_encoding(accept_encoding: str, available: Iterable[str]) -> str:
+    """Pick the content-coding to serve from an Accept-Encoding header.
+
+    Honours q-values (including `q=0` exclusions and `*`); ties are broken by
+    ENCODING_PREFERENCE. Falls back to identity, which is always acceptable
+    unless the client excludes it explicitly — even then identity is served
+    rather than a 406, as most servers do.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip().lower() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = IDENTITY, 0.0
+    for name in ENCODING_PREFERENCE:
+        if name not in available or name == IDENTITY:
+            continue
+        weight = weights.get(name, wildcard)
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+def collect_song_data(
+    lessons: Iterable[Lesson],
+) -> tuple[list[dict[str, Any]], dict[int, Chord], dict[int, ImageScheme]]:
+    """Collect songs, chords, and schemes from prefetched lessons.
+
+    No extra DB queries. A song shared across multiple lessons appears once
+    per lesson with a different lesson_uuid — mirrors the M2M relationship.
+    """
+    songs_out: list[dict[str, Any]] = []
+    chord_map: dict[int, Chord] = {}
+    scheme_map: dict[int, ImageScheme] = {}
+
+    for lesson in lessons:
+        for song in lesson.songs.all():
+            song_chords = list(song.chords.all())
+            song_schemes = list(song.schemes.all())
+            songs_out.append({
+                "uuid": song.uuid,
+                "lesson_uuid": lesson.uuid,
+                "title": song.title,
+                "text": song.text,
+                "metronome": song.metronome,
+                "chord_ids": [c.pk for c in song_chords],
+                "scheme_ids": [s.pk for s in song_schemes],
+            })
+            for c in song_chords:
+                chord_map.setdefault(c.pk, c)
+            for s in song_schemes:
+                scheme_map.setdefault(s.pk, s)
+
+    return songs_out, chord_map, scheme_map
+
+
+def collect_unique_song_data(
+    lessons: Iterable[Lesson],
+) -> tuple[
+    list[dict[str, Any]],
+    list[dict[str, Any]],
+    dict[int, Chord],
+    dict[int, ImageScheme],
+]:
+    """Collect each song once plus lesson→song edges from prefetched lessons.
+
+    Like `collect_song_data`, but a song shared by several lessons is
+    emitted once; membership goes into the returned edge list instead.
+    No extra DB queries.
+    """
+    songs_out: dict[int, dict[str, Any]] = {}
+    lesson_songs: list[dict[str, Any]] = []
+    chord_map: dict[int, Chord] = {}
+    scheme_map: dict[int, ImageScheme] = {}
+
+    for lesson in lessons:
+        for song in lesson.songs.all():
+            lesson_songs.append({"lesson_uuid": lesson.uuid, "song_uuid": song.uuid})
+            if song.pk in songs_out:
+                continue
+            song_chords = list(song.chords.all())
+            song_schemes = list(song.schemes.all())
+            songs_out[song.pk] = {
+                "uuid": song.uuid,
+                "title": song.title,
+                "text": song.text,
+                "metronome": song.metronome,
+                "chord_ids": [c.pk for c in song_chords],
+                "scheme_ids": [s.pk for s in song_schemes],
+            }
+            for c in song_chords:
+                chord_map.setdefault(c.pk, c)
+            for s in song_schemes:
+                scheme_map.setdefault(s.pk, s)
+
+    return list(songs_out.values()), lesson_songs, chord_map, scheme_map
+
+
+def encode_cursor(since: datetime | None, updated_at: datetime, pk: int) -> str:
+    """Return an opaque, signed cursor resuming a streamed sync after a lesson.
+
+    The cursor carries the original `since` as well, so a resumed download
+    produces the same delta as the interrupted one.
+    """
+    return signing.dumps(
+        [since.isoformat() if since else None, updated_at.isoformat(), pk],
+        salt=STREAM_CURSOR_SALT,
+    )
+
+
+def decode_cursor(cursor: str) -> tuple[datetime | None, tuple[datetime, int]]:
+    """Unpack a cursor made by `encode_cursor` into `since` and the keyset position.
+
+    Raises:
+        ValueError: If the cursor is malformed or was not issued by us.
+    """
+    try:
+        since, updated_at, pk = signing.loads(cursor, salt=STREAM_CURSOR_SALT)
+        position = (datetime.fromisoformat(updated_at), int(pk))
+        since_dt = datetime.fromisoformat(since) if since is not None else None
+    except (signing.BadSignature, TypeError, ValueError) as exc:
+        msg = "Invalid `cursor` value."
+        raise ValueError(msg) from exc
+    return since_dt, position
@@ -14,6 +14,7 @@ bind = "0.0.0.0:8000"
 # Recommended formula: 2 * CPU cores + 1
 workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
 worker_class = "sync"
+# Keep above PRINT_QUEUE_TIMEOUT + PRINT_RENDER_TIMEOUT (see config/settings)
 timeout = 30
 keepalive = 2
 
@@ -52,3 +53,29 @@ preload_app = True
 limit_request_line = 4094
 limit_request_fields = 100
 limit_request_field_size = 8190
+
+
+# Server hooks
+
+
+def when_ready(server: object) -> None:
+    """Warm up PDF printing in the master before workers are forked.
+
+    Workers recycled after `max_requests` are forked from the master too,
+    so they start with fonts and print stylesheets already loaded.
+    """
+    if preload_app:
+        _warm_up_printing()
+
+
+def post_worker_init(worker: object) -> None:
+    """Warm up PDF printing in each worker when the app is not preloaded."""
+    if not preload_app:
+        _warm_up_printing()
+
+
+def _warm_up_printing() -> None:
+    """Run the opt-in print warm-up (`PRINT_WARMUP`) of the loaded app."""
+    from apps.songs.pdf_renderer import warm_up_printing  # noqa: PLC0415
+
+    warm_up_printing()
@@ -126,6 +126,46 @@ SIMPLE_JWT = {
 
 GOOGLE_CLIENT_ID: str | None = settings.GOOGLE_CLIENT_ID
 
+# `sync` holds full-sync snapshots. A file backend lets every gunicorn worker
+# on the host read the one copy instead of rebuilding its own.
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "sync": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": settings.CACHE_DIR / "sync",
+    },
+}
+
+# Store gzip/brotli variants next to each cached full-sync snapshot.
+SYNC_PRECOMPRESS: bool = settings.SYNC_PRECOMPRESS
+
+# Build sync payloads from values_list rows encoded with orjson instead of
+# DRF serializers; the output is byte-identical.
+SYNC_FAST_ENCODER: bool = settings.SYNC_FAST_ENCODER
+
+# Rendered song PDFs, keyed by content. Least recently used files are evicted
+# past PRINT_CACHE_MAX_BYTES; 0 disables the cache.
+PRINT_CACHE_DIR: Path = settings.CACHE_DIR / "print"
+PRINT_CACHE_MAX_BYTES: int = settings.PRINT_CACHE_MAX_BYTES
+
+# Host-wide print pool (see apps/songs/print_pool.py): render slots, extra
+# queue places, and the waits before a print is answered with 503. The two
+# timeouts together must stay below gunicorn's worker timeout. 0 workers
+# renders inline without limits.
+PRINT_SLOTS_DIR: Path = settings.CACHE_DIR / "print-slots"
+PRINT_POOL_WORKERS: int = settings.PRINT_POOL_WORKERS
+PRINT_QUEUE_DEPTH: int = settings.PRINT_QUEUE_DEPTH
+PRINT_QUEUE_TIMEOUT: float = settings.PRINT_QUEUE_TIMEOUT
+PRINT_RENDER_TIMEOUT: float = settings.PRINT_RENDER_TIMEOUT
+
+# Songbooks (a whole lesson or course) are printed only by the print worker,
+# which has no gunicorn timeout, so their layout may take much longer.
+PRINT_SONGBOOK_TIMEOUT: float = settings.PRINT_SONGBOOK_TIMEOUT
+
+# Lay out a tiny PDF when gunicorn starts (see config/gunicorn.py), so the
+# first print of a fresh worker skips font and stylesheet loading.
+PRINT_WARMUP: bool = settings.PRINT_WARMUP
+
 if settings.ENVIRONMENT in {"staging", "production"}:
     SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
     SESSION_COOKIE_SECURE = True
@@ -34,6 +34,7 @@ class Settings(BaseSettings):
 
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
     LOG_FILE_PATH: Path = BASE_DIR / "logs" / "django.log"
+    CACHE_DIR: Path = BASE_DIR / "cache"
     ENVIRONMENT: Literal["development", "staging", "production"] = "development"
     VERSION: str = "unknown"
     GIT_SHA: str = "unknown"
@@ -42,6 +43,15 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     DATABASE_URL: str
     GOOGLE_CLIENT_ID: str | None = None
+    SYNC_PRECOMPRESS: bool = True
+    SYNC_FAST_ENCODER: bool = True
+    PRINT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    PRINT_POOL_WORKERS: int = 2
+    PRINT_QUEUE_DEPTH: int = 4
+    PRINT_QUEUE_TIMEOUT: float = 10.0
+    PRINT_RENDER_TIMEOUT: float = 15.0
+    PRINT_SONGBOOK_TIMEOUT: float = 300.0
+    PRINT_WARMUP: bool = False
 
     DEBUG: bool = False
     ALLOWED_HOSTS: list[str] = []
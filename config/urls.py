@@ -37,6 +37,7 @@ urlpatterns = [
     path("api/v1/", include("apps.courses.api.v1.urls")),
     path("api/v1/", include("apps.announcements.api.v1.urls")),
     path("api/v1/", include("apps.sync.api.v1.urls")),
+    path("api/v2/", include("apps.sync.api.v2.urls")),
     path("api/v1/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
         "api/v1/docs/redoc/",
@@ -4,14 +4,21 @@
 
 """Global pytest fixtures ."""
 
+from collections.abc import Generator
+from pathlib import Path
+
 import pytest
+from django.conf import settings as django_settings
 from django.contrib.admin import AdminSite, site
 from django.contrib.auth.models import AnonymousUser
 from django.core.cache import cache
+from django.test import override_settings
+from pytest_django.fixtures import SettingsWrapper
 from rest_framework.test import APIRequestFactory
 
 from apps.accounts.models.user import User
 from apps.accounts.tests.factories.user import UserFactory
+from apps.sync.constants import SNAPSHOT_CACHE_ALIAS
 
 
 @pytest.fixture(autouse=True)
@@ -20,6 +27,34 @@ def clear_cache() -> None:
     cache.clear()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def file_caches(tmp_path_factory: pytest.TempPathFactory) -> Generator[None]:
+    """Keep file-based caches (full-sync snapshots) out of the working tree.
+
+    Session-scoped because creating the test database already opens every
+    cache, and a file cache creates its directory when opened.
+    """
+    location = tmp_path_factory.mktemp("cache") / "sync"
+    with override_settings(
+        CACHES={
+            **django_settings.CACHES,
+            SNAPSHOT_CACHE_ALIAS: {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": location,
+            },
+        }
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def print_cache_dir(settings: SettingsWrapper, tmp_path: Path) -> Path:
+    """Keep cached PDFs and print pool locks out of the working tree."""
+    settings.PRINT_CACHE_DIR = tmp_path / "print"
+    settings.PRINT_SLOTS_DIR = tmp_path / "print-slots"
+    return Path(settings.PRINT_CACHE_DIR)
+
+
 ########################
 # Global Django instances
 ########################
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Synthetic catalog generator for the sync benchmarks."""
+
+import random
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.utils import timezone
+from factory.random import reseed_random
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from apps.chords.services import ChordService
+from apps.chords.tests.factories import FullChordFactory
+from apps.courses.tests.factories import CourseFactory, CourseLessonFactory
+from apps.lessons.models import Lesson
+from apps.lessons.tests.factories import LessonFactory
+from apps.schemes.services import ImageSchemeService
+from apps.schemes.tests.factories import ImageSchemeFactory
+from apps.songs.models import Song
+from apps.songs.tests.factories import SongFactory
+from apps.sync.services import bump_content_clock
+
+
+class CatalogSpec(BaseSettings):
+    """Catalog shape, overridable through `BENCH_*` environment variables.
+
+    `song_pool` below `lessons * songs_per_lesson` makes lessons share songs.
+    `delta_lessons` is how many of the newest lessons a delta sync returns.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="BENCH_")
+
+    lessons: int = 200
+    songs_per_lesson: int = 5
+    song_pool: int = 800
+    chords: int = 120
+    schemes: int = 30
+    chords_per_song: int = 6
+    schemes_per_song: int = 1
+    courses: int = 8
+    delta_lessons: int = 20
+    seed: int = 2026
+
+
+def generate_catalog(spec: CatalogSpec) -> dict[str, Any]:
+    """Fill the database with a published catalog shaped by `spec`.
+
+    Chords get real positions and rendered SVGs, so payload sizes match
+    production. Lessons get one-second-apart `updated_at` values, and the
+    returned `delta_since` selects the newest `spec.delta_lessons` of them.
+    Deterministic for a given seed.
+
+    Returns:
+        dict: The spec, the `delta_since` cutoff and the row counts.
+    """
+    reseed_random(spec.seed)  # type: ignore[no-untyped-call]
+    rng = random.Random(spec.seed)
+
+    chords = FullChordFactory.create_batch(spec.chords)
+    for chord in chords:
+        ChordService.regenerate_svg(chord=chord)
+    schemes = ImageSchemeFactory.build_batch(spec.schemes)
+    for scheme in schemes:
+        ImageSchemeService.save_scheme(scheme)
+
+    songs: list[Song] = []
+    for _ in range(spec.song_pool):
+        song = SongFactory.create()
+        song.chords.add(*rng.sample(chords, min(spec.chords_per_song, len(chords))))
+        song.schemes.add(*rng.sample(schemes, min(spec.schemes_per_song, len(schemes))))
+        songs.append(song)
+
+    lessons: list[Lesson] = []
+    for index in range(spec.lessons):
+        lesson = LessonFactory.create(is_published=True)
+        pool = songs[index * spec.songs_per_lesson :][: spec.songs_per_lesson]
+        if len(pool) < spec.songs_per_lesson:
+            pool = rng.sample(songs, min(spec.songs_per_lesson, len(songs)))
+        lesson.songs.add(*pool)
+        lessons.append(lesson)
+
+    courses = CourseFactory.create_batch(spec.courses, is_published=True)
+    for index, lesson in enumerate(lessons):
+        CourseLessonFactory.create(
+            course=courses[index % len(courses)], lesson=lesson, order=index
+        )
+
+    start = timezone.now() - timedelta(seconds=spec.lessons)
+    for index, lesson in enumerate(lessons):
+        Lesson.objects.filter(pk=lesson.pk).update(
+            updated_at=start + timedelta(seconds=index)
+        )
+    bump_content_clock()
+
+    delta_since: datetime = start + timedelta(
+        seconds=spec.lessons - spec.delta_lessons - 1
+    )
+    return {
+        "spec": spec.model_dump(),
+        "delta_since": delta_since.isoformat(),
+        "counts": {
+            "lessons": len(lessons),
+            "songs": len(songs),
+            "chords": len(chords),
+            "schemes": len(schemes),
+            "courses": len(courses),
+        },
+    }
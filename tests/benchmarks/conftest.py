@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Fixtures for the sync benchmarks.
+
+Run with `make bench` (or `pytest tests/benchmarks -m benchmark --no-cov`).
+The database comes from DATABASE_URL as usual, so pointing it at a local
+Postgres benchmarks Postgres; the catalog shape comes from `BENCH_*`
+variables (see `CatalogSpec`). Results are written as JSON to
+`BENCH_OUTPUT` (default `bench_output.json`) for comparison between commits.
+"""
+
+import json
+import os
+import platform
+import subprocess
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test import override_settings
+from django.utils import timezone
+from pytest_django import DjangoDbBlocker
+
+from apps.sync.constants import SNAPSHOT_CACHE_ALIAS
+
+from .catalog import CatalogSpec, generate_catalog
+
+
+@pytest.fixture(scope="session")
+def bench_dirs(tmp_path_factory: pytest.TempPathFactory) -> Generator[None]:
+    """Keep generated images and snapshot files out of the working tree.
+
+    The snapshot cache stays file-based, as in production.
+    """
+    root = tmp_path_factory.mktemp("bench")
+    caches_setting = {
+        **settings.CACHES,
+        SNAPSHOT_CACHE_ALIAS: {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": root / "sync",
+        },
+    }
+    with override_settings(MEDIA_ROOT=root / "media", CACHES=caches_setting):
+        yield
+
+
+@pytest.fixture(scope="session")
+def catalog(
+    bench_dirs: None,
+    django_db_setup: None,
+    django_db_blocker: DjangoDbBlocker,
+) -> dict[str, Any]:
+    """Generate the benchmark catalog once per session."""
+    with django_db_blocker.unblock():
+        return generate_catalog(CatalogSpec())
+
+
+@pytest.fixture(scope="session")
+def bench_results(catalog: dict[str, Any]) -> Generator[dict[str, Any]]:
+    """Collect scenario results and write them as JSON at the end of the session."""
+    results: dict[str, Any] = {}
+    yield results
+    report = {
+        "meta": {
+            "git_sha": _git_sha(),
+            "created_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "database": connection.vendor,
+            "catalog": catalog,
+        },
+        "results": dict(sorted(results.items())),
+    }
+    output = Path(os.environ.get("BENCH_OUTPUT", "bench_output.json"))
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+def _git_sha() -> str:
+    """Return the checked-out commit, or GIT_SHA when git is unavailable."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return str(settings.GIT_SHA)
+    return result.stdout.strip()
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2026 Andrey Kotlyar <guitar0.app@gmail.com>
+#
+# SPDX-License-Identifier: AGPL-3.0-or-later
+
+"""Sync endpoint benchmarks: queries, wall time, peak memory and payload bytes."""
+
+import os
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from django.core.cache import cache, caches
+from django.db import connection
+from django.http import HttpResponse
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.sync.constants import SNAPSHOT_CACHE_ALIAS
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+REPEAT = int(os.environ.get("BENCH_REPEAT", "5"))
+
+
+def _measure(
+    request: Callable[[], HttpResponse], prepare: Callable[[], None] | None = None
+) -> dict[str, Any]:
+    """Run `request` REPEAT times plus one run each for queries and memory.
+
+    `prepare` runs before every call (e.g. to drop the snapshot). The
+    default cache is cleared too, so the anonymous throttle never kicks in.
+    """
+
+    def call() -> HttpResponse:
+        cache.clear()
+        if prepare is not None:
+            prepare()
+        return request()
+
+    timings: list[float] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        response = call()
+        timings.append(time.perf_counter() - start)
+
+    with CaptureQueriesContext(connection) as queries:
+        call()
+    query_count = len(queries)  # read now: the next request resets the log
+
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert response.status_code == 200
+    return {
+        "queries": query_count,
+        "wall_time_ms": {
+            "min": round(min(timings) * 1000, 3),
+            "median": round(statistics.median(timings) * 1000, 3),
+        },
+        "peak_memory_kib": round(peak / 1024, 1),
+        "payload_bytes": len(response.content),
+    }
+
+
+def _drop_snapshot() -> None:
+    caches[SNAPSHOT_CACHE_ALIAS].clear()
+
+
+# =============================================================================
+# Full sync
+# =============================================================================
+
+
+@pytest.mark.parametrize("format_version", ["1", "3"])
+def test_bench_full_sync_cold(
+    bench_results: dict[str, Any], format_version: str
+) -> None:
+    client = APIClient()
+
+    bench_results[f"full_sync_cold_format_{format_version}"] = _measure(
+        lambda: client.get(reverse("sync-lessons"), {"format_version": format_version}),
+        prepare=_drop_snapshot,
+    )
+
+
+@pytest.mark.parametrize("encoding", ["identity", "gzip", "br"])
+def test_bench_full_sync_warm(bench_results: dict[str, Any], encoding: str) -> None:
+    client = APIClient()
+    client.get(reverse("sync-lessons"))  # build the snapshot outside the timings
+
+    bench_results[f"full_sync_warm_{encoding}"] = _measure(
+        lambda: client.get(reverse("sync-lessons"), HTTP_ACCEPT_ENCODING=encoding)
+    )
+
+
+# =============================================================================
+# Delta sync
+# =============================================================================
+
+
+@pytest.mark.parametrize("format_version", ["1", "2", "3"])
+def test_bench_delta_sync(
+    bench_results: dict[str, Any], catalog: dict[str, Any], format_version: str
+) -> None:
+    client = APIClient()
+    params = {"since": catalog["delta_since"], "format_version": format_version}
+
+    bench_results[f"delta_sync_format_{format_version}"] = _measure(
+        lambda: client.get(reverse("sync-lessons"), params)
+    )
+
+
+# =============================================================================
+# Content version
+# =============================================================================
+
+
+def test_bench_content_version(bench_results: dict[str, Any]) -> None:
+    client = APIClient()
+
+    bench_results["content_version"] = _measure(
+        lambda: client.get(reverse("sync-version"))
+    )